@@ -0,0 +1,23 @@
+from time import perf_counter
+from typing import Optional
+
+import kp.context as context
+from kp.ast import Program
+from kp.evaluator import evaluate
+from kp.lexer import Lexer
+from kp.object import Environment
+from kp.parser import Parser
+
+#Lo que comparten los benchmarks: analizar fuera de la medicion y medir solo la evaluacion
+
+def parse(source: str) -> Program:
+    return Parser(Lexer(source)).parse_program()
+
+#Segundos que tarda en evaluarse source, incluyendo escribir lo que imprime. Con env las variables quedan
+#entre llamadas, asi los datos se preparan una vez y se miden varios casos sobre ellos
+def run(source: str, env: Optional[Environment] = None) -> float:
+    program = parse(source)
+    start = perf_counter()
+    evaluate(program, env if env is not None else Environment())
+    context.flush()
+    return perf_counter() - start
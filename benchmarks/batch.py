@@ -0,0 +1,53 @@
+#Tiempo total del modo lote con 1, 2, 4... procesos sobre muchos archivos generados, comparado con
+#iniciar python main.py una vez por archivo. Con N nucleos el tiempo deberia bajar casi N veces
+#Uso: python -m benchmarks.batch [archivos]
+import os
+import subprocess
+import sys
+from io import StringIO
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from kp.batch import (find_files, run_batch)
+
+FILES = 2000
+
+#Cada archivo hace algo de trabajo para que el tiempo no sea solo el de repartir las tareas
+SOURCE = '''
+metodo fib(n) {{
+    si (n < 2) {{ regresa n; }}
+    regresa fib(n - 1) + fib(n - 2);
+}}
+variable total = 0;
+para i en rango({number} % 100) {{ total = total + i; }}
+imprimir($"archivo {number}: {{total}} {{fib(12)}}");
+'''
+
+#Archivos que se corren con un proceso por archivo, el resultado se extrapola al total
+PROCESS_SAMPLE = 20
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else FILES
+    with TemporaryDirectory() as directory:
+        for number in range(n):
+            with open(os.path.join(directory, f'programa_{number}.kp'), mode='w', encoding='utf-8') as file:
+                file.write(SOURCE.format(number=number))
+
+        sample = find_files(directory)[:PROCESS_SAMPLE]
+        start = perf_counter()
+        for path in sample:
+            subprocess.run([sys.executable, 'main.py', path], stdout=subprocess.DEVNULL, check=True)
+        per_file = (perf_counter() - start) / len(sample)
+        print(f'un proceso por archivo {per_file * n:10.2f} s (estimado)')
+
+        cores = os.cpu_count() or 1
+        workers = 1
+        while True:
+            start = perf_counter()
+            run_batch(directory, StringIO(), workers=workers)
+            elapsed = perf_counter() - start
+            print(f'lote, {workers:2} procesos      {elapsed:10.2f} s   {n / elapsed:10,.0f} archivos por segundo')
+            if workers >= cores:
+                break
+            workers = min(workers * 2, cores)
@@ -0,0 +1,43 @@
+#Mide imprimir y leer factorial(20000), 77338 digitos, con la conversion por mitades de kp.bignum
+#y con str() e int() de Python, que son cuadraticos y necesitan quitar su limite de 4300 digitos
+#Uso: python -m benchmarks.bignum [n]
+import sys
+from time import perf_counter
+from typing import (Any,Callable,Tuple)
+
+from benchmarks import run
+
+import kp.context as context
+from kp.bignum import (from_decimal, to_decimal)
+from kp.object import (Environment, Integer)
+
+N = 20_000
+
+SETUP = 'variable f = 1; para i en rango(1, {n} + 1) {{ f = f * i; }}'
+
+def _time(function: Callable[[Any], Any], value: Any) -> Tuple[float, Any]:
+    start = perf_counter()
+    result = function(value)
+    return perf_counter() - start, result
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else N
+    context.configure(max_digits=0)
+    env = Environment()
+    run(SETUP.format(n=n), env)
+    value = env['f'].value
+    #Desde Kinp, lo que hace imprimir(f)
+    kinp, text = _time(Integer.inspect, env['f'])
+    print(f'factorial({n}) tiene {len(text)} digitos')
+
+    sys.set_int_max_str_digits(0)
+    for name, function, argument in [
+        ('imprimir, kp.bignum', lambda value: to_decimal(value, 0), value),
+        ('imprimir, str()', str, value),
+        ('leer, kp.bignum', lambda text: from_decimal(text, 0), text),
+        ('leer, int()', int, text),
+    ]:
+        elapsed, _ = _time(function, argument)
+        print(f'{name:22} {elapsed * 1000:10.2f} ms')
+    print(f'{"inspect desde Kinp":22} {kinp * 1000:10.2f} ms')
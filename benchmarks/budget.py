@@ -0,0 +1,47 @@
+#Costo de revisar el presupuesto: los mismos programas sin presupuesto, con limites de pasos, profundidad
+#y tiempo que no se alcanzan, y con un Budget vacio que solo permite cancelar desde otro hilo
+#Uso: python -m benchmarks.budget [repeticiones]
+import sys
+from time import perf_counter
+
+from kp import (Budget, Interpreter)
+
+REPEAT = 5
+
+PROGRAMS = {
+    'recursion fib(20)': '''
+        metodo fib(n) {
+            si (n < 2) { regresa n; }
+            regresa fib(n - 1) + fib(n - 2);
+        }
+        fib(20);
+    ''',
+    'ciclo de 200k vueltas': '''
+        variable total = 0;
+        para i en rango(200000) { total = total + i; }
+        total;
+    ''',
+}
+
+LIMITS = {'max_steps': 10 ** 9, 'max_depth': 100, 'timeout': 3600.0}
+
+def _best(interpreter: Interpreter, source: str, repeat: int, cancellable: bool = False) -> float:
+    program = interpreter.compile(source)
+    best = float('inf')
+    for _ in range(repeat):
+        start = perf_counter()
+        result = interpreter.run(program, budget=Budget() if cancellable else None)
+        best = min(best, perf_counter() - start)
+        assert result.ok, result.error
+    return best
+
+
+if __name__ == '__main__':
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else REPEAT
+    sys.setrecursionlimit(20000)
+    for name, source in PROGRAMS.items():
+        free = _best(Interpreter(), source, repeat)
+        limited = _best(Interpreter(**LIMITS), source, repeat)
+        cancellable = _best(Interpreter(), source, repeat, cancellable=True)
+        print(f'{name:22} sin presupuesto {free * 1000:8.1f} ms   con limites {limited * 1000:8.1f} ms '
+              f'({limited / free - 1:+.1%})   cancelable {cancellable * 1000:8.1f} ms ({cancellable / free - 1:+.1%})')
@@ -0,0 +1,33 @@
+#Mide las busquedas por segundo en un diccionario grande, desde Kinp y desde el builtin contiene
+#Uso: python -m benchmarks.dictionaries [entradas]
+import sys
+
+from benchmarks import run
+
+from kp.object import Environment
+
+ENTRIES = 1_000_000
+
+SETUP = '''
+variable d = {{}};
+para i en rango({n}) {{ d[i] = i * 2; }}
+variable textos = {{}};
+para i en rango({n}) {{ textos["k" + i] = i; }}
+'''
+
+CASES = [
+    ('d[entero]', 'variable t = 0; para i en rango({n}) {{ t = t + d[i]; }} t;'),
+    ('d[texto]', 'variable t = 0; para i en rango({n}) {{ t = t + textos["k" + i]; }} t;'),
+    ('contiene', 'variable t = 0; para i en rango({n}) {{ si (contiene(d, i)) {{ t = t + 1; }} }} t;'),
+    #Sin busquedas, para descontar el costo del ciclo
+    ('ciclo vacio', 'variable t = 0; para i en rango({n}) {{ t = t + i; }} t;'),
+]
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else ENTRIES
+    env = Environment()
+    print(f'construir dos diccionarios de {n} entradas: {run(SETUP.format(n=n), env):8.3f} s')
+    for name, source in CASES:
+        elapsed = run(source.format(n=n), env)
+        print(f'{name:12} {elapsed:8.3f} s   {n / elapsed:12,.0f} por segundo')
@@ -0,0 +1,41 @@
+#Compara un script con muchas llamadas a funciones pequeñas, con y sin expansion de funciones
+#Uso: python -m benchmarks.inlining
+import sys
+from timeit import repeat
+
+from benchmarks import parse
+
+from kp.evaluator import evaluate
+from kp.object import Environment
+from kp.optimizer import (DEFAULT_INLINE_SIZE, Optimizer)
+
+SOURCE = '''
+metodo cuadrado(x){ regresa x * x; }
+metodo suma(x, y){ variable s = x + y; regresa s; }
+metodo cifras(i){
+    si (i == 1){ regresa "una cifra"; }
+    si_no { regresa "varias cifras"; }
+}
+metodo repetir(n, total){
+    si (n == 0){ regresa total; }
+    cifras(n);
+    regresa repetir(n - 1, suma(total, cuadrado(n) + cuadrado(2)));
+}
+repetir(400, 0);
+'''
+
+def _run(inline_size: int) -> float:
+    program = parse(SOURCE)
+    if inline_size >= 0:
+        program = Optimizer(inline_size).optimize(program)
+    return min(repeat(lambda: evaluate(program, Environment()), number=20, repeat=5)) / 20
+
+
+if __name__ == '__main__':
+    sys.setrecursionlimit(20000)
+    base = _run(-1)
+    folded = _run(0)
+    inlined = _run(DEFAULT_INLINE_SIZE)
+    print(f'sin optimizar:        {base * 1000:8.3f} ms')
+    print(f'-O sin expansion:     {folded * 1000:8.3f} ms')
+    print(f'-O con expansion:     {inlined * 1000:8.3f} ms  ({base / inlined:.2f}x)')
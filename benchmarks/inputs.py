@@ -0,0 +1,40 @@
+#Sesiones por minuto de examples/calculadora_basica.kp con respuestas preparadas. El programa se analiza
+#una vez y cada sesion lo evalua con sus propias respuestas y la salida descartada
+#Uso: python -m benchmarks.inputs [sesiones]
+import sys
+from itertools import cycle
+from time import perf_counter
+
+from benchmarks import parse
+
+import kp.context as context
+from kp.evaluator import evaluate
+from kp.inputs import (
+    ConsoleSource,
+    LineSource,
+)
+from kp.object import Environment
+from kp.output import (
+    NullSink,
+    StreamSink,
+)
+
+SESSIONS = 20_000
+
+OPERATIONS = ['+', '-', '*', '/', '%']
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else SESSIONS
+    with open('examples/calculadora_basica.kp', mode='r', encoding='utf-8') as file:
+        program = parse(file.read())
+
+    context.configure(sink=NullSink())
+    operations = cycle(OPERATIONS)
+    start = perf_counter()
+    for session in range(n):
+        context.configure(source=LineSource([str(session), next(operations), '7']))
+        evaluate(program, Environment())
+    elapsed = perf_counter() - start
+    context.configure(sink=StreamSink(), source=ConsoleSource())
+    print(f'{n} sesiones en {elapsed:.3f} s   {n / elapsed * 60:12,.0f} sesiones por minuto')
@@ -0,0 +1,65 @@
+#Ejecuciones por segundo de un mismo programa con distintas variables: analizandolo cada vez, como hace
+#main.py, o compilandolo una vez con Interpreter.compile. Tambien mide la conversion de valores de Python
+#Uso: python -m benchmarks.interpreter [ejecuciones]
+import sys
+from time import perf_counter
+
+import kp.context as context
+from kp import Interpreter
+from kp.evaluator import evaluate
+from kp.interpreter import to_kinp
+from kp.lexer import Lexer
+from kp.object import Environment
+from kp.output import (
+    CaptureSink,
+    StreamSink,
+)
+from kp.parser import Parser
+
+RUNS = 20_000
+
+SOURCE = '''
+metodo precio_final(precio, descuento) {
+    si (descuento > 0) {
+        regresa precio - precio * descuento / 100;
+    }
+    regresa precio;
+}
+variable total = 0;
+para producto en carrito {
+    total = total + precio_final(producto["precio"], producto["descuento"]);
+}
+imprimir($"Total a pagar: {total}");
+total;
+'''
+
+CART = [{'precio': 1000 + i, 'descuento': i % 3 * 5} for i in range(5)]
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else RUNS
+    interpreter = Interpreter()
+
+    start = perf_counter()
+    for _ in range(n):
+        context.configure(sink=CaptureSink())
+        env = Environment()
+        env['carrito'] = to_kinp(CART)
+        evaluate(Parser(Lexer(SOURCE)).parse_program(), env)
+    parsing = perf_counter() - start
+    context.configure(sink=StreamSink())
+
+    program = interpreter.compile(SOURCE)
+    start = perf_counter()
+    for _ in range(n):
+        interpreter.run(program, bindings={'carrito': CART})
+    compiled = perf_counter() - start
+
+    start = perf_counter()
+    for _ in range(n):
+        to_kinp(CART)
+    conversion = perf_counter() - start
+
+    print(f'analizando cada vez {n / parsing:12,.0f} ejecuciones por segundo')
+    print(f'compilado una vez   {n / compiled:12,.0f} ejecuciones por segundo')
+    print(f'convertir carrito   {conversion / n * 1e6:12.2f} us por ejecucion')
@@ -0,0 +1,48 @@
+#Compara los builtins de listas con la misma operacion escrita con recursion y con un ciclo para
+#Uso: python -m benchmarks.lists [elementos]
+import sys
+
+from benchmarks import run
+
+from kp.object import Environment
+
+ELEMENTS = 1_000_000
+
+#La recursion se parte en tramos para no pasar el limite de recursion de Python
+RECURSIVE_CHUNK = 1_000
+
+SETUP = '''
+variable l = [];
+para i en rango({n}) {{ anexar(l, i); }}
+metodo sumar(l, i, fin, total){{
+    si (i == fin) {{ regresa total; }}
+    regresa sumar(l, i + 1, fin, total + l[i]);
+}}
+metodo duplicar(l, i, fin, resultado){{
+    si (i == fin) {{ regresa resultado; }}
+    anexar(resultado, l[i] * 2);
+    regresa duplicar(l, i + 1, fin, resultado);
+}}
+'''
+
+CASES = [
+    ('suma', 'suma(l);',
+     'variable t = 0; para tramo en rango(0, {n}, {chunk}) {{ t = sumar(l, tramo, tramo + {chunk}, t); }} t;',
+     'variable t = 0; para x en l {{ t = t + x; }} t;'),
+    ('mapa', 'longitud(mapa(l, procedimiento(x){{ x * 2 }}));',
+     'variable r = []; para tramo en rango(0, {n}, {chunk}) {{ duplicar(l, tramo, tramo + {chunk}, r); }} longitud(r);',
+     'variable r = []; para x en l {{ anexar(r, x * 2); }} longitud(r);'),
+]
+
+
+if __name__ == '__main__':
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), RECURSIVE_CHUNK * 20))
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else ELEMENTS
+    env = Environment()
+    print(f'construir {n} elementos con anexar: {run(SETUP.format(n=n), env):8.3f} s')
+    for name, builtin, recursive, loop in CASES:
+        native = run(builtin.format(n=n), env)
+        recursion = run(recursive.format(n=n, chunk=RECURSIVE_CHUNK), env)
+        looped = run(loop.format(n=n), env)
+        print(f'{name:5} builtin {native:8.3f} s   recursion {recursion:8.3f} s ({recursion / native:5.1f}x)'
+              f'   para {looped:8.3f} s ({looped / native:5.1f}x)')
@@ -0,0 +1,52 @@
+#Compara un ciclo para/mientras con la misma cuenta hecha por recursion
+#Uso: python -m benchmarks.loops
+import sys
+
+from benchmarks import run
+
+from kp.object import Environment
+
+ITERATIONS = 1_000_000
+
+#La recursion se parte en tramos para no pasar el limite de recursion de Python
+RECURSIVE_CHUNK = 1_000
+
+RECURSIVE = '''
+metodo sumar(i, fin, total){{
+    si (i == fin) {{ regresa total; }}
+    regresa sumar(i + 1, fin, total + i);
+}}
+variable total = 0;
+para tramo en rango(0, {n}, {chunk}) {{
+    total = sumar(tramo, tramo + {chunk}, total);
+}}
+total;
+'''
+
+FOR = '''
+variable total = 0;
+para i en rango({n}) {{ total = total + i; }}
+total;
+'''
+
+WHILE = '''
+variable total = 0;
+variable i = 0;
+mientras (i < {n}) {{ total = total + i; i = i + 1; }}
+total;
+'''
+
+def _run(template: str, n: int) -> float:
+    env = Environment()
+    elapsed = run(template.format(n=n, chunk=RECURSIVE_CHUNK), env)
+    assert env['total'].inspect() == str(n * (n - 1) // 2), env['total']
+    return elapsed
+
+
+if __name__ == '__main__':
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), RECURSIVE_CHUNK * 20))
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else ITERATIONS
+    recursive = _run(RECURSIVE, n)
+    for name, template in (('para', FOR), ('mientras', WHILE)):
+        elapsed = _run(template, n)
+        print(f'{name:9} {n} vueltas: {elapsed:8.3f} s   recursion: {recursive:8.3f} s   ({recursive / elapsed:.1f}x)')
@@ -0,0 +1,18 @@
+#Compara fibonacci recursivo con y sin memorizacion
+#Uso: python -m benchmarks.memoization
+from benchmarks import run
+
+SOURCE = '''
+metodo fib(n){
+    si (n < 2) { regresa n; }
+    regresa fib(n - 1) + fib(n - 2);
+}
+'''
+
+
+if __name__ == '__main__':
+    for n in (15, 20, 25):
+        plain = run(SOURCE + f'fib({n});')
+        memoized = run(SOURCE + f'memorizar(fib); fib({n});')
+        print(f'fib({n}): sin memo {plain * 1000:10.2f} ms   con memo {memoized * 1000:8.2f} ms')
+    print(f'fib(30) con memo: {run(SOURCE + "memorizar(fib); fib(30);") * 1000:.2f} ms')
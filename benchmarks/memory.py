@@ -0,0 +1,54 @@
+#Costo de contar la memoria de una ejecucion: los mismos programas sin medidor y con un MemoryMeter,
+#y la memoria maxima que reporta el medidor para cada uno
+#Uso: python -m benchmarks.memory [repeticiones]
+import sys
+from time import perf_counter
+from typing import Optional
+
+from kp import Interpreter
+from kp.memory import MemoryMeter
+
+REPEAT = 5
+
+PROGRAMS = {
+    'recursion fib(20)': '''
+        metodo fib(n) {
+            si (n < 2) { regresa n; }
+            regresa fib(n - 1) + fib(n - 2);
+        }
+        fib(20);
+    ''',
+    'texto de 100k lineas': '''
+        variable texto = "";
+        para i en rango(100000) { texto = texto + $"linea {i}\\n"; }
+        longitud(texto);
+    ''',
+    'enteros grandes': '''
+        variable producto = 1;
+        para i en rango(1, 3000) { producto = producto * i; }
+        producto % 1000;
+    ''',
+}
+
+def _best(source: str, repeat: int, counted: bool) -> float:
+    interpreter = Interpreter()
+    program = interpreter.compile(source)
+    best = float('inf')
+    for _ in range(repeat):
+        meter: Optional[MemoryMeter] = MemoryMeter() if counted else None
+        start = perf_counter()
+        result = interpreter.run(program, memory=meter)
+        best = min(best, perf_counter() - start)
+        assert result.ok, result.error
+    return best
+
+
+if __name__ == '__main__':
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else REPEAT
+    for name, source in PROGRAMS.items():
+        free = _best(source, repeat, counted=False)
+        counted = _best(source, repeat, counted=True)
+        meter = MemoryMeter()
+        Interpreter().execute(source, memory=meter)
+        print(f'{name:22} sin medidor {free * 1000:8.1f} ms   con medidor {counted * 1000:8.1f} ms '
+              f'({counted / free - 1:+.1%})   maximo {meter.peak / 2 ** 20:6.2f} MB')
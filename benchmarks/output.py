@@ -0,0 +1,38 @@
+#Lineas por segundo de imprimir con cada destino de salida. Las lineas van a un archivo temporal,
+#como cuando la salida se redirige a un archivo o a otro programa
+#Uso: python -m benchmarks.output [lineas]
+import sys
+from tempfile import TemporaryFile
+
+from benchmarks import run
+
+import kp.context as context
+from kp.output import (
+    CaptureSink,
+    NullSink,
+    OutputSink,
+    StreamSink,
+)
+
+LINES = 200_000
+
+SOURCE = 'para i en rango({n}) {{ imprimir($"linea numero {{i}} del reporte"); }}'
+
+def _run(source: str, sink: OutputSink) -> float:
+    context.configure(sink=sink)
+    return run(source)
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else LINES
+    source = SOURCE.format(n=n)
+    with TemporaryFile('w+') as file:
+        for name, sink in [
+            ('linea', StreamSink(file, buffer_size=0)),
+            ('bloque', StreamSink(file)),
+            ('memoria', CaptureSink()),
+            ('nula', NullSink()),
+        ]:
+            elapsed = _run(source, sink)
+            print(f'{name:8} {elapsed:8.3f} s   {n / elapsed:12,.0f} lineas por segundo')
+    context.configure(sink=StreamSink())
@@ -0,0 +1,85 @@
+#Compara construir y actualizar colecciones inmutables, con y sin transitorios, contra copiar listas y diccionarios,
+#y la memoria que ocupan muchas versiones vivas a la vez
+#Uso: python -m benchmarks.persistent [elementos] [versiones]
+import sys
+import tracemalloc
+from typing import (Any,Callable,List)
+
+from benchmarks import run
+
+from kp.object import Environment
+from kp.persistent import (EMPTY_MAP, EMPTY_VECTOR)
+
+ELEMENTS = 100_000
+VERSIONS = 2_000
+
+CASES = [
+    ('agregar', 'variable v = inmutable([]); para i en rango({n}) {{ v = agregar(v, i); }}'),
+    ('agregar transitorio', '''
+        variable t = transitorio(inmutable([]));
+        para i en rango({n}) {{ agregar(t, i); }}
+        variable v = persistente(t);
+    '''),
+    ('anexar (mutable)', 'variable l = []; para i en rango({n}) {{ anexar(l, i); }}'),
+    ('asociar lista', 'para i en rango({n}) {{ v = asociar(v, i, -i); }}'),
+    ('asociar dicc.', 'variable d = inmutable({{}}); para i en rango({n}) {{ d = asociar(d, i, i); }}'),
+    ('asociar transitorio', '''
+        variable t = transitorio(inmutable({{}}));
+        para i en rango({n}) {{ asociar(t, i, i); }}
+        variable e = persistente(t);
+    '''),
+    ('d[i] = i (mutable)', 'variable m = {{}}; para i en rango({n}) {{ m[i] = i; }}'),
+]
+
+#Memoria de guardar todas las versiones intermedias de una coleccion
+def _memory(build: Callable[[int], List[Any]], versions: int) -> float:
+    tracemalloc.start()
+    kept = build(versions)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return size / 2 ** 20
+
+def _vector_versions(versions: int) -> List[Any]:
+    kept, vector = [], EMPTY_VECTOR
+    for i in range(versions):
+        vector = vector.append(i)
+        kept.append(vector)
+    return kept
+
+def _list_versions(versions: int) -> List[Any]:
+    kept: List[Any] = [[]]
+    for i in range(versions):
+        kept.append(kept[-1] + [i])
+    return kept
+
+def _map_versions(versions: int) -> List[Any]:
+    kept, pairs = [], EMPTY_MAP
+    for i in range(versions):
+        pairs = pairs.set(i, i)
+        kept.append(pairs)
+    return kept
+
+def _dict_versions(versions: int) -> List[Any]:
+    kept: List[Any] = [{}]
+    for i in range(versions):
+        kept.append({**kept[-1], i: i})
+    return kept
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else ELEMENTS
+    versions = int(sys.argv[2]) if len(sys.argv) > 2 else VERSIONS
+    env = Environment()
+    for name, source in CASES:
+        elapsed = run(source.format(n=n), env)
+        print(f'{name:20} {elapsed:8.3f} s   {n / elapsed:12,.0f} operaciones por segundo')
+
+    print(f'\nmemoria de {versions} versiones vivas:')
+    for name, build in [
+        ('vector persistente', _vector_versions),
+        ('copiar listas', _list_versions),
+        ('mapa persistente', _map_versions),
+        ('copiar diccionarios', _dict_versions),
+    ]:
+        print(f'{name:20} {_memory(build, versions):10.2f} MiB')
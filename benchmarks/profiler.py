@@ -0,0 +1,48 @@
+#Costo del perfilador: fib(20) y un mapa de 100k elementos sin perfilar, perfilando, y otra vez sin perfilar
+#despues de una ejecucion perfilada, para ver que el evaluador vuelve a su version sin instrumentar
+#Uso: python -m benchmarks.profiler [repeticiones]
+import sys
+from time import perf_counter
+from typing import Optional
+
+from kp import Interpreter
+from kp.profiler import Profiler
+
+REPEAT = 5
+
+PROGRAMS = {
+    'recursion fib(20)': '''
+        metodo fib(n) {
+            si (n < 2) { regresa n; }
+            regresa fib(n - 1) + fib(n - 2);
+        }
+        fib(20);
+    ''',
+    'mapa de 100k elementos': '''
+        variable numeros = [];
+        para i en rango(100000) { anexar(numeros, i); }
+        suma(mapa(numeros, procedimiento(x) { x * 2; }));
+    ''',
+}
+
+def _best(interpreter: Interpreter, source: str, repeat: int, profiled: bool) -> float:
+    program = interpreter.compile(source)
+    best = float('inf')
+    for _ in range(repeat):
+        profiler: Optional[Profiler] = Profiler() if profiled else None
+        start = perf_counter()
+        result = interpreter.run(program, profiler=profiler)
+        best = min(best, perf_counter() - start)
+        assert result.ok, result.error
+    return best
+
+
+if __name__ == '__main__':
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else REPEAT
+    interpreter = Interpreter()
+    for name, source in PROGRAMS.items():
+        before = _best(interpreter, source, repeat, profiled=False)
+        profiled = _best(interpreter, source, repeat, profiled=True)
+        after = _best(interpreter, source, repeat, profiled=False)
+        print(f'{name:24} sin perfil {before * 1000:8.1f} ms   perfilando {profiled * 1000:8.1f} ms '
+              f'({profiled / before - 1:+.1%})   sin perfil despues {after * 1000:8.1f} ms ({after / before - 1:+.1%})')
@@ -0,0 +1,54 @@
+#Costo del perfilador por muestreo: fib(20) y un mapa de 100k elementos sin muestrear y muestreando con
+#una señal y con un hilo, y cuantas muestras por segundo se lograron de las pedidas
+#Uso: python -m benchmarks.sampler [repeticiones] [frecuencia]
+import sys
+from time import perf_counter
+from typing import (Optional, Tuple)
+
+from kp import Interpreter
+from kp.stack import (DEFAULT_RATE, SIGNAL, THREAD, Sampler)
+
+REPEAT = 5
+
+PROGRAMS = {
+    'recursion fib(20)': '''
+        metodo fib(n) {
+            si (n < 2) { regresa n; }
+            regresa fib(n - 1) + fib(n - 2);
+        }
+        fib(20);
+    ''',
+    'mapa de 100k elementos': '''
+        variable numeros = [];
+        para i en rango(100000) { anexar(numeros, i); }
+        suma(mapa(numeros, procedimiento(x) { x * 2; }));
+    ''',
+}
+
+#El mejor tiempo y las muestras por segundo de esa ejecucion
+def _best(interpreter: Interpreter, source: str, repeat: int, mode: Optional[str], rate: int) -> Tuple[float, float]:
+    program = interpreter.compile(source)
+    best, achieved = float('inf'), 0.0
+    for _ in range(repeat):
+        sampler = Sampler(rate, mode) if mode is not None else None
+        start = perf_counter()
+        result = interpreter.run(program, sampler=sampler)
+        elapsed = perf_counter() - start
+        assert result.ok, result.error
+        if elapsed < best:
+            best = elapsed
+            achieved = sum(sampler.samples.values()) / elapsed if sampler is not None else 0.0
+    return best, achieved
+
+
+if __name__ == '__main__':
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else REPEAT
+    rate = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_RATE
+    interpreter = Interpreter()
+    for name, source in PROGRAMS.items():
+        free, _ = _best(interpreter, source, repeat, None, rate)
+        line = f'{name:24} sin muestrear {free * 1000:8.1f} ms'
+        for mode in (SIGNAL, THREAD):
+            sampled, achieved = _best(interpreter, source, repeat, mode, rate)
+            line += f'   {mode} {sampled * 1000:8.1f} ms ({sampled / free - 1:+.1%}, {achieved:5.0f}/s)'
+        print(line)
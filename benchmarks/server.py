@@ -0,0 +1,79 @@
+#Prueba de carga del servidor: inicia python main.py servidor en un socket Unix y le manda peticiones
+#desde varios clientes a la vez. Reporta la latencia p50 y p99 y las peticiones por segundo, y la compara
+#con iniciar un proceso de Python por peticion
+#Uso: python -m benchmarks.server [peticiones] [clientes]
+import os
+import subprocess
+import sys
+from statistics import quantiles
+from tempfile import TemporaryDirectory
+from threading import Thread
+from time import (perf_counter, sleep)
+from typing import List
+
+from kp.server import Client
+
+REQUESTS = 5000
+CLIENTS = 8
+
+SOURCE = '''
+variable nombre = recibir("nombre: ");
+variable total = 0;
+para i en rango(100) { total = total + i; }
+imprimir($"Hola {nombre}, el total es {total}");
+total;
+'''
+
+#Peticiones que se corren con un proceso de Python cada una
+PROCESS_SAMPLE = 20
+
+def _client(address: str, requests: int, latencies: List[float]) -> None:
+    client = Client(address)
+    _, result = client.run(SOURCE, stdin=['cliente'])
+    program = result['programa']
+    for number in range(requests):
+        start = perf_counter()
+        _, result = client.run(program=program, stdin=[f'usuario{number}'])
+        latencies.append(perf_counter() - start)
+        assert result['estado'] == 'ok', result
+    client.close()
+
+def _report(name: str, latencies: List[float], elapsed: float) -> None:
+    cuts = quantiles(latencies, n=100)
+    print(f'{name:24} p50 {cuts[49] * 1000:8.2f} ms   p99 {cuts[98] * 1000:8.2f} ms   '
+          f'{len(latencies) / elapsed:10,.0f} peticiones por segundo')
+
+
+if __name__ == '__main__':
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else REQUESTS
+    clients = int(sys.argv[2]) if len(sys.argv) > 2 else CLIENTS
+    with TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'programa.kp')
+        with open(path, mode='w', encoding='utf-8') as file:
+            file.write(SOURCE)
+        latencies: List[float] = []
+        start = perf_counter()
+        for _ in range(PROCESS_SAMPLE):
+            begin = perf_counter()
+            subprocess.run([sys.executable, 'main.py', path, '--entrada', '-'], input='cliente\n', text=True,
+                           stdout=subprocess.DEVNULL, check=True)
+            latencies.append(perf_counter() - begin)
+        _report('un proceso por peticion', latencies, perf_counter() - start)
+
+        address = os.path.join(directory, 'kinp.sock')
+        server = subprocess.Popen([sys.executable, 'main.py', 'servidor', '--socket', address,
+                                   '--cola', str(clients * 2)])
+        try:
+            while not os.path.exists(address):
+                sleep(0.05)
+            latencies = []
+            threads = [Thread(target=_client, args=(address, requests // clients, latencies)) for _ in range(clients)]
+            start = perf_counter()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            _report(f'servidor, {clients} clientes', latencies, perf_counter() - start)
+        finally:
+            server.terminate()
+            server.wait()
@@ -0,0 +1,39 @@
+#Mide cada builtin de textos sobre un texto de 10 MB
+#Uso: python -m benchmarks.string_builtins [megabytes]
+import sys
+
+from benchmarks import run
+
+from kp.object import (Environment, String)
+
+MEGABYTES = 10
+
+LINE = '  El numero 1234567 tiene 7 cifras, Ñandú  \n'
+
+CASES = [
+    ('indice', 'texto[longitud(texto) - 1];'),
+    ('parte', 'texto[1000:longitud(texto) - 1000];'),
+    ('longitud', 'longitud(texto);'),
+    ('buscar', 'buscar(texto, "no aparece");'),
+    ('reemplazar', 'reemplazar(texto, "cifras", "digitos");'),
+    ('dividir', 'dividir(texto, "\n");'),
+    ('unir', 'unir(lineas, "\n");'),
+    ('mayusculas', 'mayusculas(texto);'),
+    ('minusculas', 'minusculas(texto);'),
+    ('recortar', 'recortar(texto);'),
+    ('comienza_con', 'comienza_con(texto, texto[0:longitud(texto) - 1]);'),
+    ('termina_con', 'termina_con(texto, texto[1:]);'),
+    ('contiene', 'contiene(texto, "no aparece");'),
+]
+
+
+if __name__ == '__main__':
+    megabytes = float(sys.argv[1]) if len(sys.argv) > 1 else MEGABYTES
+    text = LINE * int(megabytes * 2 ** 20 / len(LINE))
+    env = Environment()
+    env['texto'] = String(text)
+    run('variable lineas = dividir(texto, "\n");', env)
+    print(f'texto de {len(text) / 2 ** 20:.1f} MB con {text.count(chr(10))} lineas')
+    for name, source in CASES:
+        elapsed = run(source, env)
+        print(f'{name:14} {elapsed * 1000:10.2f} ms   {len(text) / 2 ** 20 / elapsed:10,.0f} MB/s')
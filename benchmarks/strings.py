@@ -0,0 +1,58 @@
+#Arma un texto de 10 MB con 1M sumas de 10 letras, con un ciclo para y con recursion, y lo compara con
+#copiar el texto completo en cada suma, como antes de guardar las partes en una lista
+#Uso: python -m benchmarks.strings [sumas] [sumas copiando]
+import sys
+from typing import cast
+
+from benchmarks import run
+
+import kp.object as kp_object
+from kp.object import (Environment, String)
+
+CONCATENATIONS = 1_000_000
+
+#Copiar el texto en cada suma es cuadratico, con un millon de sumas tardaria horas
+COPY_CONCATENATIONS = 50_000
+
+#La recursion se parte en tramos para no pasar el limite de recursion de Python
+RECURSIVE_CHUNK = 1_000
+
+LOOP = '''
+variable s = "";
+para i en rango({n}) {{ s = s + "0123456789"; }}
+longitud(s);
+'''
+
+RECURSIVE = '''
+metodo reporte(s, i, fin){{
+    si (i == fin) {{ regresa s; }}
+    regresa reporte(s + "fila " + (i % 10000), i + 1, fin);
+}}
+variable s = "";
+para tramo en rango(0, {n}, {chunk}) {{ s = reporte(s, tramo, tramo + {chunk}); }}
+longitud(s);
+'''
+
+#Al final se lee el texto una vez, para contar lo que cuesta unir las partes
+READ = 's == "";'
+
+def _build(name: str, source: str, n: int) -> None:
+    env = Environment()
+    elapsed = run(source.format(n=n, chunk=RECURSIVE_CHUNK), env)
+    join = run(READ, env)
+    size = cast(String, env['s']).length()
+    print(f'{name:22} {n:>9} sumas {elapsed:8.3f} s   unir {join:6.3f} s   {size / 2 ** 20:6.1f} MB'
+          f'   {n / elapsed:10,.0f} sumas por segundo')
+
+
+if __name__ == '__main__':
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), RECURSIVE_CHUNK * 20))
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else CONCATENATIONS
+    copies = int(sys.argv[2]) if len(sys.argv) > 2 else COPY_CONCATENATIONS
+    _build('para, partes', LOOP, n)
+    _build('recursion, partes', RECURSIVE, n)
+    threshold = kp_object.ROPE_THRESHOLD
+    kp_object.ROPE_THRESHOLD = sys.maxsize
+    _build('para, copiando', LOOP, copies)
+    _build('recursion, copiando', RECURSIVE, copies)
+    kp_object.ROPE_THRESHOLD = threshold
@@ -0,0 +1,27 @@
+#Compara el texto de examples/cifras_de_numero.kp armado con una cadena de + contra el mismo texto con llaves
+#Uso: python -m benchmarks.templates [repeticiones]
+import sys
+
+from benchmarks import run
+
+from kp.object import Environment
+
+REPETITIONS = 200_000
+
+SETUP = 'variable numero = "1234567";'
+
+CASES = [
+    ('cadena de +', 'para i en rango({n}) {{ "El numero " + numero + " tiene " + i + " cifras"; }}'),
+    ('llaves', 'para i en rango({n}) {{ $"El numero {{numero}} tiene {{i}} cifras"; }}'),
+]
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else REPETITIONS
+    env = Environment()
+    run(SETUP, env)
+    baseline = None
+    for name, source in CASES:
+        elapsed = run(source.format(n=n), env)
+        baseline = baseline or elapsed
+        print(f'{name:12} {elapsed:8.3f} s   {n / elapsed:12,.0f} textos por segundo   {baseline / elapsed:5.2f}x')
@@ -0,0 +1,54 @@
+#Costo de los ganchos de kp.trace: fib(20) y un mapa de 100k elementos sin Tracer, con un Tracer que no hace
+#nada, y otra vez sin Tracer despues, para ver que el evaluador vuelve a sus versiones sin instrumentar
+#Uso: python -m benchmarks.trace [repeticiones]
+import sys
+from time import perf_counter
+from typing import Optional
+
+import kp.evaluator as evaluator
+import kp.profiler as profiler
+import kp.trace as trace
+from kp import Interpreter
+from kp.trace import Tracer
+
+REPEAT = 5
+
+PROGRAMS = {
+    'recursion fib(20)': '''
+        metodo fib(n) {
+            si (n < 2) { regresa n; }
+            regresa fib(n - 1) + fib(n - 2);
+        }
+        fib(20);
+    ''',
+    'mapa de 100k elementos': '''
+        variable numeros = [];
+        para i en rango(100000) { anexar(numeros, i); }
+        suma(mapa(numeros, procedimiento(x) { x * 2; }));
+    ''',
+}
+
+def _best(interpreter: Interpreter, source: str, repeat: int, traced: bool) -> float:
+    program = interpreter.compile(source)
+    best = float('inf')
+    for _ in range(repeat):
+        tracer: Optional[Tracer] = Tracer() if traced else None
+        start = perf_counter()
+        result = interpreter.run(program, tracer=tracer)
+        best = min(best, perf_counter() - start)
+        assert result.ok, result.error
+    return best
+
+
+if __name__ == '__main__':
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else REPEAT
+    interpreter = Interpreter()
+    for name, source in PROGRAMS.items():
+        before = _best(interpreter, source, repeat, traced=False)
+        traced = _best(interpreter, source, repeat, traced=True)
+        after = _best(interpreter, source, repeat, traced=False)
+        print(f'{name:24} sin ganchos {before * 1000:8.1f} ms   con Tracer {traced * 1000:8.1f} ms '
+              f'({traced / before - 1:+.1%})   sin ganchos despues {after * 1000:8.1f} ms ({after / before - 1:+.1%})')
+    restored = (evaluator.evaluate is trace._evaluate and evaluator._call_function is trace._call_function
+                and evaluator._apply_function is profiler._apply_function)
+    print('evaluador sin instrumentar:', 'si' if restored else 'no')
@@ -0,0 +1,41 @@
+#Compara operaciones sobre una tabla de precios en un vector contra las mismas operaciones elemento por elemento
+#sobre una lista, como convertir de pesos a dolares en examples/convertidorMonedas.kp
+#Uso: python -m benchmarks.vectors [elementos del vector] [elementos de la lista]
+import sys
+
+from benchmarks import run
+
+import kp.vector as vector
+from kp.object import Environment
+
+VECTOR_ELEMENTS = 10_000_000
+
+#El camino escalar crea un objeto de Kinp por elemento, con menos elementos ya se ve la diferencia
+LIST_ELEMENTS = 1_000_000
+
+VECTOR_SETUP = 'variable precios = vector(rango({n})) * 1.5; variable valor_dolar = 3934.5;'
+LIST_SETUP = 'variable precios = []; para i en rango({n}) {{ anexar(precios, i * 1.5); }} variable valor_dolar = 3934.5;'
+
+CASES = [
+    ('convertir', 'precios / valor_dolar;', 'mapa(precios, procedimiento(x){{ x / valor_dolar }});'),
+    ('comparar', 'precios > 1000;', 'mapa(precios, procedimiento(x){{ x > 1000 }});'),
+    ('filtrar', 'precios[precios > 1000];', 'filtro(precios, procedimiento(x){{ x > 1000 }});'),
+    ('suma', 'suma(precios);', 'variable t = 0; para x en precios {{ t = t + x; }} t;'),
+    ('promedio', 'promedio(precios);', 'variable t = 0; para x en precios {{ t = t + x; }} t / longitud(precios);'),
+    ('maximo', 'maximo(precios);', 'variable m = 0; para x en precios {{ si (x > m) {{ m = x; }} }} m;'),
+]
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else VECTOR_ELEMENTS
+    m = int(sys.argv[2]) if len(sys.argv) > 2 else LIST_ELEMENTS
+    print(f'vectores con {"NumPy" if vector.numpy is not None else "el modulo array"}, {n} elementos, lista de {m}')
+    vectors = Environment()
+    lists = Environment()
+    run(VECTOR_SETUP.format(n=n), vectors)
+    run(LIST_SETUP.format(n=m), lists)
+    for name, vector_source, list_source in CASES:
+        vector_rate = n / run(vector_source, vectors)
+        list_rate = m / run(list_source.format(), lists)
+        print(f'{name:10} vector {vector_rate:14,.0f}   lista {list_rate:12,.0f} elementos por segundo'
+              f'   {vector_rate / list_rate:8.1f}x')
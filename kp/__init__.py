@@ -0,0 +1,7 @@
+from kp.budget import Budget
+from kp.interpreter import (
+    CompileError,
+    Interpreter,
+    Program,
+    Result,
+)
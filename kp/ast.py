@@ -1,9 +1,11 @@
 from abc import(ABC,abstractmethod)
-from typing import (List,Optional,Union)
+from typing import (Any,Iterator,List,Optional,Tuple,Union)
 from kp.token import Token
 
 #Clase abstracta que es la base para el resto de clases
+#_fields contiene los nombres de los atributos que guardan nodos hijos, en orden de evaluacion
 class ASTNode(ABC):
+    _fields: Tuple[str, ...] = ()
 
     @abstractmethod
     def token_literal(self) -> str:
@@ -34,6 +36,7 @@ class Expression(ASTNode):
 #Clase Program que hereda de ASTNode, tiene como parametro una lista de Statements, que puede devolver
 #Es la clase que contiene todos los statements parseados de nuestro programa
 class Program(ASTNode):
+    _fields = ('statements',)
 
     def __init__(self, statements: List[Statement])->None:
         self.statements = statements
@@ -61,12 +64,14 @@ class Boolean(Expression):
         return self.token_literal()
 
 #Clase Identifier que hereda de Expression, recibe como parametros un token y su valor
+#cache guarda (version, entorno global, diccionario donde se encontro) de la ultima busqueda
 class Identifier(Expression):
     def __init__(self,
             token: Token,
             value: str) -> None:
         super().__init__(token)
         self.value = value
+        self.cache: Optional[Tuple[int, Any, Any]] = None
 
     def __str__(self)-> str:
         return self.value
@@ -103,6 +108,8 @@ class Null(Expression):
 
 #Clase Prefix que hereda de Expression, recibe como parametros un token, un operador y una expresion(Indentifier o Integer)
 class Prefix(Expression):
+    _fields = ('right',)
+
     def __init__(self,
             token: Token,
             operator: str,
@@ -115,6 +122,8 @@ class Prefix(Expression):
         return f'({self.operator}{str(self.right)})'
 
 class Infix(Expression):
+    _fields = ('left', 'right')
+
     def __init__(self,
                 token: Token,
                 left: Expression,
@@ -129,6 +138,8 @@ class Infix(Expression):
         return f'({str(self.left)} {self.operator} {str(self.right)})'
 
 class Block(Statement):
+    _fields = ('statements',)
+
     def __init__(self,
                 token:Token,
                 statements: List[Statement])->None:
@@ -140,6 +151,8 @@ class Block(Statement):
         return ''.join(out)
 
 class If(Expression):
+    _fields = ('condition', 'consecuence', 'alternative')
+
     def __init__(self,
                 token: Token,
                 condition: Optional[Expression]= None,
@@ -157,6 +170,8 @@ class If(Expression):
         return out
 
 class Function(Expression):
+    _fields = ('name', 'parameters', 'body')
+
     def __init__(self,
                 token: Token,
                 name: Optional[Identifier] = None,
@@ -173,6 +188,8 @@ class Function(Expression):
         return f'{self.token_literal()}({params}) {str(self.body)}'
 
 class Lambda(Expression):
+    _fields = ('parameters', 'body')
+
     def __init__(self,
                 token: Token,
                 parameters: List[Identifier] = [],
@@ -187,6 +204,8 @@ class Lambda(Expression):
         return f'{self.token_literal()}({params}) {str(self.body)}'
 
 class Call(Expression):
+    _fields = ('function', 'arguments')
+
     def __init__(self,
                 token: Token,
                 function: Expression,
@@ -209,12 +228,103 @@ class StringLiteral(Expression):
         self.value = value
 
     def __str__(self) -> str:
-        return super().__str__()
+        return f'"{self.value}"'
+
+#Clase TemplateLiteral que hereda de Expression, un texto con expresiones entre llaves
+#como pude ser, $"El numero {numero} tiene {i} cifras". strings tiene un pedazo de texto mas que expressions,
+#antes de cada expresion y al final
+class TemplateLiteral(Expression):
+    _fields = ('expressions',)
+
+    def __init__(self,
+                token: Token,
+                strings: Optional[List[str]] = None,
+                expressions: Optional[List[Expression]] = None) -> None:
+        super().__init__(token)
+        self.strings = strings if strings is not None else ['']
+        self.expressions = expressions if expressions is not None else []
+
+    def __str__(self) -> str:
+        pieces = [_escape_braces(self.strings[0])]
+        for expression, text in zip(self.expressions, self.strings[1:]):
+            pieces.append(f'{{{str(expression)}}}{_escape_braces(text)}')
+        return '$"{}"'.format(''.join(pieces))
+
+#Las llaves que son parte del texto se escriben dobles, para no confundirlas con una expresion
+def _escape_braces(text: str) -> str:
+    return text.replace('{', '{{').replace('}', '}}')
+
+#Clase ListLiteral que hereda de Expression, guarda los elementos de una lista como pude ser, [1, 2, 3]
+class ListLiteral(Expression):
+    _fields = ('elements',)
+
+    def __init__(self,
+                token: Token,
+                elements: Optional[List[Expression]] = None) -> None:
+        super().__init__(token)
+        self.elements = elements
+
+    def __str__(self) -> str:
+        assert self.elements is not None
+        return '[{}]'.format(', '.join(str(element) for element in self.elements))
+
+#Clase DictionaryLiteral que hereda de Expression, guarda las claves y los valores en el orden en que se escribieron
+#como pude ser, {"uno": 1, "dos": 2}
+class DictionaryLiteral(Expression):
+    _fields = ('keys', 'values')
+
+    def __init__(self,
+                token: Token,
+                keys: Optional[List[Expression]] = None,
+                values: Optional[List[Expression]] = None) -> None:
+        super().__init__(token)
+        self.keys = keys if keys is not None else []
+        self.values = values if values is not None else []
+
+    def __str__(self) -> str:
+        pairs = ', '.join(f'{str(key)}: {str(value)}' for key, value in zip(self.keys, self.values))
+        return f'{{{pairs}}}'
+
+#Clase Index que hereda de Expression, accede a un elemento como pude ser, lista[0]
+class Index(Expression):
+    _fields = ('left', 'index')
+
+    def __init__(self,
+                token: Token,
+                left: Expression,
+                index: Optional[Expression] = None) -> None:
+        super().__init__(token)
+        self.left = left
+        self.index = index
+
+    def __str__(self) -> str:
+        return f'({str(self.left)}[{str(self.index)}])'
+
+#Clase Slice que hereda de Expression, toma una parte como pude ser, lista[1:3], los limites son opcionales
+class Slice(Expression):
+    _fields = ('left', 'start', 'end')
+
+    def __init__(self,
+                token: Token,
+                left: Expression,
+                start: Optional[Expression] = None,
+                end: Optional[Expression] = None) -> None:
+        super().__init__(token)
+        self.left = left
+        self.start = start
+        self.end = end
+
+    def __str__(self) -> str:
+        start = str(self.start) if self.start is not None else ''
+        end = str(self.end) if self.end is not None else ''
+        return f'({str(self.left)}[{start}:{end}])'
 
 #Clase LetStatement que hereda de Statement, 
 #recibe como parametros un token, un identificador como nombre y Expresion como valor
 #Esta guarda una declaracion de una variable, como pude ser, variable edad = 18;
 class LetStatement(Statement):
+    _fields = ('name', 'value')
+
 
     def __init__(self,
                 token: Token,
@@ -234,6 +344,8 @@ class LetStatement(Statement):
 #recibe como parametros un token, Expresion como de retorno
 #Esta guarda un retorno de una variable o de un tipo de dato, como pude ser, regresa verdadero;
 class ReturnStatement(Statement):
+    _fields = ('return_value',)
+
     def __init__(self,
                 token: Token,
                 return_value: Optional[Expression] = None) -> None:
@@ -247,6 +359,8 @@ class ReturnStatement(Statement):
 #recibe como parametros un token, Expresion como una expresion
 #Esta guarda una expresion como pude ser, edad;
 class ExpressionStatement(Statement):
+    _fields = ('expression',)
+
     def __init__(self,
                 token: Token,
                 expression: Optional[Expression] = None) -> None:
@@ -255,3 +369,54 @@ class ExpressionStatement(Statement):
     
     def __str__(self) -> str:
         return str(self.expression)
+
+#Clase WhileStatement que hereda de Statement,
+#repite el bloque mientras la condicion sea verdadera, como pude ser, mientras (x < 10) { x = x + 1; }
+class WhileStatement(Statement):
+    _fields = ('condition', 'body')
+
+    def __init__(self,
+                token: Token,
+                condition: Optional[Expression] = None,
+                body: Optional[Block] = None) -> None:
+        super().__init__(token)
+        self.condition = condition
+        self.body = body
+
+    def __str__(self) -> str:
+        return f'{self.token_literal()} {str(self.condition)} {str(self.body)}'
+
+#Clase ForStatement que hereda de Statement,
+#enlaza la variable a cada elemento del iterable y repite el bloque, como pude ser, para i en rango(10) { imprimir(i); }
+class ForStatement(Statement):
+    _fields = ('variable', 'iterable', 'body')
+
+    def __init__(self,
+                token: Token,
+                variable: Optional[Identifier] = None,
+                iterable: Optional[Expression] = None,
+                body: Optional[Block] = None) -> None:
+        super().__init__(token)
+        self.variable = variable
+        self.iterable = iterable
+        self.body = body
+
+    def __str__(self) -> str:
+        return f'{self.token_literal()} {str(self.variable)} en {str(self.iterable)} {str(self.body)}'
+
+#Devuelve los nodos hijos directos de un nodo, en el orden en que se evaluan
+def iter_child_nodes(node: ASTNode) -> Iterator[ASTNode]:
+    for field in node._fields:
+        child = getattr(node, field)
+        if isinstance(child, list):
+            yield from child
+        elif child is not None:
+            yield child
+
+#Recorre todos los nodos del arbol a partir de node, incluyendolo
+def walk(node: ASTNode) -> Iterator[ASTNode]:
+    pending: List[ASTNode] = [node]
+    while pending:
+        current = pending.pop()
+        yield current
+        pending.extend(reversed(list(iter_child_nodes(current))))
@@ -0,0 +1,220 @@
+import json
+import os
+import signal
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from glob import glob
+from hashlib import sha256
+from threading import (Lock, Thread)
+from time import (perf_counter, sleep)
+from typing import (Any, Dict, Iterator, List, Optional, TextIO, Tuple)
+
+from kp.interpreter import (CompileError, Interpreter, Program)
+from kp.output import OutputSink
+
+#Modo lote: corre muchos archivos .kp repartidos en un ProcessPoolExecutor. Cada proceso importa kp y crea
+#su Interpreter una sola vez, al arrancar, y despues ejecuta archivo tras archivo. Cada archivo tiene su
+#propia salida capturada y sus respuestas para recibir, leidas de un archivo con el mismo nombre y la
+#extension .entrada si existe. El resultado es un reporte con una linea JSON por archivo
+
+DEFAULT_TIMEOUT = 10.0
+
+INPUT_EXTENSION = '.entrada'
+
+#Estados del reporte y su codigo de salida
+OK = 'ok'
+ERROR = 'error'
+SYNTAX = 'sintaxis'
+TIMEOUT = 'tiempo'
+CRASH = 'fallo'
+
+EXIT_CODES: Dict[str, int] = {OK: 0, ERROR: 1, SYNTAX: 2, TIMEOUT: 3, CRASH: 4}
+
+_TIMEOUT_MESSAGE = 'Poseemos un problema, el programa tardo mas de {} segundos'
+
+#Hereda de BaseException para que ningun except Exception del interprete la detenga
+class _Timeout(BaseException):
+    pass
+
+#Programas ya compilados en este proceso, por su identificador
+PROGRAM_CACHE_SIZE = 256
+
+#Un programa que corre mas que esto empieza a mandar su salida por partes, en segundos
+STREAM_INTERVAL = 0.05
+
+_interpreter: Optional[Interpreter] = None
+_timeout: float = DEFAULT_TIMEOUT
+_programs: 'OrderedDict[str, Program]' = OrderedDict()
+#La cola compartida donde se manda la salida por partes, y el destino del programa que corre en este proceso
+_stream: Optional[Any] = None
+_streaming: Optional['_StreamSink'] = None
+_stream_lock = Lock()
+
+#Los archivos .kp de un directorio y sus subdirectorios, o los que coinciden con un patron como tests/*.kp
+def find_files(target: str) -> List[str]:
+    if os.path.isdir(target):
+        return sorted(glob(os.path.join(target, '**', '*.kp'), recursive=True))
+    return sorted(path for path in glob(target, recursive=True) if os.path.isfile(path))
+
+#options son los argumentos del Interpreter de cada proceso (optimize, max_digits, memo...).
+#stream es una cola de un multiprocessing.Manager para mandar la salida mientras el programa corre
+def init_worker(options: Dict[str, Any], timeout: float, stream: Optional[Any] = None) -> None:
+    global _interpreter, _timeout, _stream
+    _interpreter = Interpreter(**options)
+    _timeout = timeout
+    if hasattr(signal, 'setitimer'):
+        signal.signal(signal.SIGALRM, _raise_timeout)
+    _stream = stream
+    if stream is not None:
+        Thread(target=_send_output, daemon=True).start()
+
+def _raise_timeout(signum: int, frame: Any) -> None:
+    raise _Timeout()
+
+def run_file(path: str) -> Dict[str, Any]:
+    record: Dict[str, Any] = {'archivo': path}
+    output = ''
+    try:
+        with open(path, mode='r', encoding='utf-8') as file:
+            source = file.read()
+        result, output = run_source(source, _read_input(path))
+        record.update(result)
+    except OSError as error:
+        record.update(estado=CRASH, codigo=EXIT_CODES[CRASH], error=f'{type(error).__name__}: {error}', duracion=0.0)
+    record['lineas'] = output.count('\n')
+    record['sha256'] = sha256(output.encode('utf-8')).hexdigest()
+    return record
+
+#Ejecuta un programa en el Interpreter de este proceso con el tiempo maximo de init_worker.
+#Con program_id el programa compilado se guarda y la siguiente vez no se vuelve a analizar.
+#Devuelve el estado, su codigo, el error, la duracion y el valor final, y por separado la salida.
+#Con request y la cola de init_worker, la salida de un programa que tarda se manda por partes a la cola como
+#(request, texto) y solo se devuelve lo que falto mandar; el registro dice en "partes" cuantas se mandaron
+def run_source(source: str, stdin: List[str], program_id: Optional[str] = None,
+               request: Optional[int] = None) -> Tuple[Dict[str, Any], str]:
+    global _streaming
+    assert _interpreter is not None
+    record: Dict[str, Any] = {}
+    start = perf_counter()
+    output = ''
+    sink = _StreamSink(request) if request is not None and _stream is not None else None
+    _streaming = sink
+    try:
+        #El temporizador se repite cada 50 ms por si la primera señal cae dentro de un except del programa
+        _start_timer()
+        try:
+            result = _interpreter.run(_compile(source, program_id), stdin=stdin, stdout=sink)
+        finally:
+            _stop_timer()
+        output = result.output or ''
+        if result.memory is not None:
+            record['memoria'] = result.memory.peak
+        if result.ok:
+            record['estado'] = OK
+            record['valor'] = result.inspect()
+        else:
+            record['estado'] = ERROR
+            record['error'] = result.error
+    except CompileError as error:
+        record['estado'] = SYNTAX
+        record['error'] = str(error)
+    except _Timeout:
+        record['estado'] = TIMEOUT
+        record['error'] = _TIMEOUT_MESSAGE.format(_timeout)
+    except Exception as error:
+        record['estado'] = CRASH
+        record['error'] = f'{type(error).__name__}: {error}'
+
+    if sink is not None:
+        with _stream_lock:
+            _streaming = None
+            output = sink.take()
+        record['partes'] = sink.sent
+
+    record['codigo'] = EXIT_CODES[record['estado']]
+    record['duracion'] = round(perf_counter() - start, 6)
+    return record, output
+
+#Junta la salida del programa que corre, _send_output se la lleva
+class _StreamSink(OutputSink):
+    def __init__(self, request: int) -> None:
+        self.request = request
+        self.sent = 0
+        self.started = perf_counter()
+        self._parts: List[str] = []
+
+    def write(self, text: str) -> None:
+        with _stream_lock:
+            self._parts.append(text)
+
+    #Se llama con _stream_lock tomado
+    def take(self) -> str:
+        text = ''.join(self._parts)
+        self._parts.clear()
+        return text
+
+#Hilo de cada proceso que manda la salida del programa en curso cada STREAM_INTERVAL. Los programas cortos
+#terminan antes y devuelven su salida completa. Solo este hilo usa la cola: la señal del tiempo maximo
+#interrumpe el hilo principal y no puede cortar un envio a la mitad
+def _send_output() -> None:
+    assert _stream is not None
+    while True:
+        sleep(STREAM_INTERVAL)
+        with _stream_lock:
+            sink = _streaming
+            if sink is None or perf_counter() - sink.started < STREAM_INTERVAL:
+                continue
+            text = sink.take()
+            if not text:
+                continue
+            sink.sent += 1
+        _stream.put((sink.request, text))
+
+def _compile(source: str, program_id: Optional[str]) -> Program:
+    assert _interpreter is not None
+    if program_id is None:
+        return _interpreter.compile(source)
+    program = _programs.get(program_id)
+    if program is None:
+        program = _interpreter.compile(source)
+        _programs[program_id] = program
+        if len(_programs) > PROGRAM_CACHE_SIZE:
+            _programs.popitem(last=False)
+    else:
+        _programs.move_to_end(program_id)
+    return program
+
+def _read_input(path: str) -> List[str]:
+    input_path = os.path.splitext(path)[0] + INPUT_EXTENSION
+    if not os.path.isfile(input_path):
+        return []
+    with open(input_path, mode='r', encoding='utf-8') as file:
+        return file.read().splitlines()
+
+def _start_timer() -> None:
+    if _timeout > 0 and hasattr(signal, 'setitimer'):
+        signal.setitimer(signal.ITIMER_REAL, _timeout, 0.05)
+
+def _stop_timer() -> None:
+    if hasattr(signal, 'setitimer'):
+        signal.setitimer(signal.ITIMER_REAL, 0)
+
+#Devuelve los resultados en el orden de los archivos, a medida que terminan los bloques
+def run_files(files: List[str], workers: Optional[int] = None, timeout: float = DEFAULT_TIMEOUT,
+              options: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+    workers = workers or os.cpu_count() or 1
+    #Bloques de varios archivos por tarea, asi el costo de mandar cada tarea a un proceso se reparte
+    chunksize = max(1, len(files) // (workers * 8))
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                             initargs=(options or {}, timeout)) as executor:
+        yield from executor.map(run_file, files, chunksize=chunksize)
+
+#Escribe el reporte y devuelve cuantos archivos hubo con cada estado
+def run_batch(target: str, report: TextIO, workers: Optional[int] = None, timeout: float = DEFAULT_TIMEOUT,
+              options: Optional[Dict[str, Any]] = None) -> Dict[str, int]:
+    totals = {state: 0 for state in EXIT_CODES}
+    for record in run_files(find_files(target), workers, timeout, options):
+        totals[record['estado']] += 1
+        report.write(json.dumps(record, ensure_ascii=False) + '\n')
+    report.flush()
+    return totals
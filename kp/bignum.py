@@ -0,0 +1,107 @@
+import decimal
+from re import fullmatch
+from typing import Dict
+
+#Conversion de enteros grandes a texto y de texto a entero. str() e int() de Python son cuadraticos
+#y desde Python 3.11 fallan con mas de 4300 digitos, asi que los numeros grandes se parten en dos mitades
+#de forma recursiva: para imprimir se arma un Decimal, cuya multiplicacion es subcuadratica, y para leer
+#se multiplican las mitades por potencias de 10 con el algoritmo de Karatsuba de Python
+
+#Por debajo de estos tamaños str() e int() son mas rapidos y estan lejos del limite de Python
+_SMALL_BITS = 8192
+_SMALL_DIGITS = 2048
+
+#log10(2), para estimar los digitos de un entero por su cantidad de bits
+_LOG10_2 = 0.30102999566398120
+
+#Limite de digitos por defecto al imprimir o leer un entero, 0 es sin limite.
+#Kinp pasa el limite de la ejecucion, guardado en kp.context.Context
+DEFAULT_MAX_DIGITS = 1_000_000
+
+#Se lanza cuando un entero tiene mas digitos que max_digits, el evaluador la convierte en un Error de Kinp
+class DigitLimitError(ValueError):
+    pass
+
+def to_decimal(value: int, max_digits: int = DEFAULT_MAX_DIGITS) -> str:
+    bits = value.bit_length()
+    if bits <= _SMALL_BITS:
+        text = str(value)
+        _check_digits(len(text) - (value < 0), max_digits)
+        return text
+
+    #La estimacion por bits se queda corta por a lo sumo un digito, se revisa antes de hacer el trabajo
+    _check_digits(int(bits * _LOG10_2), max_digits)
+    text = str(_to_decimal(abs(value)))
+    _check_digits(len(text), max_digits)
+    return '-' + text if value < 0 else text
+
+#Acepta lo mismo que int(): espacios alrededor, un signo y guiones bajos entre los digitos
+def from_decimal(text: str, max_digits: int = DEFAULT_MAX_DIGITS) -> int:
+    text = text.strip()
+    digits = text.lstrip('+-').replace('_', '')
+    _check_digits(len(digits), max_digits)
+    if len(text) <= _SMALL_DIGITS:
+        return int(text)
+    if not fullmatch(r'[+-]?\d+(_\d+)*', text):
+        raise ValueError(text)
+
+    value = _from_digits(digits)
+    return -value if text[0] == '-' else value
+
+def _check_digits(digits: int, max_digits: int) -> None:
+    if max_digits and digits > max_digits:
+        raise DigitLimitError(max_digits)
+
+#Divide el numero en bits altos y bajos: valor = alto * 2**w + bajo, con las potencias de 2 en Decimal
+def _to_decimal(value: int) -> decimal.Decimal:
+    powers: Dict[int, decimal.Decimal] = {}
+
+    def power_of_two(exponent: int) -> decimal.Decimal:
+        result = powers.get(exponent)
+        if result is None:
+            if exponent <= _SMALL_BITS:
+                result = decimal.Decimal(2) ** exponent
+            else:
+                half = exponent >> 1
+                result = power_of_two(half) * power_of_two(exponent - half)
+            powers[exponent] = result
+        return result
+
+    def convert(number: int, bits: int) -> decimal.Decimal:
+        if bits <= _SMALL_BITS:
+            return decimal.Decimal(number)
+        half = bits >> 1
+        high = number >> half
+        low = number - (high << half)
+        return convert(high, bits - half) * power_of_two(half) + convert(low, half)
+
+    with decimal.localcontext() as context:
+        #Precision ilimitada, y un error si alguna operacion llegara a redondear
+        context.prec = decimal.MAX_PREC
+        context.Emax = decimal.MAX_EMAX
+        context.Emin = decimal.MIN_EMIN
+        context.traps[decimal.Inexact] = True
+        return convert(value, value.bit_length())
+
+#Divide los digitos en una mitad alta y una baja: valor = alto * 10**largo(bajo) + bajo
+def _from_digits(digits: str) -> int:
+    powers: Dict[int, int] = {}
+
+    def power_of_ten(exponent: int) -> int:
+        result = powers.get(exponent)
+        if result is None:
+            if exponent <= _SMALL_DIGITS:
+                result = 10 ** exponent
+            else:
+                half = exponent >> 1
+                result = power_of_ten(half) * power_of_ten(exponent - half)
+            powers[exponent] = result
+        return result
+
+    def convert(start: int, end: int) -> int:
+        if end - start <= _SMALL_DIGITS:
+            return int(digits[start:end])
+        low = (end - start) >> 1
+        return convert(start, end - low) * power_of_ten(low) + convert(end - low, end)
+
+    return convert(0, len(digits))
@@ -0,0 +1,80 @@
+from math import inf
+from time import perf_counter
+from typing import Union
+
+#Presupuesto de una ejecucion: cuantos pasos puede dar, que tan profundo puede llamar funciones y hasta
+#cuando puede correr. El evaluador lo revisa al entrar a un bloque, que cuenta sus sentencias como pasos,
+#al llamar una funcion de Kinp, que cuenta la profundidad, y despues de cada sentencia del programa. Todo
+#ciclo y toda recursion pasa por los primeros dos. El reloj y la cancelacion se miran cada _CHECK_INTERVAL
+#pasos, no en cada uno.
+#
+#Una sola operacion larga, como una potencia de enteros con millones de digitos, no se puede interrumpir:
+#el tiempo de mas se reporta como error cuando termina. Para cortarla hace falta otro proceso, como en kp.batch
+#
+#Al acabarse un recurso se lanza BudgetExceeded, que el evaluador convierte en un Error de Kinp al nivel
+#del programa. Cada ejecucion necesita su propio Budget; cancel se puede llamar desde otro hilo
+
+#Recursos que se pueden acabar
+STEPS = 'pasos'
+DEPTH = 'profundidad'
+TIME = 'tiempo'
+CANCELLED = 'cancelacion'
+#La memoria la cuenta kp.memory.MemoryMeter, que lanza la misma excepcion
+MEMORY = 'memoria'
+
+_STEPS_EXCEEDED = 'Poseemos un problema, el programa supero el limite de {} pasos'
+_DEPTH_EXCEEDED = 'Poseemos un problema, el programa supero la profundidad maxima de {} llamadas'
+_TIME_EXCEEDED = 'Poseemos un problema, el programa supero el limite de {} segundos'
+_CANCELLED = 'Poseemos un problema, la ejecucion fue cancelada'
+
+_CHECK_INTERVAL = 256
+
+class BudgetExceeded(Exception):
+    def __init__(self, resource: str, message: str) -> None:
+        super().__init__(message)
+        self.resource = resource
+        self.message = message
+
+class Budget:
+    #Un limite en 0 es sin limite
+    def __init__(self, max_steps: int = 0, max_depth: int = 0, timeout: float = 0.0) -> None:
+        self.max_steps = max_steps
+        self.max_depth = max_depth
+        self.timeout = timeout
+        self.steps = 0
+        self.depth = 0
+        self.cancelled = False
+        #El tiempo empieza a contar al crear el presupuesto
+        self._deadline = perf_counter() + timeout if timeout > 0 else inf
+        self._step_limit: Union[int, float] = max_steps if max_steps > 0 else inf
+        self._depth_limit: Union[int, float] = max_depth if max_depth > 0 else inf
+        self._next_check = min(_CHECK_INTERVAL, self._step_limit + 1)
+
+    def step(self, count: int = 1) -> None:
+        self.steps += count
+        if self.steps >= self._next_check:
+            self.check()
+
+    def enter(self) -> None:
+        self.depth += 1
+        if self.depth > self._depth_limit:
+            self.depth -= 1
+            raise BudgetExceeded(DEPTH, _DEPTH_EXCEEDED.format(self.max_depth))
+
+    def leave(self) -> None:
+        self.depth -= 1
+
+    #Detiene la ejecucion en su siguiente revision, desde cualquier hilo
+    def cancel(self) -> None:
+        self.cancelled = True
+        self._next_check = 0
+
+    #Revisa todos los limites sin esperar a los siguientes _CHECK_INTERVAL pasos
+    def check(self) -> None:
+        if self.steps > self._step_limit:
+            raise BudgetExceeded(STEPS, _STEPS_EXCEEDED.format(self.max_steps))
+        elif self.cancelled:
+            raise BudgetExceeded(CANCELLED, _CANCELLED)
+        elif perf_counter() > self._deadline:
+            raise BudgetExceeded(TIME, _TIME_EXCEEDED.format(self.timeout))
+        self._next_check = min(self.steps + _CHECK_INTERVAL, self._step_limit + 1)
@@ -1,6 +1,15 @@
-from typing import (cast, Dict)
+from typing import (cast, Any, Callable, Dict, List, Optional, Sequence, Tuple, Union)
 
+import kp.context as context
+from kp.bignum import (
+    DigitLimitError,
+    from_decimal,
+    to_decimal,
+)
+from kp.memo import MemoCache
 from kp.object import (
+    HASHABLE_TYPES,
+    Array,
     Boolean,
     Error,
     Object,
@@ -8,19 +17,64 @@ from kp.object import (
     Integer,
     Builtin,
     Float,
+    Function,
     Null,
+    Range,
+    Transient,
+    Dictionary,
+    ImmutableList,
+    ImmutableDictionary,
+    Vector,
+)
+from kp.persistent import (
+    TransientMap,
+    PersistentMap,
+    TransientVector,
+    PersistentVector,
+)
+from kp.vector import (
+    FLOAT,
+    BOOLEAN,
+    INTEGER,
+    NumericArray,
 )
 _WRONG_NUMBER_OF_ARGS= 'Poseemos un problema, numero incorrecto de argumentos, se requeria {}, pero se recibio {}'
 _UNSUPPORTED_ARGUMENT_TYPE= 'Poseemos un problema, no tengo soporte para {}'
 _THAT_IS_NOT_A_NUMBER = 'Poseemos un problema, "{}" no es numero y no se puede castear'
+_NOT_PURE = 'Poseemos un problema, la funcion imprime, recibe, cambia variables de afuera o lee listas y diccionarios de afuera y no se puede memorizar'
+_INVALID_SIZE = 'Poseemos un problema, el tamaño del cache debe ser mayor que cero, se recibio {}'
+_ZERO_STEP = 'Poseemos un problema, el paso del rango no puede ser cero'
+_EMPTY_REDUCE = 'Poseemos un problema, no se puede reducir una lista vacia sin valor inicial'
+_NOT_COMPARABLE = 'Poseemos un problema, la lista tiene valores que no se pueden comparar'
+_UNHASHABLE_KEY = 'Poseemos un problema, no se puede usar {} como clave de un diccionario'
+_MISSING_KEY = 'Poseemos un problema, la clave {} no existe en el diccionario'
+_INDEX_OUT_OF_RANGE = 'Poseemos un problema, el indice {} esta fuera de la lista de {} elementos'
+_TRANSIENT_USED = 'Poseemos un problema, el transitorio ya se convirtio en persistente'
+_EMPTY_LIST = 'Poseemos un problema, no se puede calcular {} de una lista vacia'
+_VECTOR_OVERFLOW = 'Poseemos un problema, el resultado no cabe en un vector de enteros de 64 bits'
+_EMPTY_SEPARATOR = 'Poseemos un problema, el separador no puede estar vacio'
+_TOO_MANY_DIGITS = 'Poseemos un problema, el numero tiene mas de {} digitos, usa --digitos para cambiar el limite'
+_NO_MORE_INPUT = 'Poseemos un problema, no quedan respuestas para recibir("{}")'
 
 def longitud(*args: Object) -> Object:
     if len(args) != 1:
         return Error(_WRONG_NUMBER_OF_ARGS.format(1,len(args)))
     elif type(args[0]) == String:
         argument = cast(String , args[0])
-        string_len = len(argument.value)
+        string_len = argument.length()
         return Integer(string_len)
+    elif type(args[0]) == Range:
+        return Integer(len(cast(Range, args[0]).value))
+    elif type(args[0]) == Array:
+        return Integer(len(cast(Array, args[0]).elements))
+    elif type(args[0]) == Dictionary:
+        return Integer(len(cast(Dictionary, args[0]).pairs))
+    elif type(args[0]) == ImmutableList:
+        return Integer(len(cast(ImmutableList, args[0]).vector))
+    elif type(args[0]) == Vector:
+        return Integer(len(cast(Vector, args[0]).values))
+    elif type(args[0]) == ImmutableDictionary:
+        return Integer(len(cast(ImmutableDictionary, args[0]).pairs))
     else:
         return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(args[0].type().name))
 
@@ -28,7 +82,7 @@ def imprimir(*args: Object) -> Object:
     if len(args) != 1:
         return Error(_WRONG_NUMBER_OF_ARGS.format(1,len(args)))
     else:
-        print(args[0].inspect())
+        context.write_line(args[0].inspect())
         return Null()
 
 def recibir(*args:Object) -> Object:
@@ -37,7 +91,10 @@ def recibir(*args:Object) -> Object:
     elif type(args[0]) == String:
         argument = cast(String, args[0])
         message = argument.value
-        input_data = input(message) 
+        current = context.current()
+        input_data = current.source.read_line(message, current.sink)
+        if input_data is None:
+            return Error(_NO_MORE_INPUT.format(message))
         return String(input_data)
     else:
         return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(args[0].type().name))
@@ -49,8 +106,10 @@ def parsearAentero(*args:Object) -> Object:
         dataString = cast(String, args[0])
         valueString = dataString.value
         try:
-            return Integer(int(valueString))
-        except:
+            return Integer(from_decimal(valueString, context.current().max_digits))
+        except DigitLimitError as error:
+            return Error(_TOO_MANY_DIGITS.format(*error.args))
+        except ValueError:
             return Error(_THAT_IS_NOT_A_NUMBER.format(valueString))
     elif type(args[0]) == Boolean:
         dataBoolean = cast(Boolean, args[0])
@@ -75,7 +134,10 @@ def parsearAtexto(*args:Object) -> Object:
     elif type(args[0]) == Integer:
         dataInteger = cast(Integer, args[0])
         valueInteger = dataInteger.value
-        return String(str(valueInteger))
+        try:
+            return String(to_decimal(valueInteger, context.current().max_digits))
+        except DigitLimitError as error:
+            return Error(_TOO_MANY_DIGITS.format(*error.args))
     elif type(args[0]) == Boolean:
         dataBoolean = cast(Boolean, args[0])
         valueBoolean = dataBoolean.value
@@ -104,6 +166,491 @@ def parsearAbooleano(*args:Object) -> Object:
     else:
         return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(args[0].type().name))
 
+#Marca una funcion pura para que guarde sus resultados, opcionalmente con el tamaño maximo del cache
+def memorizar(*args:Object) -> Object:
+    if len(args) != 1 and len(args) != 2:
+        return Error(_WRONG_NUMBER_OF_ARGS.format('1 o 2',len(args)))
+    elif type(args[0]) != Function:
+        return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(args[0].type().name))
+    elif len(args) == 2 and type(args[1]) != Integer:
+        return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(args[1].type().name))
+
+    function = cast(Function, args[0])
+    builtins = context.current().builtins
+    cache = MemoCache()
+    if not cache.validate(function, builtins if builtins is not None else BUILTINS):
+        return Error(_NOT_PURE)
+
+    if len(args) == 2:
+        size = cast(Integer, args[1]).value
+        if size <= 0:
+            return Error(_INVALID_SIZE.format(size))
+        cache.maxsize = size
+    function.memo = cache
+    return function
+
+#Crea un rango perezoso: rango(fin), rango(inicio, fin) o rango(inicio, fin, paso)
+def rango(*args:Object) -> Object:
+    if len(args) < 1 or len(args) > 3:
+        return Error(_WRONG_NUMBER_OF_ARGS.format('1, 2 o 3',len(args)))
+    for arg in args:
+        if type(arg) != Integer:
+            return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(arg.type().name))
+
+    values = [cast(Integer, arg).value for arg in args]
+    if len(values) == 3 and values[2] == 0:
+        return Error(_ZERO_STEP)
+    return Range(range(*values))
+
+#Agrega un valor al final de la lista, modificandola
+def anexar(*args:Object) -> Object:
+    if len(args) != 2:
+        return Error(_WRONG_NUMBER_OF_ARGS.format(2,len(args)))
+    elif type(args[0]) != Array:
+        return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(args[0].type().name))
+    cast(Array, args[0]).elements.append(args[1])
+    return args[0]
+
+#Los builtins de orden superior recorren la lista en Python y llaman a la funcion con el evaluador,
+#que se importa dentro de cada builtin porque el evaluador importa este modulo
+def mapa(*args:Object) -> Object:
+    from kp.evaluator import _apply_function
+
+    error = _check_list_and_function(args, 2)
+    if error is not None:
+        return error
+    function = args[1]
+    result: List[Object] = []
+    for element in cast(Array, args[0]).elements:
+        value = _apply_function(function, [element])
+        if type(value) == Error:
+            return value
+        result.append(value)
+    return Array(result)
+
+def filtro(*args:Object) -> Object:
+    from kp.evaluator import (_apply_function, _is_truthy)
+
+    error = _check_list_and_function(args, 2)
+    if error is not None:
+        return error
+    function = args[1]
+    result: List[Object] = []
+    for element in cast(Array, args[0]).elements:
+        keep = _apply_function(function, [element])
+        if type(keep) == Error:
+            return keep
+        if _is_truthy(keep):
+            result.append(element)
+    return Array(result)
+
+#reducir(lista, funcion) o reducir(lista, funcion, inicial), la funcion recibe el acumulado y el elemento
+def reducir(*args:Object) -> Object:
+    from kp.evaluator import _apply_function
+
+    if len(args) != 2 and len(args) != 3:
+        return Error(_WRONG_NUMBER_OF_ARGS.format('2 o 3',len(args)))
+    error = _check_list_and_function(args[:2], 2)
+    if error is not None:
+        return error
+
+    elements = cast(Array, args[0]).elements
+    function = args[1]
+    if len(args) == 3:
+        accumulated = args[2]
+    elif len(elements) > 0:
+        accumulated = elements[0]
+        elements = elements[1:]
+    else:
+        return Error(_EMPTY_REDUCE)
+
+    for element in elements:
+        accumulated = _apply_function(function, [accumulated, element])
+        if type(accumulated) == Error:
+            return accumulated
+    return accumulated
+
+def suma(*args:Object) -> Object:
+    if len(args) != 1:
+        return Error(_WRONG_NUMBER_OF_ARGS.format(1,len(args)))
+    elif type(args[0]) == Vector:
+        return _reduce_vector(cast(Vector, args[0]), 'suma')
+    elif type(args[0]) != Array:
+        return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(args[0].type().name))
+
+    numbers = _numbers(cast(Array, args[0]).elements)
+    if type(numbers) == Error:
+        return cast(Error, numbers)
+    values, is_float = cast(Tuple[List[Any], bool], numbers)
+    if is_float:
+        return Float(float(sum(values)))
+    return Integer(sum(values))
+
+def promedio(*args:Object) -> Object:
+    return _reduce('promedio', args)
+
+def maximo(*args:Object) -> Object:
+    return _reduce('maximo', args)
+
+def minimo(*args:Object) -> Object:
+    return _reduce('minimo', args)
+
+#promedio, maximo y minimo de una lista o de un vector, con un vector el ciclo corre en C
+def _reduce(name: str, args: Sequence[Object]) -> Object:
+    if len(args) != 1:
+        return Error(_WRONG_NUMBER_OF_ARGS.format(1,len(args)))
+    elif type(args[0]) == Vector:
+        return _reduce_vector(cast(Vector, args[0]), name)
+    elif type(args[0]) != Array:
+        return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(args[0].type().name))
+
+    numbers = _numbers(cast(Array, args[0]).elements)
+    if type(numbers) == Error:
+        return cast(Error, numbers)
+    values, is_float = cast(Tuple[List[Any], bool], numbers)
+    if not values:
+        return Error(_EMPTY_LIST.format(name))
+    elif name == 'promedio':
+        return Float(sum(values) / len(values))
+    result = max(values) if name == 'maximo' else min(values)
+    return Float(float(result)) if is_float else Integer(result)
+
+def _reduce_vector(argument: Vector, name: str) -> Object:
+    values = argument.values
+    try:
+        if name == 'suma':
+            result = values.total()
+        elif name == 'promedio':
+            return Float(values.mean())
+        elif name == 'maximo':
+            result = values.maximum()
+        else:
+            result = values.minimum()
+    except TypeError:
+        return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(f'{name} de booleanos'))
+    except ValueError:
+        return Error(_EMPTY_LIST.format(name))
+    return Integer(cast(int, result)) if values.kind == INTEGER else Float(result)
+
+#Los valores de una lista de enteros y decimales, y si alguno es decimal
+def _numbers(elements: List[Object]) -> Union[Error, Tuple[List[Any], bool]]:
+    is_float = False
+    values = []
+    for element in elements:
+        if type(element) == Float:
+            is_float = True
+        elif type(element) != Integer:
+            return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(element.type().name))
+        values.append(cast(Integer, element).value)
+    return values, is_float
+
+#Devuelve una lista nueva con los numeros o textos ordenados de menor a mayor
+def ordenar(*args:Object) -> Object:
+    if len(args) != 1:
+        return Error(_WRONG_NUMBER_OF_ARGS.format(1,len(args)))
+    elif type(args[0]) != Array:
+        return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(args[0].type().name))
+
+    elements = cast(Array, args[0]).elements
+    for element in elements:
+        if type(element) != Integer and type(element) != Float and type(element) != String:
+            return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(element.type().name))
+    try:
+        return Array(sorted(elements, key=lambda element: cast(Integer, element).value))
+    except TypeError:
+        return Error(_NOT_COMPARABLE)
+
+def claves(*args:Object) -> Object:
+    if len(args) != 1:
+        return Error(_WRONG_NUMBER_OF_ARGS.format(1,len(args)))
+    elif type(args[0]) == ImmutableDictionary:
+        return Array([key for key, _ in cast(ImmutableDictionary, args[0]).pairs.items()])
+    elif type(args[0]) != Dictionary:
+        return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(args[0].type().name))
+    return Array(list(cast(Dictionary, args[0]).pairs.keys()))
+
+def valores(*args:Object) -> Object:
+    if len(args) != 1:
+        return Error(_WRONG_NUMBER_OF_ARGS.format(1,len(args)))
+    elif type(args[0]) == ImmutableDictionary:
+        return Array([value for _, value in cast(ImmutableDictionary, args[0]).pairs.items()])
+    elif type(args[0]) != Dictionary:
+        return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(args[0].type().name))
+    return Array(list(cast(Dictionary, args[0]).pairs.values()))
+
+#contiene(diccionario, clave), contiene(lista, valor) o contiene(texto, parte)
+def contiene(*args:Object) -> Object:
+    if len(args) != 2:
+        return Error(_WRONG_NUMBER_OF_ARGS.format(2,len(args)))
+
+    container, value = args
+    if type(container) == Dictionary or type(container) == ImmutableDictionary:
+        if type(value) not in HASHABLE_TYPES:
+            return Error(_UNHASHABLE_KEY.format(value.type().name))
+        return _to_boolean(value in cast(Dictionary, container).pairs)
+    elif type(container) == Array:
+        return _to_boolean(value in cast(Array, container).elements)
+    elif type(container) == ImmutableList:
+        return _to_boolean(value in cast(ImmutableList, container).vector)
+    elif type(container) == String and type(value) == String:
+        return _to_boolean(cast(String, value).value in cast(String, container).value)
+    return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(container.type().name))
+
+#Elimina una clave del diccionario y devuelve el valor que tenia
+def borrar(*args:Object) -> Object:
+    if len(args) != 2:
+        return Error(_WRONG_NUMBER_OF_ARGS.format(2,len(args)))
+    elif type(args[0]) != Dictionary:
+        return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(args[0].type().name))
+    elif type(args[1]) not in HASHABLE_TYPES:
+        return Error(_UNHASHABLE_KEY.format(args[1].type().name))
+
+    value = cast(Dictionary, args[0]).pairs.pop(args[1], None)
+    if value is None:
+        return Error(_MISSING_KEY.format(args[1].inspect()))
+    return value
+
+#Los builtins de textos usan los metodos de str de Python, cada uno recorre el texto una sola vez
+#buscar(texto, parte[, inicio]) devuelve la posicion de la primera aparicion, o -1 si no aparece
+def buscar(*args:Object) -> Object:
+    if len(args) == 3:
+        if type(args[2]) != Integer:
+            return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(args[2].type().name))
+        values = _string_values(args[:2], 2, 2)
+        start = cast(Integer, args[2]).value
+    else:
+        values = _string_values(args, 2, 3)
+        start = 0
+    if type(values) == Error:
+        return cast(Error, values)
+    text, part = cast(List[str], values)
+    return Integer(text.find(part, start))
+
+def reemplazar(*args:Object) -> Object:
+    values = _string_values(args, 3, 3)
+    if type(values) == Error:
+        return cast(Error, values)
+    text, old, new = cast(List[str], values)
+    return String(text.replace(old, new))
+
+#dividir(texto) separa por los espacios, dividir(texto, separador) por el separador
+def dividir(*args:Object) -> Object:
+    values = _string_values(args, 1, 2)
+    if type(values) == Error:
+        return cast(Error, values)
+    text, *separator = cast(List[str], values)
+    if separator and separator[0] == '':
+        return Error(_EMPTY_SEPARATOR)
+    return Array([String(part) for part in text.split(*separator)])
+
+#unir(lista[, separador]) pega los elementos de la lista, los que no son textos se escriben como en imprimir
+def unir(*args:Object) -> Object:
+    if len(args) != 1 and len(args) != 2:
+        return Error(_WRONG_NUMBER_OF_ARGS.format('1 o 2',len(args)))
+    elif type(args[0]) == Array:
+        elements: Sequence[Object] = cast(Array, args[0]).elements
+    elif type(args[0]) == ImmutableList:
+        elements = list(cast(ImmutableList, args[0]).vector)
+    else:
+        return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(args[0].type().name))
+
+    separator = ''
+    if len(args) == 2:
+        if type(args[1]) != String:
+            return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(args[1].type().name))
+        separator = cast(String, args[1]).value
+    return String(separator.join(element.inspect() for element in elements))
+
+def mayusculas(*args:Object) -> Object:
+    values = _string_values(args, 1, 1)
+    if type(values) == Error:
+        return cast(Error, values)
+    return String(cast(List[str], values)[0].upper())
+
+def minusculas(*args:Object) -> Object:
+    values = _string_values(args, 1, 1)
+    if type(values) == Error:
+        return cast(Error, values)
+    return String(cast(List[str], values)[0].lower())
+
+#recortar(texto) quita los espacios de los extremos, recortar(texto, letras) quita esas letras
+def recortar(*args:Object) -> Object:
+    values = _string_values(args, 1, 2)
+    if type(values) == Error:
+        return cast(Error, values)
+    text, *characters = cast(List[str], values)
+    return String(text.strip(*characters))
+
+def comienza_con(*args:Object) -> Object:
+    values = _string_values(args, 2, 2)
+    if type(values) == Error:
+        return cast(Error, values)
+    text, prefix = cast(List[str], values)
+    return _to_boolean(text.startswith(prefix))
+
+def termina_con(*args:Object) -> Object:
+    values = _string_values(args, 2, 2)
+    if type(values) == Error:
+        return cast(Error, values)
+    text, suffix = cast(List[str], values)
+    return _to_boolean(text.endswith(suffix))
+
+#Revisa que lleguen entre minimum y maximum argumentos y que todos sean textos, y devuelve sus valores
+def _string_values(args: Sequence[Object], minimum: int, maximum: int) -> Union[Error, List[str]]:
+    if len(args) < minimum or len(args) > maximum:
+        expected = minimum if minimum == maximum else f'{minimum} o {maximum}'
+        return Error(_WRONG_NUMBER_OF_ARGS.format(expected,len(args)))
+    for arg in args:
+        if type(arg) != String:
+            return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(arg.type().name))
+    return [cast(String, arg).value for arg in args]
+
+#Convierte una lista o un rango en un vector numerico. Si todos los elementos son enteros es un vector
+#de enteros, si hay decimales uno de decimales, y tambien puede ser de booleanos, pero no de tipos mezclados
+def vector(*args:Object) -> Object:
+    if len(args) != 1:
+        return Error(_WRONG_NUMBER_OF_ARGS.format(1,len(args)))
+    elif type(args[0]) == Vector:
+        return args[0]
+    elif type(args[0]) == Range:
+        try:
+            return Vector(NumericArray.from_values(cast(Range, args[0]).value, INTEGER))
+        except OverflowError:
+            return Error(_VECTOR_OVERFLOW)
+    elif type(args[0]) == Array:
+        elements = cast(Array, args[0]).elements
+    elif type(args[0]) == ImmutableList:
+        elements = list(cast(ImmutableList, args[0]).vector)
+    else:
+        return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(args[0].type().name))
+
+    types = {type(element) for element in elements}
+    if types <= {Integer}:
+        kind = INTEGER
+    elif types <= {Integer, Float}:
+        kind = FLOAT
+    elif types == {Boolean}:
+        kind = BOOLEAN
+    else:
+        invalid = next(element for element in elements if type(element) not in (Integer, Float))
+        return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(invalid.type().name))
+
+    try:
+        return Vector(NumericArray.from_values([cast(Integer, element).value for element in elements], kind))
+    except OverflowError:
+        return Error(_VECTOR_OVERFLOW)
+
+#Convierte una lista o un diccionario en su version inmutable
+def inmutable(*args:Object) -> Object:
+    if len(args) != 1:
+        return Error(_WRONG_NUMBER_OF_ARGS.format(1,len(args)))
+    elif type(args[0]) == Array:
+        return ImmutableList(PersistentVector.from_iterable(cast(Array, args[0]).elements))
+    elif type(args[0]) == Dictionary:
+        return ImmutableDictionary(PersistentMap.from_pairs(cast(Dictionary, args[0]).pairs.items()))
+    elif type(args[0]) == ImmutableList or type(args[0]) == ImmutableDictionary:
+        return args[0]
+    return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(args[0].type().name))
+
+#Las colecciones inmutables devuelven una version nueva, los transitorios se modifican y se devuelven a si mismos
+def agregar(*args:Object) -> Object:
+    if len(args) != 2:
+        return Error(_WRONG_NUMBER_OF_ARGS.format(2,len(args)))
+
+    collection, value = args
+    if type(collection) == ImmutableList:
+        return ImmutableList(cast(ImmutableList, collection).vector.append(value))
+    elif type(collection) == Transient and type(cast(Transient, collection).collection) == TransientVector:
+        return _edit_transient(cast(Transient, collection), lambda vector: vector.append(value))
+    return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(collection.type().name))
+
+#asociar(diccionario, clave, valor) o asociar(lista, indice, valor), con el indice igual a la longitud agrega al final
+def asociar(*args:Object) -> Object:
+    if len(args) != 3:
+        return Error(_WRONG_NUMBER_OF_ARGS.format(3,len(args)))
+
+    collection, key, value = args
+    target = cast(Transient, collection).collection if type(collection) == Transient else None
+    if type(collection) == ImmutableDictionary or type(target) == TransientMap:
+        if type(key) not in HASHABLE_TYPES:
+            return Error(_UNHASHABLE_KEY.format(key.type().name))
+        if type(collection) == Transient:
+            return _edit_transient(cast(Transient, collection), lambda pairs: pairs.set(key, value))
+        return ImmutableDictionary(cast(ImmutableDictionary, collection).pairs.set(key, value))
+
+    elif type(collection) == ImmutableList or type(target) == TransientVector:
+        if type(key) != Integer:
+            return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(key.type().name))
+        position = cast(Integer, key).value
+        if type(collection) == Transient:
+            return _edit_transient(cast(Transient, collection), lambda vector: vector.set(position, value))
+        try:
+            return ImmutableList(cast(ImmutableList, collection).vector.set(position, value))
+        except IndexError as error:
+            return Error(_INDEX_OUT_OF_RANGE.format(*error.args))
+    return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(collection.type().name))
+
+def quitar(*args:Object) -> Object:
+    if len(args) != 2:
+        return Error(_WRONG_NUMBER_OF_ARGS.format(2,len(args)))
+
+    collection, key = args
+    if type(key) not in HASHABLE_TYPES:
+        return Error(_UNHASHABLE_KEY.format(key.type().name))
+    if type(collection) == ImmutableDictionary:
+        return ImmutableDictionary(cast(ImmutableDictionary, collection).pairs.delete(key))
+    elif type(collection) == Transient and type(cast(Transient, collection).collection) == TransientMap:
+        return _edit_transient(cast(Transient, collection), lambda pairs: pairs.delete(key))
+    return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(collection.type().name))
+
+#Para construir colecciones grandes: transitorio(coleccion), muchas llamadas a agregar o asociar
+#que modifican en su lugar, y persistente(transitorio) para congelar el resultado
+def transitorio(*args:Object) -> Object:
+    if len(args) != 1:
+        return Error(_WRONG_NUMBER_OF_ARGS.format(1,len(args)))
+    elif type(args[0]) == ImmutableList:
+        return Transient(cast(ImmutableList, args[0]).vector.transient())
+    elif type(args[0]) == ImmutableDictionary:
+        return Transient(cast(ImmutableDictionary, args[0]).pairs.transient())
+    return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(args[0].type().name))
+
+def persistente(*args:Object) -> Object:
+    if len(args) != 1:
+        return Error(_WRONG_NUMBER_OF_ARGS.format(1,len(args)))
+    elif type(args[0]) != Transient:
+        return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(args[0].type().name))
+
+    collection = cast(Transient, args[0]).collection
+    try:
+        if type(collection) == TransientVector:
+            return ImmutableList(cast(TransientVector, collection).persistent())
+        return ImmutableDictionary(cast(TransientMap, collection).persistent())
+    except RuntimeError:
+        return Error(_TRANSIENT_USED)
+
+def _edit_transient(transient: Transient, edit: Callable[[Any], Any]) -> Object:
+    try:
+        edit(transient.collection)
+    except RuntimeError:
+        return Error(_TRANSIENT_USED)
+    except IndexError as error:
+        return Error(_INDEX_OUT_OF_RANGE.format(*error.args))
+    return transient
+
+#Los booleanos del evaluador son unicos y se comparan por identidad
+def _to_boolean(value: bool) -> Object:
+    from kp.evaluator import _to_boolean_object
+    return _to_boolean_object(value)
+
+def _check_list_and_function(args: Sequence[Object], expected: int) -> Optional[Error]:
+    if len(args) != expected:
+        return Error(_WRONG_NUMBER_OF_ARGS.format(expected,len(args)))
+    elif type(args[0]) != Array:
+        return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(args[0].type().name))
+    elif type(args[1]) != Function and type(args[1]) != Builtin:
+        return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(args[1].type().name))
+    return None
+
 BUILTINS: Dict[str, Builtin] = {
     'longitud' : Builtin(fn=longitud),
     'imprimir' : Builtin(fn=imprimir),
@@ -111,4 +658,35 @@ BUILTINS: Dict[str, Builtin] = {
     'parsearAentero' : Builtin(fn=parsearAentero),
     'parsearAtexto' : Builtin(fn=parsearAtexto),
     'parsearAbooleano' : Builtin(fn=parsearAbooleano),
+    'memorizar' : Builtin(fn=memorizar),
+    'rango' : Builtin(fn=rango),
+    'anexar' : Builtin(fn=anexar),
+    'mapa' : Builtin(fn=mapa),
+    'filtro' : Builtin(fn=filtro),
+    'reducir' : Builtin(fn=reducir),
+    'suma' : Builtin(fn=suma),
+    'ordenar' : Builtin(fn=ordenar),
+    'claves' : Builtin(fn=claves),
+    'valores' : Builtin(fn=valores),
+    'contiene' : Builtin(fn=contiene),
+    'borrar' : Builtin(fn=borrar),
+    'inmutable' : Builtin(fn=inmutable),
+    'agregar' : Builtin(fn=agregar),
+    'asociar' : Builtin(fn=asociar),
+    'quitar' : Builtin(fn=quitar),
+    'transitorio' : Builtin(fn=transitorio),
+    'persistente' : Builtin(fn=persistente),
+    'vector' : Builtin(fn=vector),
+    'promedio' : Builtin(fn=promedio),
+    'maximo' : Builtin(fn=maximo),
+    'minimo' : Builtin(fn=minimo),
+    'buscar' : Builtin(fn=buscar),
+    'reemplazar' : Builtin(fn=reemplazar),
+    'dividir' : Builtin(fn=dividir),
+    'unir' : Builtin(fn=unir),
+    'mayusculas' : Builtin(fn=mayusculas),
+    'minusculas' : Builtin(fn=minusculas),
+    'recortar' : Builtin(fn=recortar),
+    'comienza_con' : Builtin(fn=comienza_con),
+    'termina_con' : Builtin(fn=termina_con),
 }
\ No newline at end of file
@@ -0,0 +1,114 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (Iterator, List, Mapping, Optional, TYPE_CHECKING)
+
+from kp.bignum import DEFAULT_MAX_DIGITS
+from kp.budget import Budget
+from kp.inputs import (ConsoleSource, InputSource)
+from kp.memory import MemoryMeter
+from kp.output import (OutputSink, StreamSink)
+
+if TYPE_CHECKING:
+    from kp.object import (Builtin, Function)
+    from kp.profiler import Profiler
+    from kp.trace import Tracer
+
+#Estado de una ejecucion de Kinp: a donde escribe imprimir, de donde lee recibir, el limite de digitos,
+#la memorizacion automatica, los builtins visibles, el presupuesto, el medidor de memoria, el perfilador y el Tracer. El contexto activo se guarda en una ContextVar,
+#asi cada hilo (y cada tarea de asyncio) ve el suyo y varios programas pueden correr a la vez en un
+#ThreadPoolExecutor sin mezclar su salida. Mientras nadie active otro se usa DEFAULT, el de main.py.
+#
+#Lo que no esta en el contexto no depende de la ejecucion: los caches de ast.Identifier se comparan con
+#el diccionario global de cada ejecucion, los caches de memorizar viven en cada Function y los BUILTINS
+#no se modifican nunca. Environment.version es compartido, pero solo sirve para invalidar caches: que otra
+#ejecucion lo cambie a lo sumo obliga a repetir una busqueda. Lo mismo vale en CPython sin GIL, y en
+#subinterpretes cada uno importa su propia copia de kp
+
+DEFAULT_MEMO_SIZE = 1024
+
+class Context:
+    def __init__(self,
+                sink: Optional[OutputSink] = None,
+                source: Optional[InputSource] = None,
+                max_digits: int = DEFAULT_MAX_DIGITS,
+                memo: bool = False,
+                memo_size: int = DEFAULT_MEMO_SIZE,
+                builtins: Optional[Mapping[str, 'Builtin']] = None,
+                budget: Optional[Budget] = None,
+                memory: Optional[MemoryMeter] = None,
+                profiler: Optional['Profiler'] = None,
+                tracer: Optional['Tracer'] = None) -> None:
+        self.sink: OutputSink = sink if sink is not None else StreamSink()
+        self.source: InputSource = source if source is not None else ConsoleSource()
+        #Cantidad maxima de digitos al imprimir o leer un entero, 0 es sin limite
+        self.max_digits = max_digits
+        #Con memo todas las funciones puras definidas en el entorno global se memorizan
+        self.memo = memo
+        self.memo_size = memo_size
+        #None son todos los builtins de kp.builtins
+        self.builtins = builtins
+        #None es sin limites de pasos, profundidad ni tiempo
+        self.budget = budget
+        #None es sin contar la memoria
+        self.memory = memory
+        #Solo se usa mientras kp.profiler.installed() esta activo
+        self.profiler = profiler
+        #Recibe los errores siempre, los nodos y las llamadas mientras kp.trace.installed() esta activo
+        self.tracer = tracer
+        #Pila de las funciones de Kinp en ejecucion, la de mas adentro al final. La leen los errores
+        #para armar su rastreo y kp.stack.Sampler desde otro hilo o una señal
+        self.stack: List['Function'] = []
+
+DEFAULT = Context()
+
+_current: ContextVar[Context] = ContextVar('kinp_contexto', default=DEFAULT)
+
+def current() -> Context:
+    return _current.get()
+
+#Activa el contexto mientras dura el bloque with, en el hilo o la tarea actual
+@contextmanager
+def using(context: Context) -> Iterator[Context]:
+    token = _current.set(context)
+    try:
+        yield context
+    finally:
+        _current.reset(token)
+
+#Cambia el contexto activo, lo que no se da se deja como estaba. Al cambiar el destino de la salida
+#se vacia el anterior
+def configure(sink: Optional[OutputSink] = None,
+              source: Optional[InputSource] = None,
+              max_digits: Optional[int] = None,
+              memo: Optional[bool] = None,
+              memo_size: Optional[int] = None,
+              budget: Optional[Budget] = None,
+              memory: Optional[MemoryMeter] = None,
+              profiler: Optional['Profiler'] = None,
+              tracer: Optional['Tracer'] = None) -> None:
+    context = current()
+    if sink is not None:
+        context.sink.flush()
+        context.sink = sink
+    if source is not None:
+        context.source = source
+    if max_digits is not None:
+        context.max_digits = max_digits
+    if memo is not None:
+        context.memo = memo
+    if memo_size is not None:
+        context.memo_size = memo_size
+    if budget is not None:
+        context.budget = budget
+    if memory is not None:
+        context.memory = memory
+    if profiler is not None:
+        context.profiler = profiler
+    if tracer is not None:
+        context.tracer = tracer
+
+def write_line(text: str) -> None:
+    current().sink.write(text + '\n')
+
+def flush() -> None:
+    current().sink.flush()
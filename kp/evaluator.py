@@ -1,20 +1,41 @@
-from typing import (Any,cast,List,Optional,Type)
+from sys import getsizeof
+from typing import (Any,cast,Iterator,List,Mapping,Optional,Tuple,Type,Union)
 
 import kp.ast as ast
+import kp.context as context
+import kp.memo as memo
+from kp.bignum import DigitLimitError
+from kp.budget import BudgetExceeded
+from kp.memory import ENVIRONMENT
 from kp.builtins import BUILTINS
 from kp.object import (
+    HASHABLE_TYPES,
     Null,
+    Array,
     Float,
     Error,
     Object,
     Return,
     String,
     Builtin,
+    Range,
     Integer,
     Boolean,
     Function,
     ObjecType,
+    Dictionary,
     Environment,
+    ImmutableList,
+    ImmutableDictionary,
+    Vector,
+)
+from kp.persistent import PersistentVector
+from kp.vector import (
+    BOOLEAN,
+    INTEGER,
+    NumericArray,
+    Scalar,
+    apply_operator,
 )
 
 TRUE = Boolean(True)
@@ -26,12 +47,45 @@ _TYPE_MISMATCH = 'Poseemos un problema, no puedo ejecutar {} {} {}'
 _UNKNOWN_PREFIX_OPERATION = 'Poseemos un problema, no puedo operar {}{}'
 _UNKNOWN_INFIX_OPERATION = 'Poseemos un problema, no puedo operar {} {} {}'
 _UNKNOWN_IDENTIFIER = 'Poseemos un problema, que es "{}"?'
+_NOT_ITERABLE = 'Poseemos un problema, no se puede recorrer {}'
+_INDEX_OUT_OF_RANGE = 'Poseemos un problema, el indice {} esta fuera de la lista de {} elementos'
+_NOT_INDEXABLE = 'Poseemos un problema, no se puede usar {}[{}]'
+_UNHASHABLE_KEY = 'Poseemos un problema, no se puede usar {} como clave de un diccionario'
+_MISSING_KEY = 'Poseemos un problema, la clave {} no existe en el diccionario'
+_IMMUTABLE = 'Poseemos un problema, {} no se puede modificar, usa asociar para crear una version nueva'
+_DIVISION_BY_ZERO = 'Poseemos un problema, no se puede dividir entre cero'
+_LENGTH_MISMATCH = 'Poseemos un problema, no se pueden operar vectores de {} y {} elementos'
+_VECTOR_OVERFLOW = 'Poseemos un problema, el resultado no cabe en un vector de enteros de 64 bits'
+_TOO_MANY_DIGITS = 'Poseemos un problema, el numero tiene mas de {} digitos, usa --digitos para cambiar el limite'
+_TOO_DEEP = 'Poseemos un problema, el programa supero la profundidad maxima de llamadas de Python, usa --profundidad para limitarla'
+
+_AND_OPERATORS = ('y', '&&')
+_OR_OPERATORS = ('o', '||')
+_LOGICAL_OPERATORS = _AND_OPERATORS + _OR_OPERATORS
 
 
 def _evaluate_program(program: ast.Program, env: Environment) -> Optional[Object]:
     result: Optional[Object] = None
+    current = context.current()
+    budget = current.budget
+    depth = len(current.stack)
     for statement in program.statements:
-        result = evaluate(statement,env)
+        #Convertir a texto un entero con demasiados digitos puede pasar en cualquier inspect,
+        #se detiene el programa igual que con cualquier otro error. Lo mismo al acabarse el presupuesto
+        #o la pila de Python, que se lanzan desde cualquier profundidad. Despues de cada sentencia se
+        #revisa el presupuesto completo, una sentencia sin bloques ni llamadas no lo revisa adentro
+        try:
+            if budget is not None:
+                budget.step()
+            result = evaluate(statement,env)
+            if budget is not None:
+                budget.check()
+        except DigitLimitError as error:
+            return _unwind(current.stack, depth, _new_error(_TOO_MANY_DIGITS, list(error.args)))
+        except BudgetExceeded as error:
+            return _unwind(current.stack, depth, Error(error.message))
+        except RecursionError:
+            return _unwind(current.stack, depth, _new_error(_TOO_DEEP, []))
 
         if type(result) == Error:
             return result
@@ -41,6 +95,11 @@ def _evaluate_program(program: ast.Program, env: Environment) -> Optional[Object
 
     return result
 
+#El error ya guardo la pila donde ocurrio, las funciones que quedaron apiladas se quitan
+def _unwind(stack: List[Function], depth: int, error: Error) -> Error:
+    del stack[depth:]
+    return error
+
 def evaluate(node: ast.ASTNode, env: Environment) -> Optional[Object]:
     node_type: Type = type(node)
 
@@ -80,6 +139,8 @@ def evaluate(node: ast.ASTNode, env: Environment) -> Optional[Object]:
         right = evaluate(node.right, env)
         
         assert right is not None
+        if type(right) == Error:
+            return right
         return _evaluate_prefix_expression(node.operator, right)
 
     elif node_type == ast.Infix:
@@ -89,9 +150,17 @@ def evaluate(node: ast.ASTNode, env: Environment) -> Optional[Object]:
         if (type(node.left) == ast.Identifier and node.operator == '='):
             variable = cast(ast.Identifier, node.left)
             return _assign_let_statement(variable, node.right, env)
+        elif type(node.left) == ast.Index and node.operator == '=':
+            return _assign_index_expression(cast(ast.Index, node.left), node.right, env)
+        elif node.operator in _LOGICAL_OPERATORS:
+            return _evaluate_logical_expression(node, env)
         else:
             left = evaluate(node.left,env)
+            if type(left) == Error:
+                return left
             right = evaluate(node.right,env)
+            if type(right) == Error:
+                return right
             assert left is not None and right is not None
             return _evaluate_infix_expression(node.operator, left, right)
 
@@ -122,7 +191,7 @@ def evaluate(node: ast.ASTNode, env: Environment) -> Optional[Object]:
             return value
 
         assert node.name is not None
-        env[node.name.value] = value
+        _bind(env, node.name.value, value)
     elif node_type == ast.Identifier:
         node = cast(ast.Identifier, node)
         
@@ -130,18 +199,19 @@ def evaluate(node: ast.ASTNode, env: Environment) -> Optional[Object]:
     elif node_type == ast.Function:
         node = cast(ast.Function, node)
         assert node.body is not None
-        function = Function(node.parameters,node.body,env)
+        function = _new_function(node.parameters,node.body,env)
         if type(function) == Error:
             return function
 
         assert node.name is not None
-        env[node.name.value] = function
+        function.name = node.name.value
+        _bind(env, node.name.value, function)
         return function
     elif node_type == ast.Lambda:
         node = cast(ast.Lambda, node)
 
         assert node.body is not None
-        return Function(node.parameters,node.body,env)
+        return _new_function(node.parameters,node.body,env)
     elif node_type == ast.Call:
         node = cast(ast.Call, node)
 
@@ -151,13 +221,48 @@ def evaluate(node: ast.ASTNode, env: Environment) -> Optional[Object]:
 
         assert node.arguments is not None
         args = _evaluate_expression(node.arguments,env)
+        if args and type(args[-1]) == Error:
+            return args[-1]
 
         assert call_function is not None
         return _apply_function(call_function, args)
+    elif node_type == ast.ListLiteral:
+        node = cast(ast.ListLiteral, node)
+
+        assert node.elements is not None
+        elements = _evaluate_expression(node.elements, env)
+        for element in elements:
+            if type(element) == Error:
+                return element
+        return Array(elements)
+    elif node_type == ast.DictionaryLiteral:
+        node = cast(ast.DictionaryLiteral, node)
+
+        return _evaluate_dictionary_literal(node, env)
+    elif node_type == ast.Index:
+        node = cast(ast.Index, node)
+
+        return _evaluate_index_expression(node, env)
+    elif node_type == ast.Slice:
+        node = cast(ast.Slice, node)
+
+        return _evaluate_slice_expression(node, env)
+    elif node_type == ast.WhileStatement:
+        node = cast(ast.WhileStatement, node)
+
+        return _evaluate_while_statement(node, env)
+    elif node_type == ast.ForStatement:
+        node = cast(ast.ForStatement, node)
+
+        return _evaluate_for_statement(node, env)
     elif node_type == ast.StringLiteral:
         node = cast(ast.StringLiteral, node)
 
         return String(node.value)
+    elif node_type == ast.TemplateLiteral:
+        node = cast(ast.TemplateLiteral, node)
+
+        return _evaluate_template_literal(node, env)
     elif node_type == ast.Null:
         return NULL
 
@@ -169,41 +274,109 @@ def _assign_let_statement(variable: ast.Identifier, right: ast.Expression, env:
     if type(existence:=_identifier_exist(variable,env)) != Error:
         value = evaluate(right,env)
         if type(value) != Error:
-            env[variable.value] = value
+            _bind(env, variable.value, value)
             return NULL
         else:
             return value
     else:
         return existence
 
+#Con la memorizacion automatica, las funciones del entorno global con cuerpo puro llevan su cache
+def _new_function(parameters: List[ast.Identifier], body: ast.Block, env: Environment) -> Function:
+    function = Function(parameters, body, env)
+    current = context.current()
+    if current.memo and env.store is env.globals and memo.has_pure_body(parameters, body):
+        function.memo = memo.MemoCache(current.memo_size)
+    return function
+
+#La funcion se apila en la pila del contexto mientras corre. Si una excepcion la atraviesa no se
+#desapila, asi _evaluate_program todavia ve donde ocurrio y arma el rastreo antes de limpiarla
 def _apply_function(fn: Object, args: List[Object])-> Object:
     if type(fn) == Function:
-
-            fn = cast(Function,fn)
-
-            extended_environment = _extended_function_environment(fn, args)
-            evaluated = evaluate(fn.body, extended_environment)
-
-            assert evaluated is not None
-            return _unwrap_return_value(evaluated)
+        current = context.current()
+        budget = current.budget
+        stack = current.stack
+        if budget is None:
+            function = cast(Function, fn)
+            stack.append(function)
+            #Sin presupuesto ni cache el cuerpo se evalua aqui mismo: un marco de Python menos por llamada
+            #deja la misma profundidad de recursion que antes de existir _call_function
+            if function.memo is None and _call_function is _evaluate_call:
+                evaluated = evaluate(function.body, _extended_function_environment(function, args))
+                assert evaluated is not None
+                result = _unwrap_return_value(evaluated)
+            else:
+                result = _call_function(function, args)
+        else:
+            budget.enter()
+            stack.append(cast(Function, fn))
+            try:
+                result = _call_function(cast(Function, fn), args)
+            finally:
+                budget.leave()
+        stack.pop()
+        return result
     elif type(fn) == Builtin:
         fn= cast(Builtin,fn)
         return fn.fn(*args)
     else:
         return _new_error(_NOT_A_FUNCTION, [fn.type().name])
 
+def _call_function(fn: Function, args: List[Object]) -> Object:
+    if fn.memo is not None and fn.memo.validate(fn, _builtins()):
+        return _apply_memoized_function(fn, fn.memo, args)
+
+    extended_environment = _extended_function_environment(fn, args)
+    evaluated = evaluate(fn.body, extended_environment)
+
+    assert evaluated is not None
+    return _unwrap_return_value(evaluated)
+
+#La version sin instrumentar, kp.trace cambia _call_function mientras sigue una ejecucion
+_evaluate_call = _call_function
+
+def _apply_memoized_function(fn: Function, cache: memo.MemoCache, args: List[Object]) -> Object:
+    key = memo.memo_key(args)
+    if key is None:
+        return _unwrap_return_value(cast(Object, evaluate(fn.body, _extended_function_environment(fn, args))))
+
+    result = cache.get(key)
+    if result is None:
+        evaluated = evaluate(fn.body, _extended_function_environment(fn, args))
+        assert evaluated is not None
+        result = _unwrap_return_value(evaluated)
+        if type(result) != Error:
+            cache.put(key, result)
+    return result
+
 def _extended_function_environment(fn: Function, args: List[Object]) -> Environment:
     env = Environment(outer=fn.env)
+    #Los parametros se escriben directo en el diccionario, siempre tapan los mismos nombres
+    #en cada llamada, asi que no pueden invalidar ningun cache de identificadores
+    store = env.store
     for idx, param in enumerate(fn.parameters):
-        env[param.value] = args[idx]
+        store[param.value] = args[idx]
+    meter = context.current().memory
+    if meter is not None:
+        meter.track(env, ENVIRONMENT, getsizeof(env) + getsizeof(store))
     return env
 
+#Guarda una variable en el entorno, si tapa una funcion builtin los caches dejan de ser validos.
+#Una funcion sin nombre toma el de la variable
+def _bind(env: Environment, name: str, value: Object) -> None:
+    if name in _builtins() and name not in env.store:
+        Environment.version += 1
+    if type(value) == Function and cast(Function, value).name is None:
+        cast(Function, value).name = name
+    env[name] = value
+
 def _unwrap_return_value(obj: Object) -> Object:
     if type(obj) == Return:
         obj = cast(Return,obj)
         return obj.value
     return obj
 
+#Se detiene en el primer Error, que queda al final de la lista, sin evaluar las expresiones siguientes
 def _evaluate_expression(expressions: List[ast.Expression], env: Environment) -> List[Object]:
     result: List[Object] = []
 
@@ -212,20 +385,38 @@ def _evaluate_expression(expressions: List[ast.Expression], env: Environment) ->
 
         assert evaluated is not None
         result.append(evaluated)
+        if type(evaluated) == Error:
+            break
 
     return result
 
+#Las busquedas que terminan en el entorno global o en los builtins se guardan en el nodo,
+#mientras la version de Environment no cambie basta con leer el diccionario guardado
 def _evaluate_identifier(node: ast.Identifier, env:Environment) -> Object:
-    try:
-        return env[node.value]
-    except KeyError:
-        return BUILTINS.get(node.value, _new_error(_UNKNOWN_IDENTIFIER,[node.value]))
+    cache = node.cache
+    if cache is not None and cache[0] == Environment.version and cache[1] is env.globals:
+        return cache[2][node.value]
+
+    version = Environment.version
+    store = env.resolve(node.value)
+    if store is None:
+        builtins = _builtins()
+        if node.value not in builtins:
+            return _new_error(_UNKNOWN_IDENTIFIER,[node.value])
+        node.cache = (version, env.globals, builtins)
+        return builtins[node.value]
+
+    if store is env.globals:
+        node.cache = (version, env.globals, store)
+    return store[node.value]
+
+#Los builtins del contexto activo, todos los de kp.builtins si el contexto no los restringe
+def _builtins() -> Mapping[str, Builtin]:
+    builtins = context.current().builtins
+    return builtins if builtins is not None else BUILTINS
 
 def _identifier_exist(node: ast.Identifier, env:Environment) -> Object:
-    try:
-        return env[node.value]
-    except KeyError:
-        return BUILTINS.get(node.value, _new_error(_UNKNOWN_IDENTIFIER,[node.value]))
+    return _evaluate_identifier(node, env)
 
 def _evaluate_if_expression(if_expression: ast.If, env: Environment) -> Optional[Object]:
     assert if_expression.condition is not None
@@ -240,8 +431,13 @@ def _evaluate_if_expression(if_expression: ast.If, env: Environment) -> Optional
     else:
         return NULL
 
+#Con presupuesto cada bloque cuenta sus sentencias como pasos al empezar, y uno mas por el bloque
+#para que un ciclo con el cuerpo vacio tambien avance
 def _evaluate_block_statement(block: ast.Block, env:Environment) -> Optional[Object]:
     result: Optional[Object] = None
+    budget = context.current().budget
+    if budget is not None:
+        budget.step(len(block.statements) + 1)
     for statement in block.statements:
         result = evaluate(statement,env)
 
@@ -250,6 +446,254 @@ def _evaluate_block_statement(block: ast.Block, env:Environment) -> Optional[Obj
 
     return result
 
+#Arma el texto de una sola vez: los pedazos de texto y el valor de cada expresion se unen con un solo join
+def _evaluate_template_literal(node: ast.TemplateLiteral, env: Environment) -> Object:
+    strings = node.strings
+    pieces: List[str] = [strings[0]]
+    for position, expression in enumerate(node.expressions, 1):
+        value = evaluate(expression, env)
+        assert value is not None
+        if type(value) == Error:
+            return value
+        pieces.append(value.inspect())
+        pieces.append(strings[position])
+    return String(''.join(pieces))
+
+def _evaluate_dictionary_literal(node: ast.DictionaryLiteral, env: Environment) -> Object:
+    pairs = {}
+    for key_node, value_node in zip(node.keys, node.values):
+        key = evaluate(key_node, env)
+        assert key is not None
+        if type(key) == Error:
+            return key
+        if type(key) not in HASHABLE_TYPES:
+            return _new_error(_UNHASHABLE_KEY, [key.type().name])
+
+        value = evaluate(value_node, env)
+        assert value is not None
+        if type(value) == Error:
+            return value
+        pairs[key] = value
+    return Dictionary(pairs)
+
+#Evalua el objeto y el indice de una expresion lista[indice], deteniendose en el primer error
+def _evaluate_index_operands(node: ast.Index, env: Environment) -> Union[Error, Tuple[Object, Object]]:
+    assert node.index is not None
+    left = evaluate(node.left, env)
+    assert left is not None
+    if type(left) == Error:
+        return cast(Error, left)
+    index = evaluate(node.index, env)
+    assert index is not None
+    if type(index) == Error:
+        return cast(Error, index)
+    return left, index
+
+#Los indices negativos cuentan desde el final, como en Python
+def _evaluate_index_expression(node: ast.Index, env: Environment) -> Object:
+    operands = _evaluate_index_operands(node, env)
+    if type(operands) == Error:
+        return cast(Error, operands)
+    left, index = cast(Tuple[Object, Object], operands)
+
+    if type(left) == Dictionary or type(left) == ImmutableDictionary:
+        if type(index) not in HASHABLE_TYPES:
+            return _new_error(_UNHASHABLE_KEY, [index.type().name])
+        value = cast(Dictionary, left).pairs.get(index, None)
+        if value is None:
+            return _new_error(_MISSING_KEY, [index.inspect()])
+        return value
+    elif type(left) == Vector:
+        return _evaluate_vector_index(cast(Vector, left), index)
+
+    if type(index) != Integer or (type(left) != Array and type(left) != String and type(left) != ImmutableList):
+        return _new_error(_NOT_INDEXABLE, [left.type().name, index.type().name])
+
+    position = cast(Integer, index).value
+    if type(left) == Array:
+        elements = cast(Array, left).elements
+        if -len(elements) <= position < len(elements):
+            return elements[position]
+        return _new_error(_INDEX_OUT_OF_RANGE, [position, len(elements)])
+    elif type(left) == ImmutableList:
+        vector = cast(ImmutableList, left).vector
+        if -len(vector) <= position < len(vector):
+            return vector.get(position % len(vector))
+        return _new_error(_INDEX_OUT_OF_RANGE, [position, len(vector)])
+
+    text = cast(String, left).value
+    if -len(text) <= position < len(text):
+        return String(text[position])
+    return _new_error(_INDEX_OUT_OF_RANGE, [position, len(text)])
+
+#lista[indice] = valor reemplaza un elemento existente, diccionario[clave] = valor agrega o reemplaza
+def _assign_index_expression(node: ast.Index, right: ast.Expression, env: Environment) -> Object:
+    operands = _evaluate_index_operands(node, env)
+    if type(operands) == Error:
+        return cast(Error, operands)
+    left, index = cast(Tuple[Object, Object], operands)
+
+    value = evaluate(right, env)
+    assert value is not None
+    if type(value) == Error:
+        return value
+
+    if type(left) == Dictionary:
+        if type(index) not in HASHABLE_TYPES:
+            return _new_error(_UNHASHABLE_KEY, [index.type().name])
+        cast(Dictionary, left).pairs[index] = value
+        return NULL
+    elif type(left) == Array and type(index) == Integer:
+        elements = cast(Array, left).elements
+        position = cast(Integer, index).value
+        if not -len(elements) <= position < len(elements):
+            return _new_error(_INDEX_OUT_OF_RANGE, [position, len(elements)])
+        elements[position] = value
+        return NULL
+    elif type(left) == Vector and type(index) == Integer:
+        return _assign_vector_element(cast(Vector, left), cast(Integer, index).value, value)
+    elif type(left) == ImmutableList or type(left) == ImmutableDictionary:
+        return _new_error(_IMMUTABLE, [left.type().name])
+    return _new_error(_NOT_INDEXABLE, [left.type().name, index.type().name])
+
+#Un vector se indexa con un entero o con un vector de booleanos del mismo largo que elige los elementos
+def _evaluate_vector_index(left: Vector, index: Object) -> Object:
+    values = left.values
+    if type(index) == Vector:
+        try:
+            return Vector(values.select(cast(Vector, index).values))
+        except TypeError:
+            return _new_error(_NOT_INDEXABLE, [left.type().name, index.type().name])
+        except ValueError as error:
+            return _new_error(_LENGTH_MISMATCH, list(error.args))
+    elif type(index) != Integer:
+        return _new_error(_NOT_INDEXABLE, [left.type().name, index.type().name])
+
+    position = cast(Integer, index).value
+    if -len(values) <= position < len(values):
+        return _vector_element(values, values.get(position))
+    return _new_error(_INDEX_OUT_OF_RANGE, [position, len(values)])
+
+#Un vector solo guarda valores de su tipo, o enteros si es de decimales
+def _assign_vector_element(left: Vector, position: int, value: Object) -> Object:
+    values = left.values
+    if not -len(values) <= position < len(values):
+        return _new_error(_INDEX_OUT_OF_RANGE, [position, len(values)])
+    if type(value) != Integer and type(value) != Float and type(value) != Boolean:
+        return _new_error(_TYPE_MISMATCH, [left.type().name, '=', value.type().name])
+    try:
+        values.set(position, cast(Integer, value).value)
+    except TypeError:
+        return _new_error(_TYPE_MISMATCH, [left.type().name, '=', value.type().name])
+    except OverflowError:
+        return _new_error(_VECTOR_OVERFLOW, [])
+    return NULL
+
+def _vector_element(values: NumericArray, value: Scalar) -> Object:
+    if values.kind == BOOLEAN:
+        return _to_boolean_object(bool(value))
+    elif values.kind == INTEGER:
+        return Integer(cast(int, value))
+    return Float(value)
+
+#Una parte siempre es una lista o un texto nuevo, los limites fuera de rango se recortan
+def _evaluate_slice_expression(node: ast.Slice, env: Environment) -> Object:
+    left = evaluate(node.left, env)
+    assert left is not None
+    if type(left) == Error:
+        return left
+
+    bounds: List[Optional[int]] = []
+    for bound in (node.start, node.end):
+        if bound is None:
+            bounds.append(None)
+            continue
+        value = evaluate(bound, env)
+        assert value is not None
+        if type(value) == Error:
+            return value
+        if type(value) != Integer:
+            return _new_error(_NOT_INDEXABLE, [left.type().name, value.type().name])
+        bounds.append(cast(Integer, value).value)
+
+    if type(left) == Array:
+        return Array(cast(Array, left).elements[bounds[0]:bounds[1]])
+    elif type(left) == String:
+        return String(cast(String, left).value[bounds[0]:bounds[1]])
+    elif type(left) == Vector:
+        return Vector(cast(Vector, left).values.slice(bounds[0], bounds[1]))
+    elif type(left) == ImmutableList:
+        elements = list(cast(ImmutableList, left).vector)[bounds[0]:bounds[1]]
+        return ImmutableList(PersistentVector.from_iterable(elements))
+    return _new_error(_NOT_INDEXABLE, [left.type().name, ObjecType.INTEGER.name])
+
+#Los ciclos evaluan su cuerpo en el mismo entorno en cada vuelta, sin crear uno nuevo.
+#Un regresa o un error detienen el ciclo y se propagan, si termina normalmente el valor es nulo
+def _evaluate_while_statement(node: ast.WhileStatement, env: Environment) -> Object:
+    assert node.condition is not None and node.body is not None
+    condition_node = node.condition
+    body = node.body
+    while True:
+        condition = evaluate(condition_node, env)
+        assert condition is not None
+        if type(condition) == Error:
+            return condition
+        if not _is_truthy(condition):
+            return NULL
+
+        result = _evaluate_block_statement(body, env)
+        if result is not None and (type(result) == Return or type(result) == Error):
+            return result
+
+def _evaluate_for_statement(node: ast.ForStatement, env: Environment) -> Object:
+    assert node.variable is not None and node.iterable is not None and node.body is not None
+    iterable = evaluate(node.iterable, env)
+    assert iterable is not None
+    if type(iterable) == Error:
+        return iterable
+
+    items = _iterate(iterable)
+    if items is None:
+        return _new_error(_NOT_ITERABLE, [iterable.type().name])
+
+    name = node.variable.value
+    body = node.body
+    store = env.store
+    bound = False
+    for item in items:
+        if bound:
+            #Despues de la primera vuelta el nombre ya existe en este entorno,
+            #reasignarlo directo en el diccionario no cambia la version de los caches
+            store[name] = item
+        else:
+            _bind(env, name, item)
+            bound = True
+
+        result = _evaluate_block_statement(body, env)
+        if result is not None and (type(result) == Return or type(result) == Error):
+            return result
+    return NULL
+
+#Devuelve los elementos de un objeto que se puede recorrer uno por uno, sin construir una lista
+def _iterate(obj: Object) -> Optional[Iterator[Object]]:
+    if type(obj) == Range:
+        return map(Integer, cast(Range, obj).value)
+    elif type(obj) == Array:
+        return iter(cast(Array, obj).elements)
+    elif type(obj) == Dictionary:
+        #Se recorre una copia de las claves, asi el cuerpo del ciclo puede modificar el diccionario
+        return iter(list(cast(Dictionary, obj).pairs))
+    elif type(obj) == ImmutableList:
+        return iter(cast(ImmutableList, obj).vector)
+    elif type(obj) == ImmutableDictionary:
+        return iter(cast(ImmutableDictionary, obj).pairs)
+    elif type(obj) == Vector:
+        values = cast(Vector, obj).values
+        return (_vector_element(values, value) for value in values)
+    elif type(obj) == String:
+        return map(String, cast(String, obj).value)
+    return None
+
 def _is_truthy(obj: Object) -> bool:
     if obj is NULL:
         return False
@@ -260,6 +704,26 @@ def _is_truthy(obj: Object) -> bool:
     else:
         return False
 
+#El lado derecho solo se evalua si el izquierdo no decide el resultado
+def _evaluate_logical_expression(node: ast.Infix, env: Environment) -> Object:
+    left = evaluate(node.left, env)
+    assert left is not None
+    if type(left) == Error:
+        return left
+
+    if node.operator in _AND_OPERATORS:
+        if not _is_truthy(left):
+            return FALSE
+    elif _is_truthy(left):
+        return TRUE
+
+    assert node.right is not None
+    right = evaluate(node.right, env)
+    assert right is not None
+    if type(right) == Error:
+        return right
+    return _to_boolean_object(_is_truthy(right))
+
 def _evaluate_infix_expression(operator: str, left: Object, right: Object) -> Object:
     
     #TODO Mejorar los condicionales
@@ -271,10 +735,12 @@ def _evaluate_infix_expression(operator: str, left: Object, right: Object) -> Ob
         return _evaluate_string_infix_expression(operator, left, right)
     elif (left.type() == ObjecType.STRING or right.type() == ObjecType.STRING) and operator == '+':
         return _evaluate_string_infix_concatenation(operator, left, right)
+    elif type(left) == Vector or type(right) == Vector:
+        return _evaluate_vector_infix_expression(operator, left, right)
     elif operator == '==':
-        return _to_boolean_object(left is right)
+        return _to_boolean_object(left == right)
     elif operator == '!=':
-        return _to_boolean_object(left is not right)
+        return _to_boolean_object(left != right)
     elif left.type() != right.type():
         return _new_error(_TYPE_MISMATCH, [left.type().name,operator, right.type().name])
     else:
@@ -349,12 +815,14 @@ def _evaluate_float_infix_expression(operator: str, left:Object, right: Object)
 
 def _evaluate_string_infix_expression(operator: str, left: Object, right: Object) -> Object:
 
+    #Sumar no lee el valor del texto de la izquierda, asi no se unen sus partes en cada suma
+    if operator == '+':
+        return String.concatenate(left, right)
+
     left_value: str = cast(String, left).value
     right_value: str = cast(String, right).value
 
-    if operator == '+':
-        return String(left_value+right_value)
-    elif operator == '==':
+    if operator == '==':
         return _to_boolean_object(left_value == right_value)
     elif operator == '!=':
         return _to_boolean_object(left_value != right_value)
@@ -362,12 +830,31 @@ def _evaluate_string_infix_expression(operator: str, left: Object, right: Object
         return _new_error(_UNKNOWN_INFIX_OPERATION, [left.type().name, operator, right.type().name] )
 
 def _evaluate_string_infix_concatenation(operator: str, left: Object, right: Object) -> Object:
-    
-    left_value: str = left.inspect()
-    right_value: str = right.inspect()
-    
-    return String(left_value+right_value)
+    return String.concatenate(left, right)
+
+
+#Con un vector la operacion se aplica a cada elemento y un numero se repite para todos los elementos,
+#el ciclo corre en C, sin crear un objeto de Kinp por elemento
+def _evaluate_vector_infix_expression(operator: str, left: Object, right: Object) -> Object:
+    operands: List[Any] = []
+    for operand in (left, right):
+        if type(operand) == Vector:
+            operands.append(cast(Vector, operand).values)
+        elif type(operand) == Integer or type(operand) == Float or type(operand) == Boolean:
+            operands.append(cast(Integer, operand).value)
+        else:
+            return _new_error(_TYPE_MISMATCH, [left.type().name, operator, right.type().name])
 
+    try:
+        return Vector(apply_operator(operator, operands[0], operands[1]))
+    except ZeroDivisionError:
+        return _new_error(_DIVISION_BY_ZERO, [])
+    except OverflowError:
+        return _new_error(_VECTOR_OVERFLOW, [])
+    except ValueError as error:
+        return _new_error(_LENGTH_MISMATCH, list(error.args))
+    except TypeError:
+        return _new_error(_UNKNOWN_INFIX_OPERATION, [left.type().name, operator, right.type().name])
 
 def _evaluate_prefix_expression(operator: str, right: Object) -> Object:
     if operator == '!':
@@ -395,6 +882,11 @@ def _evaluate_minus_operator_expression(right: Object) ->  Object:
     elif right.type() == ObjecType.FLOAT:
         right = cast(Float, right)
         return Float(-right.value)
+    elif right.type() == ObjecType.VECTOR:
+        negated = _evaluate_vector_infix_expression('*', right, Integer(-1))
+        if type(negated) == Error:
+            return _new_error(_UNKNOWN_PREFIX_OPERATION, ['-', right.type().name])
+        return negated
     else:
         return _new_error(_UNKNOWN_PREFIX_OPERATION, ['-', right.type().name])
 
@@ -0,0 +1,54 @@
+import sys
+from abc import (ABC, abstractmethod)
+from typing import (Iterable, Optional, TextIO)
+
+from kp.output import OutputSink
+
+#Fuentes de las respuestas de recibir. Por defecto se pregunta en la consola con input(), pero para
+#correr programas sin nadie al teclado las respuestas se pueden leer de un archivo, de la entrada
+#estandar completa o de cualquier iterable de Python, una linea por cada llamada a recibir.
+#La fuente de cada ejecucion se guarda en su kp.context.Context, junto al destino de la salida
+
+class InputSource(ABC):
+
+    #Devuelve None cuando ya no quedan respuestas. sink es la salida de imprimir de la misma ejecucion
+    @abstractmethod
+    def read_line(self, prompt: str, sink: OutputSink) -> Optional[str]:
+        pass
+
+class ConsoleSource(InputSource):
+
+    def read_line(self, prompt: str, sink: OutputSink) -> Optional[str]:
+        #Lo impreso antes de la pregunta tiene que verse antes de esperar la respuesta
+        sink.flush()
+        try:
+            return input(prompt)
+        except EOFError:
+            return None
+
+#Responde con las lineas dadas, en orden. Sin eco la pregunta no se muestra; con eco la pregunta
+#y la respuesta se escriben en la salida de imprimir, como se verian en la consola
+class LineSource(InputSource):
+    def __init__(self, lines: Iterable[str], echo: bool = False) -> None:
+        self._lines = iter(lines)
+        self._echo = echo
+
+    def read_line(self, prompt: str, sink: OutputSink) -> Optional[str]:
+        line = next(self._lines, None)
+        if line is None:
+            return None
+        line = line.rstrip('\r\n')
+        if self._echo:
+            sink.write(prompt + line + '\n')
+        return line
+
+#Lee todo el archivo de una vez, en lugar de una linea por pregunta
+def from_stream(stream: TextIO, echo: bool = False) -> LineSource:
+    return LineSource(stream.read().splitlines(), echo)
+
+#Con la ruta '-' se lee la entrada estandar
+def from_path(path: str, echo: bool = False) -> LineSource:
+    if path == '-':
+        return from_stream(sys.stdin, echo)
+    with open(path, mode='r', encoding='utf-8') as file:
+        return from_stream(file, echo)
@@ -0,0 +1,368 @@
+from contextlib import nullcontext
+from time import perf_counter
+from typing import (cast, Any, Callable, Dict, Iterable, List, Mapping, Optional, TextIO, Union)
+
+import kp.ast as ast
+import kp.context as context
+import kp.trace as trace
+from kp.bignum import DEFAULT_MAX_DIGITS
+from kp.budget import (Budget, BudgetExceeded)
+from kp.context import (DEFAULT_MEMO_SIZE, Context)
+from kp.evaluator import (
+    FALSE,
+    NULL,
+    TRUE,
+    evaluate,
+)
+from kp.inputs import (
+    InputSource,
+    LineSource,
+    from_stream,
+)
+from kp.lexer import Lexer
+from kp.memo import (MemoCache, is_immutable)
+from kp.memory import MemoryMeter
+from kp.object import (
+    HASHABLE_TYPES,
+    Array,
+    Boolean,
+    Builtin,
+    Dictionary,
+    Environment,
+    Error,
+    Float,
+    Function,
+    ImmutableDictionary,
+    ImmutableList,
+    Integer,
+    Null,
+    Object,
+    Range,
+    String,
+    Transient,
+    Vector,
+)
+from kp.optimizer import (DEFAULT_INLINE_SIZE, Optimizer)
+from kp.output import (
+    CaptureSink,
+    OutputSink,
+    StreamSink,
+)
+from kp.parser import Parser
+from kp.persistent import (PersistentMap, PersistentVector)
+from kp.profiler import (Profiler, installed)
+from kp.stack import (Sampler, format_traceback)
+from kp.trace import Tracer
+
+#Interprete para usar Kinp desde Python: un programa se analiza una vez con compile y se ejecuta
+#las veces que se quiera con run, cada vez con sus propias variables, entradas y salida.
+#Las variables que se dan al crear el Interpreter forman un entorno base que cada ejecucion copia,
+#asi que una ejecucion nunca ve las variables globales que creo otra. Las listas, diccionarios y demas
+#valores que se pueden modificar se copian en cada ejecucion, lo que un programa les cambia no lo ven los demas.
+#Cada ejecucion corre en su propio kp.context.Context, varias pueden correr a la vez en distintos hilos
+#con el mismo Interpreter y el mismo Program.
+#Con max_steps, max_depth o timeout cada ejecucion tiene un kp.budget.Budget nuevo con esos limites;
+#run tambien acepta un Budget propio, para cancelar la ejecucion desde otro hilo. Con max_memory cada
+#ejecucion cuenta su memoria en un kp.memory.MemoryMeter, o en el que se le de a run, y lo deja en el Result.
+#Con un kp.profiler.Profiler run cuenta las llamadas a cada funcion en el, que se puede reusar en varias ejecuciones,
+#con un kp.stack.Sampler muestrea la pila de funciones mientras corre, y con un kp.trace.Tracer le avisa
+#cada nodo, llamada y error
+
+_HOST_ERROR = 'Poseemos un problema, la funcion {} fallo: {}'
+
+#Se lanza cuando el codigo tiene errores de sintaxis, guarda los mensajes del parser
+class CompileError(ValueError):
+    def __init__(self, errors: List[str]) -> None:
+        super().__init__('\n'.join(errors))
+        self.errors = errors
+
+#Un programa ya analizado (y optimizado si el Interpreter lo pide), listo para ejecutarse muchas veces
+class Program:
+    def __init__(self, source: str, program: ast.Program) -> None:
+        self.source = source
+        self.program = program
+
+class Result:
+    def __init__(self, value: Object, output: Optional[str], duration: float,
+                 memory: Optional[MemoryMeter] = None, max_digits: int = DEFAULT_MAX_DIGITS) -> None:
+        #El ultimo valor del programa, o el Error que lo detuvo
+        self.value = value
+        #Lo escrito con imprimir, None si la salida se mando a un archivo
+        self.output = output
+        self.duration = duration
+        #La memoria que uso la ejecucion, si se conto
+        self.memory = memory
+        #El limite de digitos de la ejecucion, para escribir el valor despues de que termino
+        self.max_digits = max_digits
+
+    @property
+    def error(self) -> Optional[str]:
+        if type(self.value) == Error:
+            return cast(Error, self.value).message
+        return None
+
+    #Las funciones en las que ocurrio el error, vacio si no hubo error o fue fuera de una funcion
+    @property
+    def traceback(self) -> str:
+        if type(self.value) == Error:
+            return format_traceback(cast(Error, self.value))
+        return ''
+
+    @property
+    def ok(self) -> bool:
+        return type(self.value) != Error
+
+    #El valor como lo escribiria imprimir en la ejecucion. value.inspect() usaria el limite de digitos
+    #del contexto activo al llamarlo, no el del Interpreter
+    def inspect(self) -> str:
+        with context.using(Context(max_digits=self.max_digits)):
+            return self.value.inspect()
+
+    def to_python(self) -> Any:
+        return to_python(self.value)
+
+#Las respuestas de recibir: un texto con una respuesta por linea, un archivo o cualquier iterable de lineas
+Stdin = Union[str, TextIO, Iterable[str]]
+#Un archivo, o un OutputSink propio para decidir cuando y a donde se manda lo impreso
+Stdout = Union[TextIO, OutputSink]
+
+class Interpreter:
+    def __init__(self,
+                bindings: Optional[Mapping[str, Any]] = None,
+                prelude: Optional[str] = None,
+                optimize: bool = False,
+                inline_size: int = DEFAULT_INLINE_SIZE,
+                max_digits: int = DEFAULT_MAX_DIGITS,
+                memo: bool = False,
+                memo_size: int = DEFAULT_MEMO_SIZE,
+                builtins: Optional[Mapping[str, Builtin]] = None,
+                max_steps: int = 0,
+                max_depth: int = 0,
+                timeout: float = 0.0,
+                max_memory: int = 0) -> None:
+        self.optimize = optimize
+        self.inline_size = inline_size
+        self.max_digits = max_digits
+        self.memo = memo
+        self.memo_size = memo_size
+        #None son todos los builtins, un diccionario deja solo esos (por ejemplo sin recibir)
+        self.builtins = builtins
+        self.max_steps = max_steps
+        self.max_depth = max_depth
+        self.timeout = timeout
+        self.max_memory = max_memory
+        self.base = Environment()
+        if bindings is not None:
+            _bind_values(self.base, bindings)
+        #Las funciones del preludio quedan en el entorno base, cada ejecucion usa una copia enlazada a su entorno
+        if prelude is not None:
+            with context.using(self._new_context(CaptureSink(), LineSource(()))):
+                evaluated = evaluate(self.compile(prelude).program, self.base)
+            if type(evaluated) == Error:
+                raise CompileError([cast(Error, evaluated).message])
+
+    def _new_context(self, sink: OutputSink, source: InputSource, budget: Optional[Budget] = None,
+                     memory: Optional[MemoryMeter] = None, profiler: Optional[Profiler] = None,
+                     tracer: Optional[Tracer] = None) -> Context:
+        return Context(sink, source, self.max_digits, self.memo, self.memo_size, self.builtins, budget, memory,
+                       profiler, tracer)
+
+    #None si el Interpreter no tiene limites
+    def _new_budget(self) -> Optional[Budget]:
+        if self.max_steps > 0 or self.max_depth > 0 or self.timeout > 0:
+            return Budget(self.max_steps, self.max_depth, self.timeout)
+        return None
+
+    def compile(self, source: str) -> Program:
+        parser = Parser(Lexer(source))
+        #El limite de digitos de los enteros escritos en el codigo es el del Interpreter
+        with context.using(self._new_context(CaptureSink(), LineSource(()))):
+            program = parser.parse_program()
+        if len(parser.errors) > 0:
+            raise CompileError(parser.errors)
+        if self.optimize:
+            program = Optimizer(self.inline_size).optimize(program)
+        return Program(source, program)
+
+    def run(self,
+            program: Program,
+            bindings: Optional[Mapping[str, Any]] = None,
+            stdin: Optional[Stdin] = None,
+            stdout: Optional[Stdout] = None,
+            budget: Optional[Budget] = None,
+            memory: Optional[MemoryMeter] = None,
+            profiler: Optional[Profiler] = None,
+            sampler: Optional[Sampler] = None,
+            tracer: Optional[Tracer] = None) -> Result:
+        env = _copy_environment(self.base)
+        if bindings is not None:
+            _bind_values(env, bindings)
+
+        #Sin stdout lo impreso se guarda en el resultado, sin stdin recibir no tiene respuestas
+        sink = _output_sink(stdout)
+        if budget is None:
+            budget = self._new_budget()
+        if memory is None and self.max_memory > 0:
+            memory = MemoryMeter(self.max_memory)
+        start = perf_counter()
+        try:
+            with context.using(self._new_context(sink, _input_source(stdin), budget, memory, profiler, tracer)):
+                with installed() if profiler is not None else nullcontext(), \
+                        trace.installed() if tracer is not None else nullcontext(), \
+                        sampler if sampler is not None else nullcontext():
+                    evaluated = evaluate(program.program, env)
+        finally:
+            duration = perf_counter() - start
+            sink.flush()
+
+        captured = sink.getvalue() if type(sink) == CaptureSink else None
+        return Result(evaluated if evaluated is not None else NULL, captured, duration, memory, self.max_digits)
+
+    def execute(self, source: str, **kwargs: Any) -> Result:
+        return self.run(self.compile(source), **kwargs)
+
+#El entorno de una ejecucion: las listas, diccionarios, vectores y transitorios del entorno base se copian,
+#y las funciones del preludio se enlazan al entorno nuevo para que usen esas copias. Asi ninguna ejecucion
+#modifica lo que ven las demas, ni siquiera corriendo a la vez en otro hilo
+def _copy_environment(base: Environment) -> Environment:
+    env = base.clone()
+    copies: Dict[int, Object] = {}
+    store = env.store
+    for name, value in store.items():
+        store[name] = _copy_value(value, base, env, copies)
+    return env
+
+#copies guarda lo que ya se copio, dos nombres o elementos que apuntan al mismo valor siguen compartiendolo
+def _copy_value(value: Object, base: Environment, env: Environment, copies: Dict[int, Object]) -> Object:
+    copied = copies.get(id(value))
+    if copied is not None:
+        return copied
+
+    value_type = type(value)
+    if value_type == Array:
+        elements: List[Object] = []
+        copied = copies[id(value)] = Array(elements)
+        elements.extend(_copy_value(element, base, env, copies) for element in cast(Array, value).elements)
+    elif value_type == Dictionary:
+        pairs: Dict[Object, Object] = {}
+        copied = copies[id(value)] = Dictionary(pairs)
+        for key, element in cast(Dictionary, value).pairs.items():
+            pairs[key] = _copy_value(element, base, env, copies)
+    elif value_type == Vector:
+        copied = Vector(cast(Vector, value).values.slice(None, None))
+    elif value_type == Transient:
+        copied = Transient(cast(Transient, value).collection.copy())
+    elif value_type == ImmutableList and not is_immutable(value):
+        copied = ImmutableList(PersistentVector.from_iterable(
+            [_copy_value(element, base, env, copies) for element in cast(ImmutableList, value).vector]))
+    elif value_type == ImmutableDictionary and not is_immutable(value):
+        copied = ImmutableDictionary(PersistentMap.from_pairs(
+            [(key, _copy_value(element, base, env, copies)) for key, element in cast(ImmutableDictionary, value).pairs.items()]))
+    elif value_type == Function and cast(Function, value).env is base:
+        copied = _rebind_function(cast(Function, value), env)
+    else:
+        return value
+    copies[id(value)] = copied
+    return copied
+
+#Cada ejecucion tiene su propio cache de memorizar, el resultado puede depender de sus variables
+def _rebind_function(function: Function, env: Environment) -> Function:
+    copied = Function(function.parameters, function.body, env)
+    copied.name = function.name
+    if function.memo is not None:
+        copied.memo = MemoCache(function.memo.maxsize)
+    return copied
+
+#Los enlaces se escriben directo en el diccionario: el entorno es nuevo y ningun cache
+#de identificadores lo conoce todavia
+def _bind_values(env: Environment, bindings: Mapping[str, Any]) -> None:
+    store = env.store
+    for name, value in bindings.items():
+        store[name] = to_kinp(value)
+
+def _output_sink(stdout: Optional[Stdout]) -> OutputSink:
+    if stdout is None:
+        return CaptureSink()
+    elif isinstance(stdout, OutputSink):
+        return stdout
+    return StreamSink(cast(TextIO, stdout))
+
+def _input_source(stdin: Optional[Stdin]) -> InputSource:
+    if stdin is None:
+        return LineSource(())
+    elif type(stdin) == str:
+        return LineSource(cast(str, stdin).splitlines())
+    elif hasattr(stdin, 'read'):
+        return from_stream(cast(TextIO, stdin))
+    return LineSource(cast(Iterable[str], stdin))
+
+def _to_list(values: Any) -> Object:
+    return Array([to_kinp(value) for value in values])
+
+def _to_dictionary(pairs: Dict[Any, Any]) -> Object:
+    converted: Dict[Object, Object] = {}
+    for key, value in pairs.items():
+        kinp_key = to_kinp(key)
+        if not isinstance(kinp_key, HASHABLE_TYPES):
+            raise TypeError(key)
+        converted[kinp_key] = to_kinp(value)
+    return Dictionary(converted)
+
+#Conversion de valores de Python a objetos de Kinp segun el tipo exacto, con una sola busqueda en el diccionario
+_TO_KINP: Dict[type, Callable[[Any], Object]] = {
+    int: Integer,
+    float: Float,
+    str: String,
+    bool: lambda value: TRUE if value else FALSE,
+    type(None): lambda value: NULL,
+    list: _to_list,
+    tuple: _to_list,
+    dict: _to_dictionary,
+    range: Range,
+}
+
+#Los objetos de Kinp pasan tal cual y las funciones de Python se convierten en builtins.
+#Lanza TypeError con cualquier otro valor
+def to_kinp(value: Any) -> Object:
+    converter = _TO_KINP.get(type(value))
+    if converter is not None:
+        return converter(value)
+    elif isinstance(value, Object):
+        return value
+    elif callable(value):
+        return Builtin(fn=_host_function(value))
+    raise TypeError(value)
+
+def _host_function(function: Callable[..., Any]) -> Callable[..., Object]:
+    name = getattr(function, '__name__', repr(function))
+
+    def call(*args: Object) -> Object:
+        try:
+            return to_kinp(function(*[to_python(arg) for arg in args]))
+        except BudgetExceeded:
+            raise
+        except Exception as error:
+            return Error(_HOST_ERROR.format(name, error))
+
+    #El perfilador nombra los builtins por su funcion de Python
+    call.__name__ = name
+    return call
+
+#Las funciones de Kinp y los valores sin equivalente en Python se devuelven como objetos de Kinp
+def to_python(obj: Object) -> Any:
+    object_type = type(obj)
+    if object_type in (Integer, Float, String, Boolean, Range):
+        return cast(Integer, obj).value
+    elif object_type == Null:
+        return None
+    elif object_type == Array:
+        return [to_python(element) for element in cast(Array, obj).elements]
+    elif object_type == ImmutableList:
+        return [to_python(element) for element in cast(ImmutableList, obj).vector]
+    elif object_type == Dictionary:
+        return {to_python(key): to_python(value) for key, value in cast(Dictionary, obj).pairs.items()}
+    elif object_type == ImmutableDictionary:
+        return {to_python(key): to_python(value) for key, value in cast(ImmutableDictionary, obj).pairs.items()}
+    elif object_type == Vector:
+        return list(cast(Vector, obj).values)
+    return obj
@@ -75,6 +75,15 @@ class Lexer:
         elif match(r'^\}$',self._character):
             token = Token(TokenType.RBRACE, self._character)
 
+        elif match(r'^\[$',self._character):
+            token = Token(TokenType.LBRACKET, self._character)
+
+        elif match(r'^\]$',self._character):
+            token = Token(TokenType.RBRACKET, self._character)
+
+        elif match(r'^\:$',self._character):
+            token = Token(TokenType.COLON, self._character)
+
         elif match(r'^\,$',self._character):
             token = Token(TokenType.COMMA, self._character)
 
@@ -93,6 +102,18 @@ class Lexer:
             else:
                 token = Token(TokenType.GT, self._character)
 
+        elif match(r'^&$',self._character):
+            if self._peek_character() == '&':
+                token = self._make_two_character_token(TokenType.AND)
+            else:
+                token = Token(TokenType.ILLEGAL, self._character)
+
+        elif match(r'^\|$',self._character):
+            if self._peek_character() == '|':
+                token = self._make_two_character_token(TokenType.OR)
+            else:
+                token = Token(TokenType.ILLEGAL, self._character)
+
         elif match(r'^!$',self._character):
             if self._peek_character() == '=':
                 token = self._make_two_character_token(TokenType.NOT_EQ)
@@ -112,6 +133,12 @@ class Lexer:
             literal = self._read_string()
             return Token(TokenType.STRING, literal)
 
+        #Un texto que empieza con $ puede tener expresiones entre llaves, el parser las separa
+        elif match(r'^\$$', self._character) and self._peek_character() == '"':
+            self._read_character()
+            literal = self._read_template()
+            return Token(TokenType.TEMPLATE, literal)
+
         else:
             token = Token(TokenType.ILLEGAL, self._character)
 
@@ -176,6 +203,17 @@ class Lexer:
         return self._position
 
 
+    #Como _read_string, pero las comillas dentro de una expresion entre llaves no terminan el texto
+    def _read_template(self) -> str:
+        self._read_character()
+        initial_position = self._position
+        end = template_end(self._source, initial_position)
+        while self._position < end:
+            self._read_character()
+        string = self._source[initial_position:self._position]
+        self._read_character()
+        return string
+
     def _read_string(self) -> str:
         self._read_character()
         initial_position = self._position
@@ -194,4 +232,37 @@ class Lexer:
     #Funcion que me salta los espacios vacios, pues no me representan nada
     def _skip_whitespace(self)->None:
         while match(r'^\s$', self._character):
-            self._read_character()
\ No newline at end of file
+            self._read_character()
+
+#Posicion de la comilla que cierra un texto con expresiones que empieza en start, o el largo del codigo si no
+#se cierra. Sigue la profundidad de las llaves, para que una expresion pueda tener diccionarios o textos adentro
+def template_end(source: str, start: int) -> int:
+    position = start
+    while position < len(source) and source[position] != '"':
+        if source.startswith('{{', position) or source.startswith('}}', position):
+            position += 2
+            continue
+        #Una llave sin cerrar se deja como texto, el parser reporta el error
+        end = placeholder_end(source, position) if source[position] == '{' else -1
+        position = end + 1 if end != -1 else position + 1
+    return min(position, len(source))
+
+#Posicion de la llave que cierra la expresion que abre la llave en start, -1 si no se cierra
+def placeholder_end(source: str, start: int) -> int:
+    depth = 0
+    position = start
+    while position < len(source):
+        character = source[position]
+        if character == '{':
+            depth += 1
+        elif character == '}':
+            depth -= 1
+            if depth == 0:
+                return position
+        elif character == '"':
+            closing = source.find('"', position + 1)
+            if closing == -1:
+                return -1
+            position = closing
+        position += 1
+    return -1
@@ -0,0 +1,187 @@
+from collections import OrderedDict
+from typing import (cast,Dict,Hashable,List,Mapping,Optional,Set,Tuple)
+
+import kp.ast as ast
+from kp.context import DEFAULT_MEMO_SIZE
+from kp.object import (
+    Null,
+    Float,
+    Range,
+    Object,
+    String,
+    Builtin,
+    Integer,
+    Boolean,
+    Function,
+    Environment,
+    ImmutableList,
+    ImmutableDictionary,
+)
+
+#Builtins con efectos, una funcion que los llame nunca es pura.
+#Los que reciben una funcion tambien cuentan, porque no se sabe que funcion van a llamar
+IMPURE_BUILTINS: Set[str] = {
+    'imprimir', 'recibir', 'memorizar', 'anexar', 'borrar', 'mapa', 'filtro', 'reducir',
+    #Con un transitorio, agregar, asociar y quitar lo modifican en su lugar
+    'agregar', 'asociar', 'quitar', 'transitorio', 'persistente',
+}
+
+#Un nombre leido por la funcion: el diccionario donde se encontro, el nombre y el objeto que tenia
+Dependency = Tuple[Mapping, str, object]
+
+#Cache de resultados de una funcion pura, con desalojo del menos usado recientemente (LRU).
+#La pureza depende de a que objetos apuntan los nombres libres del cuerpo, asi que se guardan
+#como dependencias y el cache se vacia cuando alguno cambia o cuando cambia Environment.version
+class MemoCache:
+
+    def __init__(self, maxsize: int = DEFAULT_MEMO_SIZE) -> None:
+        self.maxsize = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self.pure: bool = False
+        self._results: 'OrderedDict[Hashable, Object]' = OrderedDict()
+        self._version: int = -1
+        self._dependencies: List[Dependency] = []
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def clear(self) -> None:
+        self._results.clear()
+
+    #Comprueba que el analisis de pureza siga valido, si no lo repite y vacia los resultados
+    def validate(self, fn: Function, builtins: Mapping[str, Builtin]) -> bool:
+        if self._version == Environment.version:
+            for store, name, value in self._dependencies:
+                if store.get(name) is not value:
+                    break
+            else:
+                return self.pure
+
+        self._version = Environment.version
+        self._results.clear()
+        self._dependencies = []
+        self.pure = _is_pure_function(fn, builtins, self._dependencies, set())
+        return self.pure
+
+    def get(self, key: Hashable) -> Optional[Object]:
+        result = self._results.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._results.move_to_end(key)
+        return result
+
+    #Los resultados que se pueden modificar, como listas o diccionarios, no se guardan: quien los recibe
+    #podria cambiar lo que regresan las siguientes llamadas
+    def put(self, key: Hashable, result: Object) -> None:
+        if not is_immutable(result):
+            return
+        self._results[key] = result
+        if len(self._results) > self.maxsize:
+            self._results.popitem(last=False)
+
+_IMMUTABLE_TYPES = (Integer, Float, String, Boolean, Null, Range, Function, Builtin)
+
+#Un valor que nadie puede modificar, las colecciones inmutables solo si sus elementos tampoco se pueden
+def is_immutable(value: Object) -> bool:
+    value_type = type(value)
+    if value_type in _IMMUTABLE_TYPES:
+        return True
+    elif value_type == ImmutableList:
+        return all(is_immutable(element) for element in cast(ImmutableList, value).vector)
+    elif value_type == ImmutableDictionary:
+        return all(is_immutable(element) for _, element in cast(ImmutableDictionary, value).pairs.items())
+    return False
+
+#Llave del cache a partir de los valores de los argumentos, None si alguno no se puede usar como llave
+def memo_key(args: List[Object]) -> Optional[Hashable]:
+    key = []
+    for arg in args:
+        arg_type = type(arg)
+        if arg_type == Integer or arg_type == Float or arg_type == String or arg_type == Boolean:
+            key.append((arg_type, cast(Integer, arg).value))
+        elif arg_type == Null:
+            key.append((arg_type, None))
+        else:
+            return None
+    return tuple(key)
+
+#Revisa solo el cuerpo de la funcion: no imprimir/recibir, no asignar variables de afuera
+#y no definir funciones internas. No necesita resolver nombres
+def has_pure_body(parameters: List[ast.Identifier], body: ast.Block) -> bool:
+    local = _local_names(parameters, body)
+    for node in ast.walk(body):
+        node_type = type(node)
+        if node_type == ast.Function or node_type == ast.Lambda:
+            return False
+        elif node_type == ast.Infix and cast(ast.Infix, node).operator == '=':
+            left = cast(ast.Infix, node).left
+            if type(left) != ast.Identifier or cast(ast.Identifier, left).value not in local:
+                return False
+        elif node_type == ast.Call:
+            function = cast(ast.Call, node).function
+            if type(function) != ast.Identifier:
+                return False
+            name = cast(ast.Identifier, function).value
+            if name in IMPURE_BUILTINS or name in local:
+                return False
+    return True
+
+def _local_names(parameters: List[ast.Identifier], body: ast.Block) -> Set[str]:
+    names = {param.value for param in parameters}
+    for node in ast.walk(body):
+        if type(node) == ast.LetStatement and cast(ast.LetStatement, node).name is not None:
+            names.add(cast(ast.Identifier, cast(ast.LetStatement, node).name).value)
+        elif type(node) == ast.ForStatement and cast(ast.ForStatement, node).variable is not None:
+            names.add(cast(ast.Identifier, cast(ast.ForStatement, node).variable).value)
+    return names
+
+#Una funcion es pura si su cuerpo lo es, solo lee valores inmutables de afuera y todas las funciones que
+#llama tambien lo son
+def _is_pure_function(fn: Function,
+                      builtins: Mapping[str, Builtin],
+                      dependencies: List[Dependency],
+                      visited: Set[int]) -> bool:
+    if id(fn) in visited:
+        return True
+    visited.add(id(fn))
+
+    if not has_pure_body(fn.parameters, fn.body):
+        return False
+
+    local = _local_names(fn.parameters, fn.body)
+    called: Set[str] = {
+        cast(ast.Identifier, cast(ast.Call, node).function).value
+        for node in ast.walk(fn.body) if type(node) == ast.Call
+    }
+    free: Dict[str, None] = {}
+    for node in ast.walk(fn.body):
+        if type(node) == ast.Identifier and cast(ast.Identifier, node).value not in local:
+            free[cast(ast.Identifier, node).value] = None
+
+    for name in free:
+        store: Optional[Mapping] = fn.env.resolve(name)
+        if store is None:
+            if name not in builtins:
+                #Leer un nombre que no existe termina en un Error, que no se guarda en el cache
+                continue
+            store = builtins
+        value = store[name]
+        dependencies.append((store, name, value))
+
+        #Una lista o diccionario de afuera puede cambiar en su lugar sin que cambie a que objeto apunta el nombre
+        if name not in called:
+            if not is_immutable(value):
+                return False
+            continue
+        if type(value) == Function:
+            if not _is_pure_function(cast(Function, value), builtins, dependencies, visited):
+                return False
+        elif type(value) == Builtin:
+            if name in IMPURE_BUILTINS:
+                return False
+        else:
+            return False
+    return True
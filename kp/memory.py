@@ -0,0 +1,72 @@
+from typing import (Any, Dict, Tuple)
+from weakref import ref
+
+from kp.budget import (MEMORY, BudgetExceeded)
+
+#Cuenta aproximada de la memoria de una ejecucion: los textos (un byte por letra), los bytes de los enteros y los entornos
+#de cada llamada a una funcion, que son los valores que un programa puede hacer crecer sin limite (un texto
+#armado con + en un ciclo, un numero enorme, una cadena de clausuras). Cada valor contado se sigue con una
+#referencia debil, asi al liberarse se descuenta y lo que se mide es la memoria viva, no la total pedida.
+#Los textos y enteros pequeños no se cuentan, revisar cada uno costaria mas que el valor mismo.
+#
+#El medidor se guarda en el kp.context.Context de la ejecucion. Con limit, pasarlo lanza BudgetExceeded,
+#que el evaluador convierte en un Error igual que los demas limites del presupuesto
+
+STRING = 'STRING'
+INTEGER = 'INTEGER'
+ENVIRONMENT = 'ENVIRONMENT'
+
+#Tamaño en bytes desde el que se cuentan los textos y los enteros
+TRACKED_SIZE = 256
+TRACKED_INTEGER = 1 << (8 * TRACKED_SIZE)
+
+_MEMORY_EXCEEDED = 'Poseemos un problema, el programa supero el limite de {} bytes de memoria'
+
+class MemoryMeter:
+    #limit en bytes, 0 es sin limite
+    def __init__(self, limit: int = 0) -> None:
+        self.limit = limit
+        self.used = 0
+        self.peak = 0
+        #Bytes vivos de cada tipo y el maximo al que llego cada uno
+        self.usage: Dict[str, int] = {STRING: 0, INTEGER: 0, ENVIRONMENT: 0}
+        self.peaks: Dict[str, int] = dict(self.usage)
+        #Por el id de cada valor vivo, con su referencia debil. No se usa la referencia como clave porque
+        #su hash es el del valor, y calcularlo uniria las partes de un texto largo
+        self._live: Dict[int, Tuple['ref[Any]', str, int]] = {}
+
+    #Suma size a lo que ocupa obj, que se descuenta completo al liberarse. Un valor que crece en su lugar,
+    #como la lista de partes de un texto largo, se vuelve a contar con solo lo que crecio
+    def track(self, obj: Any, kind: str, size: int) -> None:
+        key = id(obj)
+        entry = self._live.get(key)
+        if entry is None:
+            self._live[key] = (ref(obj, lambda _: self._release(key)), kind, size)
+        else:
+            self._live[key] = (entry[0], kind, entry[2] + size)
+        self.used += size
+        usage = self.usage[kind] + size
+        self.usage[kind] = usage
+        if usage > self.peaks[kind]:
+            self.peaks[kind] = usage
+        if self.used > self.peak:
+            self.peak = self.used
+            if self.limit > 0 and self.used > self.limit:
+                raise BudgetExceeded(MEMORY, _MEMORY_EXCEEDED.format(self.limit))
+
+    def _release(self, key: int) -> None:
+        entry = self._live.pop(key, None)
+        if entry is not None:
+            _, kind, size = entry
+            self.used -= size
+            self.usage[kind] -= size
+
+#Tabla con el maximo de memoria de la ejecucion y el de cada tipo, del mayor al menor
+def report(meter: MemoryMeter) -> str:
+    lines = [f'Memoria maxima: {_megabytes(meter.peak)}']
+    for kind, peak in sorted(meter.peaks.items(), key=lambda item: item[1], reverse=True):
+        lines.append(f'  {kind:12} {_megabytes(peak)}')
+    return '\n'.join(lines)
+
+def _megabytes(size: int) -> str:
+    return f'{size / 2 ** 20:10.2f} MB'
@@ -1,12 +1,33 @@
 from abc import(ABC,abstractmethod)
 from enum import(auto,Enum)
+from itertools import islice
+from sys import getsizeof
 from typing_extensions import Protocol
 
-from typing import (Dict, List)
+from typing import (cast, Any, Dict, List, Optional, TYPE_CHECKING)
 from kp.ast import (
     Block,
     Identifier,
 )
+import kp.context as context
+from kp.bignum import to_decimal
+from kp.memory import (
+    INTEGER,
+    STRING,
+    TRACKED_INTEGER,
+    TRACKED_SIZE,
+)
+from kp.persistent import (
+    PersistentMap,
+    PersistentVector,
+)
+from kp.vector import (
+    BOOLEAN,
+    NumericArray,
+)
+
+if TYPE_CHECKING:
+    from kp.memo import MemoCache
 
 class ObjecType(Enum):
     FUNCTION = auto()
@@ -18,6 +39,13 @@ class ObjecType(Enum):
     ERROR = auto()
     FLOAT = auto()
     NULL = auto()
+    RANGE = auto()
+    LIST = auto()
+    DICTIONARY = auto()
+    IMMUTABLE_LIST = auto()
+    IMMUTABLE_DICTIONARY = auto()
+    TRANSIENT = auto()
+    VECTOR = auto()
 
 
 class Object(ABC):
@@ -30,15 +58,31 @@ class Object(ABC):
     def inspect(self) -> str:
         pass
 
+#Los enteros, decimales, textos y booleanos se comparan y se hashean por su valor para poder
+#usarlos como claves de un Diccionario. Un entero y un decimal con el mismo valor son la misma clave,
+#igual que 1 == 1.0 en Kinp, pero un booleano nunca es igual a un numero
+#Los enteros y textos grandes se cuentan en el medidor de memoria de la ejecucion, si tiene uno
 class Integer(Object):
     def __init__(self, value: int) -> None:
         self.value = value
+        if not -TRACKED_INTEGER < value < TRACKED_INTEGER:
+            meter = context.current().memory
+            if meter is not None:
+                meter.track(self, INTEGER, getsizeof(value))
     
     def type(self) -> ObjecType:
         return ObjecType.INTEGER
 
     def inspect(self) -> str:
-        return str(self.value)
+        return to_decimal(self.value, context.current().max_digits)
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) == Integer or type(other) == Float:
+            return self.value == cast(Integer, other).value
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.value)
 
 class Float(Object):
     def __init__(self, value: float) -> None:
@@ -50,6 +94,14 @@ class Float(Object):
     def inspect(self) -> str:
         return str(self.value)
 
+    def __eq__(self, other: object) -> bool:
+        if type(other) == Float or type(other) == Integer:
+            return self.value == cast(Float, other).value
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
 class Boolean(Object):
     def __init__(self, value: bool) -> None:
         self.value = value
@@ -60,9 +112,82 @@ class Boolean(Object):
     def inspect(self) -> str:
         return 'verdadero' if self.value else 'falso'
 
+    def __eq__(self, other: object) -> bool:
+        if type(other) == Boolean:
+            return self.value == cast(Boolean, other).value
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((ObjecType.BOOLEAN, self.value))
+
+#Largo a partir del cual un texto armado con + guarda sus partes en una lista en lugar de copiarse
+ROPE_THRESHOLD = 1024
+
+#Las partes de los textos largos, una subclase para poder seguirla con una referencia debil
+class _Parts(List[str]):
+    pass
+
+#Un texto largo armado con + no copia sus partes en cada suma, las va agregando a una lista y se une
+#una sola vez, la primera vez que se lee su valor (imprimir, comparar, indexar...).
+#Varios textos comparten la misma lista, cada uno sabe cuantas partes le pertenecen, asi que agregar
+#al final del texto mas reciente cuesta O(1) y sumar a una version anterior copia solo esa version
 class String(Object):
+    value: str
+    _parts: Optional['_Parts'] = None
+    _count: int
+    _length: int
+
     def __init__(self, value: str) -> None:
         self.value = value
+        if len(value) >= TRACKED_SIZE:
+            meter = context.current().memory
+            if meter is not None:
+                meter.track(self, STRING, len(value))
+
+    @staticmethod
+    def concatenate(left: Object, right: Object) -> 'String':
+        right_text = right.inspect()
+        if type(left) == String and cast(String, left)._parts is not None:
+            rope = cast(String, left)
+            parts = cast(_Parts, rope._parts)
+            added = len(right_text)
+            if rope._count != len(parts):
+                parts = _Parts([rope.value])
+                added += rope._length
+            parts.append(right_text)
+            return String._rope(parts, rope._length + len(right_text), added)
+
+        left_text = left.inspect()
+        length = len(left_text) + len(right_text)
+        if length < ROPE_THRESHOLD:
+            return String(left_text + right_text)
+        return String._rope(_Parts([left_text, right_text]), length, length)
+
+    #La memoria se cuenta en la lista de partes y no en cada texto: vive mientras alguna version la use.
+    #added son las letras que se le acaban de agregar
+    @staticmethod
+    def _rope(parts: '_Parts', length: int, added: int) -> 'String':
+        string = String.__new__(String)
+        string._parts = parts
+        string._count = len(parts)
+        string._length = length
+        meter = context.current().memory
+        if meter is not None:
+            meter.track(parts, STRING, added)
+        return string
+
+    #Solo se llama si el texto todavia no tiene value, es decir, si es una lista de partes sin unir
+    def __getattr__(self, name: str) -> Any:
+        if name != 'value' or self._parts is None:
+            raise AttributeError(name)
+        self.value = ''.join(islice(self._parts, self._count))
+        return self.value
+
+    #El largo de una lista de partes se lleva aparte, asi longitud no necesita unirlas
+    def length(self) -> int:
+        if self._parts is not None:
+            return self._length
+        return len(self.value)
 
     def type(self) -> ObjecType:
         return ObjecType.STRING
@@ -70,6 +195,136 @@ class String(Object):
     def inspect(self) -> str:
         return self.value
 
+    def __eq__(self, other: object) -> bool:
+        if type(other) == String:
+            return self.value == cast(String, other).value
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
+#Rango de enteros perezoso, guarda solo el inicio, el final y el paso, nunca la lista de numeros
+class Range(Object):
+    def __init__(self, value: range) -> None:
+        self.value = value
+
+    def type(self) -> ObjecType:
+        return ObjecType.RANGE
+
+    def inspect(self) -> str:
+        return f'rango({self.value.start}, {self.value.stop}, {self.value.step})'
+
+#Lista respaldada por una lista de Python: indice en O(1) y anexar en O(1) amortizado
+class Array(Object):
+    def __init__(self, elements: List[Object]) -> None:
+        self.elements = elements
+
+    def type(self) -> ObjecType:
+        return ObjecType.LIST
+
+    def inspect(self) -> str:
+        return '[{}]'.format(', '.join(element.inspect() for element in self.elements))
+
+    #Dos listas son iguales si tienen los mismos elementos, al ser mutables no se pueden usar como clave
+    def __eq__(self, other: object) -> bool:
+        if type(other) == Array:
+            return self.elements == cast(Array, other).elements
+        return NotImplemented
+
+    __hash__ = None #type: ignore
+
+#Diccionario respaldado por un dict de Python, las claves son los objetos de Kinp que tienen hash
+class Dictionary(Object):
+    def __init__(self, pairs: Dict[Object, Object]) -> None:
+        self.pairs = pairs
+
+    def type(self) -> ObjecType:
+        return ObjecType.DICTIONARY
+
+    def inspect(self) -> str:
+        pairs = ', '.join(f'{key.inspect()}: {value.inspect()}' for key, value in self.pairs.items())
+        return f'{{{pairs}}}'
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) == Dictionary:
+            return self.pairs == cast(Dictionary, other).pairs
+        return NotImplemented
+
+    __hash__ = None #type: ignore
+
+#Lista inmutable, agregar o asociar devuelven una version nueva que comparte nodos con esta
+class ImmutableList(Object):
+    def __init__(self, vector: PersistentVector) -> None:
+        self.vector = vector
+
+    def type(self) -> ObjecType:
+        return ObjecType.IMMUTABLE_LIST
+
+    def inspect(self) -> str:
+        return 'inmutable([{}])'.format(', '.join(element.inspect() for element in self.vector))
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) == ImmutableList:
+            return self.vector == cast(ImmutableList, other).vector
+        return NotImplemented
+
+    __hash__ = None #type: ignore
+
+#Diccionario inmutable, asociar o quitar devuelven una version nueva que comparte nodos con este
+class ImmutableDictionary(Object):
+    def __init__(self, pairs: PersistentMap) -> None:
+        self.pairs = pairs
+
+    def type(self) -> ObjecType:
+        return ObjecType.IMMUTABLE_DICTIONARY
+
+    def inspect(self) -> str:
+        pairs = ', '.join(f'{key.inspect()}: {value.inspect()}' for key, value in self.pairs.items())
+        return f'inmutable({{{pairs}}})'
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) == ImmutableDictionary:
+            return self.pairs == cast(ImmutableDictionary, other).pairs
+        return NotImplemented
+
+    __hash__ = None #type: ignore
+
+#Version transitoria de una coleccion inmutable, se modifica en su lugar hasta llamar a persistente
+class Transient(Object):
+    def __init__(self, collection: Any) -> None:
+        self.collection = collection
+
+    def type(self) -> ObjecType:
+        return ObjecType.TRANSIENT
+
+    def inspect(self) -> str:
+        return 'transitorio'
+
+#Vector numerico tipado, las operaciones aritmeticas y las comparaciones se aplican a todos sus elementos
+class Vector(Object):
+    def __init__(self, values: NumericArray) -> None:
+        self.values = values
+
+    def type(self) -> ObjecType:
+        return ObjecType.VECTOR
+
+    def inspect(self) -> str:
+        if self.values.kind == BOOLEAN:
+            elements = ('verdadero' if value else 'falso' for value in self.values)
+        else:
+            elements = (str(value) for value in self.values)
+        return 'vector([{}])'.format(', '.join(elements))
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) == Vector:
+            return self.values.equals(cast(Vector, other).values)
+        return NotImplemented
+
+    __hash__ = None #type: ignore
+
+#Tipos de objetos que se pueden usar como clave de un Diccionario
+HASHABLE_TYPES = (Integer, Float, String, Boolean)
+
 class Return(Object):
     def __init__(self, value: Object) -> None:
         self.value = value
@@ -91,6 +346,11 @@ class Null(Object):
 class Error(Object):
     def __init__(self, message: str) -> None:
         self.message = message
+        #Las funciones de Kinp activas al crear el error, de la de afuera a la de adentro
+        current = context.current()
+        self.stack: List[str] = [function_name(function) for function in current.stack]
+        if current.tracer is not None:
+            current.tracer.error(self)
 
     def type(self) -> ObjecType:
         return ObjecType.ERROR
@@ -99,10 +359,23 @@ class Error(Object):
         return f'Error: {self.message}'
 
 class Environment(Dict):
+    #Version global de los enlaces, los caches de ast.Identifier la comparan para saber si siguen validos.
+    #Solo cambia cuando un nombre nuevo aparece en el entorno global o tapa a uno global, no al reasignarlo
+    version: int = 0
 
     def __init__(self, outer= None):
         self._store = dict()
         self._outer = outer
+        self._globals = outer._globals if outer is not None else self._store
+
+    @property
+    def store(self) -> Dict:
+        return self._store
+
+    #El diccionario del entorno global al que pertenece este entorno
+    @property
+    def globals(self) -> Dict:
+        return self._globals
 
     def __getitem__(self, key):
         try:
@@ -114,11 +387,29 @@ class Environment(Dict):
             raise e
 
     def __setitem__(self, key, value):
+        if key not in self._store and (self._outer is None or key in self._globals):
+            Environment.version += 1
         self._store[key] = value
 
     def __delitem__(self, key):
+        Environment.version += 1
         del self._store[key]
 
+    #Copia los enlaces de un entorno global en uno nuevo, los valores se comparten entre las dos copias
+    def clone(self) -> 'Environment':
+        env = Environment()
+        env._store.update(self._store)
+        return env
+
+    #Busca el diccionario donde vive el nombre, subiendo por los entornos sin lanzar excepciones
+    def resolve(self, key) -> Optional[Dict]:
+        env = self
+        while env is not None:
+            if key in env._store:
+                return env._store
+            env = env._outer
+        return None
+
 class Function(Object):
 
     def __init__(self,
@@ -128,6 +419,10 @@ class Function(Object):
         self.parameters = parameters
         self.body = body
         self.env = env
+        #Cache de resultados, solo lo tienen las funciones puras que se memorizan
+        self.memo: Optional['MemoCache'] = None
+        #El nombre del metodo o de la primera variable a la que se asigno, para el perfilador
+        self.name: Optional[str] = None
 
     def type(self) -> ObjecType:
         return ObjecType.FUNCTION
@@ -136,6 +431,11 @@ class Function(Object):
         params: str = ', '.join([str(param) for param in self.parameters])
         return 'procedimiento({}) {{\n{}\n}}'.format(params, str(self.body))
 
+ANONYMOUS_FUNCTION = '<procedimiento>'
+
+def function_name(function: Function) -> str:
+    return function.name or ANONYMOUS_FUNCTION
+
 class BuiltinFunction(Protocol):
 
     def __call__(self, *args: Object) -> Object: ...
@@ -0,0 +1,630 @@
+from copy import deepcopy
+from typing import (cast,Dict,List,Optional,Set,Tuple)
+
+import kp.ast as ast
+from kp.evaluator import (
+    NULL,
+    _AND_OPERATORS,
+    _LOGICAL_OPERATORS,
+    _is_truthy,
+    _to_boolean_object,
+    _evaluate_infix_expression,
+    _evaluate_prefix_expression,
+)
+from kp.object import (
+    Float,
+    Object,
+    String,
+    Integer,
+    Boolean,
+)
+from kp.token import (
+    Token,
+    TokenType,
+)
+
+#Limite de bits para plegar una potencia entera, asi el optimizador no se queda calculando
+#numeros gigantes que quizas el programa nunca llega a usar
+_MAX_FOLDED_BITS = 4096
+_MAX_FOLDED_STRING = 4096
+
+#Cuenta todos los nodos del arbol a partir de node
+def count_nodes(node: ast.ASTNode) -> int:
+    return sum(1 for _ in ast.walk(node))
+
+#El optimizador recorre el ast.Program antes de evaluarlo y lo simplifica:
+#pliega las operaciones entre constantes, poda los si con condicion constante
+#y elimina las sentencias que nunca se pueden ejecutar despues de un regresa
+#Si inline_size es mayor que cero, antes expande las funciones pequeñas con el Inliner
+class Optimizer:
+
+    def __init__(self, inline_size: int = 0) -> None:
+        self._removed: int = 0
+        self._inliner = Inliner(inline_size) if inline_size > 0 else None
+
+    #Cantidad de nodos eliminados por el optimizador
+    @property
+    def removed(self) -> int:
+        return self._removed
+
+    #Cantidad de llamadas que fueron reemplazadas por el cuerpo de la funcion
+    @property
+    def inlined(self) -> int:
+        return self._inliner.inlined if self._inliner is not None else 0
+
+    def optimize(self, program: ast.Program) -> ast.Program:
+        if self._inliner is not None:
+            program = self._inliner.inline(program)
+        before = count_nodes(program)
+        program.statements = self._optimize_statements(program.statements)
+        self._removed += before - count_nodes(program)
+        return program
+
+    def _optimize_statements(self, statements: List[ast.Statement]) -> List[ast.Statement]:
+        result: List[ast.Statement] = []
+        for statement in statements:
+            optimized = self._optimize_statement(statement)
+
+            if type(optimized) == ast.ExpressionStatement:
+                expression = cast(ast.ExpressionStatement, optimized).expression
+                #Un si podado deja un bloque que se evalua en el mismo entorno, se puede aplanar
+                if type(expression) == ast.Block and len(cast(ast.Block, expression).statements) > 0:
+                    result.extend(cast(ast.Block, expression).statements)
+                    continue
+                #Un si podado sin si_no queda como nulo, no hace nada a menos que sea el valor final
+                if type(expression) == ast.Null and statement is not statements[-1]:
+                    continue
+
+            result.append(optimized)
+
+        #Todo lo que va despues de un regresa nunca se ejecuta
+        for idx, statement in enumerate(result):
+            if type(statement) == ast.ReturnStatement:
+                return result[:idx + 1]
+        return result
+
+    def _optimize_statement(self, statement: ast.Statement) -> ast.Statement:
+        if type(statement) == ast.ExpressionStatement:
+            statement = cast(ast.ExpressionStatement, statement)
+            if statement.expression is not None:
+                statement.expression = self._optimize_expression(statement.expression)
+        elif type(statement) == ast.LetStatement:
+            statement = cast(ast.LetStatement, statement)
+            if statement.value is not None:
+                statement.value = self._optimize_expression(statement.value)
+        elif type(statement) == ast.ReturnStatement:
+            statement = cast(ast.ReturnStatement, statement)
+            if statement.return_value is not None:
+                statement.return_value = self._optimize_expression(statement.return_value)
+        elif type(statement) == ast.Block:
+            statement = cast(ast.Block, statement)
+            statement.statements = self._optimize_statements(statement.statements)
+        elif type(statement) == ast.WhileStatement:
+            statement = cast(ast.WhileStatement, statement)
+            if statement.condition is not None:
+                statement.condition = self._optimize_expression(statement.condition)
+            if statement.body is not None:
+                statement.body.statements = self._optimize_statements(statement.body.statements)
+        elif type(statement) == ast.ForStatement:
+            statement = cast(ast.ForStatement, statement)
+            if statement.iterable is not None:
+                statement.iterable = self._optimize_expression(statement.iterable)
+            if statement.body is not None:
+                statement.body.statements = self._optimize_statements(statement.body.statements)
+        return statement
+
+    def _optimize_expression(self, expression: ast.Expression) -> ast.Expression:
+        node_type = type(expression)
+
+        if node_type == ast.Prefix:
+            prefix = cast(ast.Prefix, expression)
+            if prefix.right is not None:
+                prefix.right = self._optimize_expression(prefix.right)
+                folded = self._fold_prefix(prefix)
+                if folded is not None:
+                    return folded
+
+        elif node_type == ast.Infix:
+            infix = cast(ast.Infix, expression)
+            if infix.operator != '=':
+                infix.left = self._optimize_expression(infix.left)
+            if infix.right is not None:
+                infix.right = self._optimize_expression(infix.right)
+                folded = self._fold_infix(infix)
+                if folded is not None:
+                    return folded
+
+        elif node_type == ast.If:
+            return self._optimize_if(cast(ast.If, expression))
+
+        elif node_type == ast.Function or node_type == ast.Lambda:
+            function = cast(ast.Lambda, expression)
+            if function.body is not None:
+                function.body.statements = self._optimize_statements(function.body.statements)
+
+        elif node_type == ast.Call:
+            call = cast(ast.Call, expression)
+            call.function = self._optimize_expression(call.function)
+            if call.arguments is not None:
+                call.arguments = [self._optimize_expression(argument) for argument in call.arguments]
+
+        elif node_type == ast.Block:
+            block = cast(ast.Block, expression)
+            block.statements = self._optimize_statements(block.statements)
+
+        elif node_type == ast.TemplateLiteral:
+            return self._optimize_template(cast(ast.TemplateLiteral, expression))
+
+        elif node_type == ast.ListLiteral:
+            list_literal = cast(ast.ListLiteral, expression)
+            if list_literal.elements is not None:
+                list_literal.elements = [self._optimize_expression(element) for element in list_literal.elements]
+
+        elif node_type == ast.DictionaryLiteral:
+            dictionary = cast(ast.DictionaryLiteral, expression)
+            dictionary.keys = [self._optimize_expression(key) for key in dictionary.keys]
+            dictionary.values = [self._optimize_expression(value) for value in dictionary.values]
+
+        elif node_type == ast.Index:
+            index = cast(ast.Index, expression)
+            index.left = self._optimize_expression(index.left)
+            if index.index is not None:
+                index.index = self._optimize_expression(index.index)
+
+        elif node_type == ast.Slice:
+            piece = cast(ast.Slice, expression)
+            piece.left = self._optimize_expression(piece.left)
+            if piece.start is not None:
+                piece.start = self._optimize_expression(piece.start)
+            if piece.end is not None:
+                piece.end = self._optimize_expression(piece.end)
+
+        return expression
+
+    #Si la condicion es constante el si se reemplaza por la rama que se va a ejecutar
+    def _optimize_if(self, if_expression: ast.If) -> ast.Expression:
+        assert if_expression.condition is not None
+        if_expression.condition = self._optimize_expression(if_expression.condition)
+        if if_expression.consecuence is not None:
+            if_expression.consecuence.statements = \
+                self._optimize_statements(if_expression.consecuence.statements)
+        if if_expression.alternative is not None:
+            if_expression.alternative = self._optimize_expression(
+                cast(ast.Expression, if_expression.alternative))
+
+        condition = _to_object(if_expression.condition)
+        if condition is None:
+            return if_expression
+
+        if _is_truthy(condition):
+            return cast(ast.Expression, if_expression.consecuence)
+        elif if_expression.alternative is not None:
+            return cast(ast.Expression, if_expression.alternative)
+        else:
+            return ast.Null(if_expression.token)
+
+    #Las expresiones constantes se pegan al texto, si todas lo son queda un texto normal
+    def _optimize_template(self, template: ast.TemplateLiteral) -> ast.Expression:
+        strings: List[str] = [template.strings[0]]
+        expressions: List[ast.Expression] = []
+        for expression, text in zip(template.expressions, template.strings[1:]):
+            expression = self._optimize_expression(expression)
+            constant = _to_object(expression)
+            if constant is None:
+                expressions.append(expression)
+                strings.append(text)
+            else:
+                strings[-1] += constant.inspect() + text
+
+        if not expressions and len(strings[0]) <= _MAX_FOLDED_STRING:
+            return ast.StringLiteral(Token(TokenType.STRING, strings[0]), strings[0])
+        template.strings = strings
+        template.expressions = expressions
+        return template
+
+    def _fold_infix(self, infix: ast.Infix) -> Optional[ast.Expression]:
+        assert infix.right is not None
+        if infix.operator in _LOGICAL_OPERATORS:
+            return self._fold_logical(infix)
+
+        left = _to_object(infix.left)
+        right = _to_object(infix.right)
+        if left is None or right is None or left is NULL or right is NULL:
+            return None
+        if infix.operator == '**' and _too_big_power(left, right):
+            return None
+
+        try:
+            result = _evaluate_infix_expression(infix.operator, left, right)
+        except (ArithmeticError, ValueError):
+            #Errores como la division por cero se dejan para el momento de la ejecucion
+            return None
+        return _to_literal(result, infix.token)
+
+    #Con el lado izquierdo constante se sabe si el derecho se evalua, y si no, el resultado
+    def _fold_logical(self, infix: ast.Infix) -> Optional[ast.Expression]:
+        assert infix.right is not None
+        left = _to_object(infix.left)
+        if left is None:
+            return None
+
+        is_and = infix.operator in _AND_OPERATORS
+        if is_and != _is_truthy(left):
+            return _to_literal(_to_boolean_object(not is_and), infix.token)
+
+        right = _to_object(infix.right)
+        if right is None:
+            return None
+        return _to_literal(_to_boolean_object(_is_truthy(right)), infix.token)
+
+    def _fold_prefix(self, prefix: ast.Prefix) -> Optional[ast.Expression]:
+        assert prefix.right is not None
+        right = _to_object(prefix.right)
+        if right is None:
+            return None
+        return _to_literal(_evaluate_prefix_expression(prefix.operator, right), prefix.token)
+
+
+def _too_big_power(left: Object, right: Object) -> bool:
+    if type(left) != Integer or type(right) != Integer:
+        return False
+    base = abs(cast(Integer, left).value)
+    exponent = cast(Integer, right).value
+    return base > 1 and exponent * base.bit_length() > _MAX_FOLDED_BITS
+
+#Convierte un literal del ast en el objeto que produciria el evaluador, o None si no es constante
+def _to_object(node: ast.ASTNode) -> Optional[Object]:
+    node_type = type(node)
+    if node_type == ast.Integer:
+        return Integer(cast(ast.Integer, node).value)
+    elif node_type == ast.Float:
+        return Float(cast(ast.Float, node).value)
+    elif node_type == ast.StringLiteral:
+        return String(cast(ast.StringLiteral, node).value)
+    elif node_type == ast.Boolean:
+        return _to_boolean_object(bool(cast(ast.Boolean, node).value))
+    elif node_type == ast.Null:
+        return NULL
+    return None
+
+#Convierte el resultado de una operacion plegada en un literal del ast, los errores no se pliegan
+def _to_literal(obj: Object, token: Token) -> Optional[ast.Expression]:
+    obj_type = type(obj)
+    if obj_type == Integer:
+        value = cast(Integer, obj).value
+        if value.bit_length() > _MAX_FOLDED_BITS:
+            return None
+        return ast.Integer(Token(TokenType.INT, str(value)), value)
+    elif obj_type == Float:
+        value = cast(Float, obj).value
+        return ast.Float(Token(TokenType.FLOAT, str(value)), value)
+    elif obj_type == String:
+        text = cast(String, obj).value
+        if len(text) > _MAX_FOLDED_STRING:
+            return None
+        return ast.StringLiteral(Token(TokenType.STRING, text), text)
+    elif obj_type == Boolean:
+        value = cast(Boolean, obj).value
+        token_type = TokenType.TRUE if value else TokenType.FALSE
+        return ast.Boolean(Token(token_type, obj.inspect()), value)
+    return None
+
+
+#Tamaño maximo por defecto, en nodos, del cuerpo de una funcion que se puede expandir
+DEFAULT_INLINE_SIZE = 40
+
+#Separador de los nombres temporales, el lexer nunca lo acepta en un identificador
+#asi que los nombres generados no pueden chocar con los del programa
+_HYGIENIC_SEPARATOR = '#'
+
+_LITERALS = (ast.Integer, ast.Float, ast.StringLiteral, ast.Boolean)
+_LET_TOKEN = Token(TokenType.LET, 'variable')
+
+#Reemplaza las llamadas a funciones pequeñas, no recursivas y que nunca se reasignan, por su cuerpo.
+#El cuerpo se copia como un bloque que se evalua en el entorno de quien llama: los parametros y
+#las variables locales se renombran con nombres que no pueden existir en el programa, y los
+#regresa finales se convierten en el valor del bloque
+class Inliner:
+
+    def __init__(self, max_size: int = DEFAULT_INLINE_SIZE) -> None:
+        self._max_size = max_size
+        self._inlined: int = 0
+        self._counter: int = 0
+        self._candidates: Dict[str, Tuple[int, ast.Lambda]] = {}
+
+    @property
+    def inlined(self) -> int:
+        return self._inlined
+
+    def inline(self, program: ast.Program) -> ast.Program:
+        self._candidates = self._find_candidates(program)
+        for idx, statement in enumerate(program.statements):
+            self._inline_node(statement, idx, [])
+        return program
+
+    #Busca las funciones definidas en el nivel superior que se pueden expandir
+    def _find_candidates(self, program: ast.Program) -> Dict[str, Tuple[int, ast.Lambda]]:
+        bindings: Dict[str, int] = {}
+        for node in ast.walk(program):
+            for name in _bound_names(node):
+                bindings[name] = bindings.get(name, 0) + 1
+
+        candidates: Dict[str, Tuple[int, ast.Lambda]] = {}
+        for idx, statement in enumerate(program.statements):
+            name: Optional[str] = None
+            function: Optional[ast.ASTNode] = None
+            if type(statement) == ast.ExpressionStatement:
+                function = cast(ast.ExpressionStatement, statement).expression
+                if type(function) == ast.Function and cast(ast.Function, function).name is not None:
+                    name = cast(ast.Identifier, cast(ast.Function, function).name).value
+            elif type(statement) == ast.LetStatement:
+                statement = cast(ast.LetStatement, statement)
+                function = statement.value
+                if type(function) == ast.Lambda and statement.name is not None:
+                    name = statement.name.value
+
+            if name is None or bindings.get(name) != 1:
+                continue
+            function = cast(ast.Lambda, function)
+            if self._can_inline(function, name):
+                candidates[name] = (idx, function)
+        return candidates
+
+    def _can_inline(self, function: ast.Lambda, name: Optional[str]) -> bool:
+        body = function.body
+        if body is None or len(body.statements) == 0:
+            return False
+        if count_nodes(body) > self._max_size:
+            return False
+
+        params = [param.value for param in function.parameters]
+        if len(set(params)) != len(params):
+            return False
+
+        lets: Set[str] = set()
+        for node in ast.walk(body):
+            node_type = type(node)
+            #Las funciones internas capturan el entorno, y las asignaciones y los ciclos para crean variables locales
+            if node_type == ast.Function or node_type == ast.Lambda or node_type == ast.ForStatement:
+                return False
+            if node_type == ast.Infix and cast(ast.Infix, node).operator == '=':
+                return False
+            if node_type == ast.Identifier and cast(ast.Identifier, node).value == name:
+                return False
+            if node_type == ast.LetStatement:
+                let_name = cast(ast.LetStatement, node).name
+                if let_name is None or let_name.value in params or let_name.value in lets:
+                    return False
+                lets.add(let_name.value)
+
+        if not _is_tail_block(body):
+            return False
+        return _reads_after_declaration(body.statements, set(), lets)
+
+    #Recorre el arbol reemplazando las llamadas, scopes guarda los nombres locales de las funciones que encierran el nodo
+    def _inline_node(self, node: ast.ASTNode, top_index: int, scopes: List[Set[str]]) -> None:
+        node_type = type(node)
+        if node_type == ast.Function or node_type == ast.Lambda:
+            function = cast(ast.Lambda, node)
+            scopes = scopes + [_local_names(function)]
+
+        for field in node._fields:
+            child = getattr(node, field)
+            if isinstance(child, list):
+                for idx, item in enumerate(child):
+                    self._inline_node(item, top_index, scopes)
+                    child[idx] = self._inline_call(item, top_index, scopes)
+            elif isinstance(child, ast.ASTNode):
+                self._inline_node(child, top_index, scopes)
+                setattr(node, field, self._inline_call(child, top_index, scopes))
+
+    def _inline_call(self, node: ast.ASTNode, top_index: int, scopes: List[Set[str]]) -> ast.ASTNode:
+        if type(node) != ast.Call:
+            return node
+        call = cast(ast.Call, node)
+        if call.arguments is None:
+            return node
+
+        function: Optional[ast.Lambda] = None
+        if type(call.function) == ast.Lambda:
+            function = cast(ast.Lambda, call.function)
+            if not self._can_inline(function, None):
+                return node
+        elif type(call.function) == ast.Identifier:
+            candidate = self._candidates.get(cast(ast.Identifier, call.function).value)
+            if candidate is None or candidate[0] >= top_index:
+                return node
+            function = candidate[1]
+            #Los nombres libres del cuerpo no pueden quedar tapados por variables de quien llama
+            shadowed: Set[str] = set().union(*scopes)
+            if shadowed & _free_names(function):
+                return node
+        else:
+            return node
+
+        if len(call.arguments) != len(function.parameters):
+            return node
+        self._inlined += 1
+        return self._expand(function, call.arguments, call.token)
+
+    def _expand(self, function: ast.Lambda, arguments: List[ast.Expression], token: Token) -> ast.Block:
+        assert function.body is not None
+        self._counter += 1
+        body = deepcopy(function.body)
+
+        statements: List[ast.Statement] = []
+        replacements: Dict[str, ast.Expression] = {}
+        for param, argument in zip(function.parameters, arguments):
+            if isinstance(argument, _LITERALS):
+                replacements[param.value] = argument
+            else:
+                #Los argumentos se evaluan una sola vez y en orden, igual que en una llamada
+                temporary = self._temporary(param)
+                statements.append(ast.LetStatement(_LET_TOKEN, temporary, argument))
+                replacements[param.value] = temporary
+
+        for node in ast.walk(body):
+            if type(node) == ast.LetStatement:
+                let_statement = cast(ast.LetStatement, node)
+                assert let_statement.name is not None
+                replacements[let_statement.name.value] = self._temporary(let_statement.name)
+
+        _replace_identifiers(body, replacements)
+        statements.extend(_tail_to_value(body).statements)
+        return ast.Block(token, statements)
+
+    def _temporary(self, identifier: ast.Identifier) -> ast.Identifier:
+        name = f'{identifier.value}{_HYGIENIC_SEPARATOR}{self._counter}'
+        return ast.Identifier(Token(TokenType.IDENT, name), name)
+
+
+#Nombres que un nodo enlaza en su entorno
+def _bound_names(node: ast.ASTNode) -> List[str]:
+    node_type = type(node)
+    if node_type == ast.LetStatement and cast(ast.LetStatement, node).name is not None:
+        return [cast(ast.Identifier, cast(ast.LetStatement, node).name).value]
+    elif node_type == ast.Function or node_type == ast.Lambda:
+        function = cast(ast.Function, node)
+        names = [param.value for param in function.parameters]
+        if node_type == ast.Function and function.name is not None:
+            names.append(function.name.value)
+        return names
+    elif node_type == ast.ForStatement and cast(ast.ForStatement, node).variable is not None:
+        return [cast(ast.Identifier, cast(ast.ForStatement, node).variable).value]
+    elif node_type == ast.Infix and cast(ast.Infix, node).operator == '=':
+        left = cast(ast.Infix, node).left
+        if type(left) == ast.Identifier:
+            return [cast(ast.Identifier, left).value]
+    return []
+
+#Nombres locales de una funcion: parametros y todo lo que se define dentro de su cuerpo
+def _local_names(function: ast.Lambda) -> Set[str]:
+    names = {param.value for param in function.parameters}
+    if function.body is not None:
+        for node in ast.walk(function.body):
+            if type(node) != ast.Function and type(node) != ast.Lambda:
+                names.update(_bound_names(node))
+            elif type(node) == ast.Function and cast(ast.Function, node).name is not None:
+                names.add(cast(ast.Identifier, cast(ast.Function, node).name).value)
+    return names
+
+#Nombres que el cuerpo de la funcion lee de los entornos exteriores
+def _free_names(function: ast.Lambda) -> Set[str]:
+    assert function.body is not None
+    local = _local_names(function)
+    return {
+        cast(ast.Identifier, node).value for node in ast.walk(function.body)
+        if type(node) == ast.Identifier and cast(ast.Identifier, node).value not in local
+    }
+
+#Un bloque se puede expandir si sus regresa solo estan al final, o al final de las ramas de un si final
+def _is_tail_block(block: ast.Block) -> bool:
+    if len(block.statements) == 0:
+        return False
+    *body, tail = block.statements
+    for statement in body:
+        if type(statement) == ast.ReturnStatement:
+            return False
+        if any(type(node) == ast.ReturnStatement for node in ast.walk(statement)):
+            return False
+
+    if type(tail) == ast.ReturnStatement:
+        value = cast(ast.ReturnStatement, tail).return_value
+        return value is not None and not any(type(node) == ast.ReturnStatement for node in ast.walk(value))
+    elif type(tail) == ast.ExpressionStatement:
+        expression = cast(ast.ExpressionStatement, tail).expression
+        if type(expression) == ast.If:
+            return _is_tail_if(cast(ast.If, expression))
+        return expression is not None and not any(type(node) == ast.ReturnStatement for node in ast.walk(expression))
+    return False
+
+def _is_tail_if(if_expression: ast.If) -> bool:
+    assert if_expression.condition is not None
+    if any(type(node) == ast.ReturnStatement for node in ast.walk(if_expression.condition)):
+        return False
+    if if_expression.consecuence is None or not _is_tail_block(if_expression.consecuence):
+        return False
+    alternative = if_expression.alternative
+    if type(alternative) == ast.If:
+        return _is_tail_if(cast(ast.If, alternative))
+    elif type(alternative) == ast.Block:
+        return _is_tail_block(cast(ast.Block, alternative))
+    return alternative is None
+
+#Convierte los regresa finales en sentencias de expresion, para que sean el valor del bloque
+def _tail_to_value(block: ast.Block) -> ast.Block:
+    tail = block.statements[-1]
+    if type(tail) == ast.ReturnStatement:
+        tail = cast(ast.ReturnStatement, tail)
+        block.statements[-1] = ast.ExpressionStatement(tail.token, tail.return_value)
+    elif type(tail) == ast.ExpressionStatement and type(cast(ast.ExpressionStatement, tail).expression) == ast.If:
+        if_expression: Optional[ast.ASTNode] = cast(ast.ExpressionStatement, tail).expression
+        while type(if_expression) == ast.If:
+            if_expression = cast(ast.If, if_expression)
+            assert if_expression.consecuence is not None
+            _tail_to_value(if_expression.consecuence)
+            if type(if_expression.alternative) == ast.Block:
+                _tail_to_value(cast(ast.Block, if_expression.alternative))
+            if_expression = if_expression.alternative
+    return block
+
+#Comprueba que ninguna variable local se lea antes de declararse, porque en ese caso
+#la funcion original leeria la variable global y la version renombrada fallaria
+def _reads_after_declaration(statements: List[ast.Statement], declared: Set[str], lets: Set[str]) -> bool:
+    for statement in statements:
+        if not _node_reads_after_declaration(statement, declared, lets):
+            return False
+    return True
+
+def _node_reads_after_declaration(node: ast.ASTNode, declared: Set[str], lets: Set[str]) -> bool:
+    node_type = type(node)
+    if node_type == ast.Identifier:
+        value = cast(ast.Identifier, node).value
+        return value not in lets or value in declared
+    elif node_type == ast.LetStatement:
+        let_statement = cast(ast.LetStatement, node)
+        if let_statement.value is not None and \
+                not _node_reads_after_declaration(let_statement.value, declared, lets):
+            return False
+        assert let_statement.name is not None
+        declared.add(let_statement.name.value)
+        return True
+    elif node_type == ast.If:
+        if_expression = cast(ast.If, node)
+        assert if_expression.condition is not None
+        if not _node_reads_after_declaration(if_expression.condition, declared, lets):
+            return False
+        consecuence = set(declared)
+        alternative = set(declared)
+        if if_expression.consecuence is not None and \
+                not _node_reads_after_declaration(if_expression.consecuence, consecuence, lets):
+            return False
+        if if_expression.alternative is not None and \
+                not _node_reads_after_declaration(if_expression.alternative, alternative, lets):
+            return False
+        #Despues del si solo estan declaradas las variables que ambas ramas declararon
+        declared.update(consecuence & alternative)
+        return True
+
+    for child in ast.iter_child_nodes(node):
+        if not _node_reads_after_declaration(child, declared, lets):
+            return False
+    return True
+
+#Reemplaza los identificadores del arbol por las expresiones dadas
+def _replace_identifiers(node: ast.ASTNode, replacements: Dict[str, ast.Expression]) -> None:
+    for field in node._fields:
+        child = getattr(node, field)
+        if isinstance(child, list):
+            for idx, item in enumerate(child):
+                child[idx] = _replacement(item, replacements)
+                _replace_identifiers(child[idx], replacements)
+        elif isinstance(child, ast.ASTNode):
+            replaced = _replacement(child, replacements)
+            setattr(node, field, replaced)
+            _replace_identifiers(replaced, replacements)
+
+def _replacement(node: ast.ASTNode, replacements: Dict[str, ast.Expression]) -> ast.ASTNode:
+    if type(node) == ast.Identifier and cast(ast.Identifier, node).value in replacements:
+        return deepcopy(replacements[cast(ast.Identifier, node).value])
+    return node
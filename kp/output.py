@@ -0,0 +1,72 @@
+import sys
+from abc import (ABC, abstractmethod)
+from typing import (List, Optional, TextIO)
+
+#Destinos de la salida de imprimir. Llamar a print() por cada linea vacia el buffer de sys.stdout
+#en cada llamada, asi que por defecto las lineas se juntan en memoria y se escriben por bloques:
+#cuando el bloque se llena, antes de recibir y al terminar el programa.
+#El destino de cada ejecucion se guarda en su kp.context.Context
+
+#Tamaño por defecto del bloque, en caracteres
+DEFAULT_BUFFER_SIZE = 64 * 1024
+
+class OutputSink(ABC):
+
+    @abstractmethod
+    def write(self, text: str) -> None:
+        pass
+
+    def flush(self) -> None:
+        pass
+
+#Escribe en un archivo o en la consola. Con buffer_size 0 escribe y vacia en cada linea, como print()
+class StreamSink(OutputSink):
+    def __init__(self, stream: Optional[TextIO] = None, buffer_size: int = DEFAULT_BUFFER_SIZE) -> None:
+        self._stream = stream
+        self._buffer_size = buffer_size
+        self._parts: List[str] = []
+        self._size = 0
+
+    def write(self, text: str) -> None:
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= self._buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        #Sin un archivo propio se usa el sys.stdout del momento, por si alguien lo reemplazo
+        stream = self._stream if self._stream is not None else sys.stdout
+        if self._parts:
+            stream.write(''.join(self._parts))
+            self._parts.clear()
+            self._size = 0
+        stream.flush()
+
+#Guarda la salida en memoria, para usar Kinp desde Python o en las pruebas
+class CaptureSink(OutputSink):
+    def __init__(self) -> None:
+        self._parts: List[str] = []
+
+    def write(self, text: str) -> None:
+        self._parts.append(text)
+
+    def getvalue(self) -> str:
+        return ''.join(self._parts)
+
+    def lines(self) -> List[str]:
+        return self.getvalue().splitlines()
+
+#Descarta la salida, para medir el interprete sin el costo de escribir
+class NullSink(OutputSink):
+    def write(self, text: str) -> None:
+        pass
+
+SINKS = ('bloque', 'linea', 'nula')
+
+#Crea el destino que corresponde a la opcion --salida de main.py
+def from_name(name: str) -> OutputSink:
+    if name == 'linea':
+        return StreamSink(buffer_size=0)
+    elif name == 'nula':
+        return NullSink()
+    return StreamSink()
@@ -1,13 +1,16 @@
 from enum import IntEnum
-from typing import (Callable,Dict,Optional,List)
+from typing import (cast,Callable,Dict,Optional,List)
 
+import kp.context as context
 from kp.ast import (
     If,
     Call,
     Null,
     Float,
     Block,
+    Index,
     Infix,
+    Slice,
     Lambda,
     Prefix,
     Boolean,
@@ -16,14 +19,22 @@ from kp.ast import (
     Function,
     Identifier,
     Expression,
+    ListLiteral,
+    DictionaryLiteral,
     Statement,
+    ForStatement,
     LetStatement,
     StringLiteral,
+    TemplateLiteral,
+    WhileStatement,
     ReturnStatement,
     ExpressionStatement,
 )
-from kp.lexer import Lexer
+from kp.bignum import (DigitLimitError, from_decimal)
+from kp.lexer import (Lexer, placeholder_end)
 from kp.token import(
+    LOGICAL_KEYWORDS,
+    LOOP_KEYWORDS,
     Token,
     TokenType,
 )
@@ -39,16 +50,22 @@ InfixParseFns = Dict[TokenType, InfixParseFn]
 #Enum que contine la precedencia o el orden de las expresiones que se parsean
 class Precedence(IntEnum):
     LOWEST = 1
-    EQUALS = 2
-    LESSGREATER = 3
-    SUM = 4
-    PRODUCT = 5
-    RAISE = 6
-    PREFIX = 7
-    CALL = 8
+    ASSIGN = 2
+    OR = 3
+    AND = 4
+    EQUALS = 5
+    LESSGREATER = 6
+    SUM = 7
+    PRODUCT = 8
+    RAISE = 9
+    PREFIX = 10
+    CALL = 11
+    INDEX = 12
 
 PRECEDENCES: Dict[TokenType,Precedence] = {
-    TokenType.ASSIGN: Precedence.EQUALS,
+    TokenType.ASSIGN: Precedence.ASSIGN,
+    TokenType.OR: Precedence.OR,
+    TokenType.AND: Precedence.AND,
     TokenType.EQ: Precedence.EQUALS,
     TokenType.NOT_EQ: Precedence.EQUALS,
     TokenType.LT: Precedence.LESSGREATER,
@@ -61,6 +78,7 @@ PRECEDENCES: Dict[TokenType,Precedence] = {
     TokenType.MULTIPLICATION: Precedence.PRODUCT,
     TokenType.MOD: Precedence.PRODUCT,
     TokenType.LPAREN: Precedence.CALL,
+    TokenType.LBRACKET: Precedence.INDEX,
     TokenType.RTP: Precedence.RAISE,
 }
 
@@ -72,6 +90,10 @@ class Parser:
         self._lexer = lexer
         self._current_token: Optional[Token] = None
         self._peek_token: Optional[Token] = None
+        #El token despues del peek, solo se lee para decidir si y/o son operadores
+        self._following_token: Optional[Token] = None
+        #El } que cerro el ultimo bloque
+        self._closed_block: Optional[Token] = None
         self._errors: List[str]=[]
 
         self._prefix_parse_fns: PrefixParseFns = self._register_prefix_fns()
@@ -103,13 +125,17 @@ class Parser:
     #Funcion para avanzar tokens
     def _advance_tokens(self)->None:
         self._current_token = self._peek_token
-        self._peek_token = self._lexer.next_token()
+        if self._following_token is not None:
+            self._peek_token = self._following_token
+            self._following_token = None
+        else:
+            self._peek_token = self._lexer.next_token()
 
     #Funcion para obtener la precedencia del token actual
     def _current_precedence(self) -> Precedence:
         assert self._current_token is not None
         try:
-            return PRECEDENCES[self._current_token.token_type]
+            return PRECEDENCES[_infix_token_type(self._current_token)]
         except KeyError:
             return Precedence.LOWEST
 
@@ -153,7 +179,7 @@ class Parser:
         assert self._peek_token is not None
         while not self._peek_token.token_type == TokenType.SEMICOLON and precedence < self._peek_precedence():
             try:
-                infix_parse_fn = self._infix_parse_fns[self._peek_token.token_type]
+                infix_parse_fn = self._infix_parse_fns[self._peek_infix_type()]
                 self._advance_tokens()
                 assert left_expression is not None
                 left_expression = infix_parse_fn(left_expression)
@@ -183,25 +209,84 @@ class Parser:
         return call
 
     def _parse_call_arguments(self) -> Optional[List[Expression]]:
-        arguments: List[Expression] = []
+        return self._parse_expression_list(Token(TokenType.RPAREN,')'))
+
+    #Parsea expresiones separadas por comas hasta encontrar el token de cierre
+    def _parse_expression_list(self, end: Token) -> Optional[List[Expression]]:
+        expressions: List[Expression] = []
 
         assert self._peek_token is not None
-        if self._peek_token.token_type == TokenType.RPAREN:
+        if self._peek_token.token_type == end.token_type:
             self._advance_tokens()
-            return arguments
+            return expressions
         self._advance_tokens()
         if expression:= self._parse_expresion(Precedence.LOWEST):
-            arguments.append(expression)
+            expressions.append(expression)
         
         while self._peek_token.token_type == TokenType.COMMA:
             self._advance_tokens()
             self._advance_tokens()
 
             if expression:= self._parse_expresion(Precedence.LOWEST):
-                arguments.append(expression)
-        if not self._expected_token(Token(TokenType.RPAREN,')')):
+                expressions.append(expression)
+        if not self._expected_token(end):
             return None
-        return arguments
+        return expressions
+
+    def _parse_list_literal(self) -> Optional[ListLiteral]:
+        assert self._current_token is not None
+        list_literal = ListLiteral(token=self._current_token)
+        list_literal.elements = self._parse_expression_list(Token(TokenType.RBRACKET,']'))
+        if list_literal.elements is None:
+            return None
+        return list_literal
+
+    #Parsea {clave: valor, ...}, en una expresion una llave siempre abre un diccionario
+    def _parse_dictionary_literal(self) -> Optional[DictionaryLiteral]:
+        assert self._current_token is not None and self._peek_token is not None
+        dictionary = DictionaryLiteral(token=self._current_token)
+
+        while self._peek_token.token_type != TokenType.RBRACE:
+            self._advance_tokens()
+            key = self._parse_expresion(Precedence.LOWEST)
+            if not self._expected_token(Token(TokenType.COLON,':')):
+                return None
+            self._advance_tokens()
+            value = self._parse_expresion(Precedence.LOWEST)
+            if key is None or value is None:
+                return None
+            dictionary.keys.append(key)
+            dictionary.values.append(value)
+
+            if self._peek_token.token_type != TokenType.RBRACE and \
+                    not self._expected_token(Token(TokenType.COMMA,',')):
+                return None
+
+        if not self._expected_token(Token(TokenType.RBRACE,'}')):
+            return None
+        return dictionary
+
+    #Parsea lista[indice] o una parte lista[inicio:fin], donde inicio y fin son opcionales
+    def _parse_index(self, left: Expression) -> Optional[Expression]:
+        assert self._current_token is not None and self._peek_token is not None
+        token = self._current_token
+        start: Optional[Expression] = None
+        if self._peek_token.token_type != TokenType.COLON:
+            self._advance_tokens()
+            start = self._parse_expresion(Precedence.LOWEST)
+            if self._peek_token.token_type != TokenType.COLON:
+                if not self._expected_token(Token(TokenType.RBRACKET,']')):
+                    return None
+                return Index(token, left, start)
+
+        self._advance_tokens()
+        end: Optional[Expression] = None
+        if self._peek_token.token_type != TokenType.RBRACKET:
+            self._advance_tokens()
+            end = self._parse_expresion(Precedence.LOWEST)
+        if not self._expected_token(Token(TokenType.RBRACKET,']')):
+            return None
+        return Slice(token, left, start, end)
 
     def _parse_function(self) -> Optional[Function]:
         assert self._current_token is not None
@@ -289,6 +374,51 @@ class Parser:
         return StringLiteral(token=self._current_token,
                             value=self._current_token.literal)
 
+    #Separa un texto con llaves en sus pedazos de texto y las expresiones entre llaves,
+    #cada expresion se parsea con otro parser. {{ y }} escriben una llave en el texto
+    def _parse_template_literal(self) -> Optional[Expression]:
+        assert self._current_token is not None
+        literal = self._current_token.literal
+        strings: List[str] = []
+        expressions: List[Expression] = []
+        text: List[str] = []
+        position = 0
+        while position < len(literal):
+            if literal.startswith('{{', position) or literal.startswith('}}', position):
+                text.append(literal[position])
+                position += 2
+            elif literal[position] == '{':
+                end = placeholder_end(literal, position)
+                if end == -1:
+                    self._errors.append(f'Se esperaba un "}}" al final de la expresion en "{literal}"')
+                    return None
+                expression = self._parse_template_expression(literal[position + 1:end])
+                if expression is None:
+                    return None
+                strings.append(''.join(text))
+                expressions.append(expression)
+                text = []
+                position = end + 1
+            else:
+                text.append(literal[position])
+                position += 1
+        strings.append(''.join(text))
+
+        if not expressions:
+            return StringLiteral(token=self._current_token, value=strings[0])
+        return TemplateLiteral(token=self._current_token, strings=strings, expressions=expressions)
+
+    def _parse_template_expression(self, source: str) -> Optional[Expression]:
+        parser = Parser(Lexer(source))
+        program = parser.parse_program()
+        if parser.errors:
+            self._errors.extend(parser.errors)
+            return None
+        if len(program.statements) != 1 or type(program.statements[0]) != ExpressionStatement:
+            self._errors.append(f'Se esperaba una expresion entre llaves, pero se obtuvo "{source}"')
+            return None
+        return cast(ExpressionStatement, program.statements[0]).expression
+
     def _parse_block(self) -> Optional[Block]:
         assert self._current_token is not None
         block_statement = Block(token=self._current_token,
@@ -301,6 +431,7 @@ class Parser:
             if statement:
                 block_statement.statements.append(statement)
             self._advance_tokens()
+        self._closed_block = self._current_token
         return block_statement
 
     def _parse_if(self) -> Optional[If]:
@@ -338,7 +469,11 @@ class Parser:
         assert self._current_token is not None
         integer = Integer(token=self._current_token)
         try:
-            integer.value = int(self._current_token.literal)
+            integer.value = from_decimal(self._current_token.literal, context.current().max_digits)
+        except DigitLimitError as error:
+            message = f'El numero {self._current_token.literal[:20]}... tiene mas de {error.args[0]} digitos'
+            self._errors.append(message)
+            return None
         except ValueError:
             #Si el valor del token no es un numero, agrega el error a la lista de errores
             message = f'No se ha podido parsear {self._current_token.literal} como entero'
@@ -436,6 +571,60 @@ class Parser:
 
         return return_statement
     
+    #Parsea un ciclo mientras (condicion) { cuerpo }
+    def _parse_while_statement(self) -> Optional[WhileStatement]:
+        assert self._current_token is not None
+        while_statement = WhileStatement(token=self._current_token)
+        if not self._expected_token(Token(TokenType.LPAREN,'(')):
+            return None
+        self._advance_tokens()
+        while_statement.condition = self._parse_expresion(Precedence.LOWEST)
+        if not self._expected_token(Token(TokenType.RPAREN,')')):
+            return None
+        if not self._expected_token(Token(TokenType.LBRACE,'{')):
+            return None
+        while_statement.body = self._parse_block()
+        if not self._current_correct_token(Token(TokenType.RBRACE,'}')):
+            return None
+
+        self._skip_semicolon()
+        return while_statement
+
+    #Parsea un ciclo para variable en iterable { cuerpo }
+    def _parse_for_statement(self) -> Optional[ForStatement]:
+        assert self._current_token is not None
+        for_statement = ForStatement(token=self._current_token)
+        if not self._expected_token(Token(TokenType.IDENT,'nombre')):
+            return None
+        for_statement.variable = self._parse_identifier()
+        if not self._expected_loop_keyword(Token(TokenType.IN,'en')):
+            return None
+        self._advance_tokens()
+        for_statement.iterable = self._parse_expresion(Precedence.LOWEST)
+        if not self._expected_token(Token(TokenType.LBRACE,'{')):
+            return None
+        for_statement.body = self._parse_block()
+        if not self._current_correct_token(Token(TokenType.RBRACE,'}')):
+            return None
+
+        self._skip_semicolon()
+        return for_statement
+
+    #Como _expected_token, pero la palabra llega como identificador, ver LOOP_KEYWORDS
+    def _expected_loop_keyword(self, token: Token) -> bool:
+        assert self._peek_token is not None
+        if self._peek_token.token_type == TokenType.IDENT \
+                and LOOP_KEYWORDS.get(self._peek_token.literal) == token.token_type:
+            self._advance_tokens()
+            return True
+        self._expected_token_error(token)
+        return False
+
+    def _skip_semicolon(self) -> None:
+        assert self._peek_token is not None
+        if self._peek_token.token_type == TokenType.SEMICOLON:
+            self._advance_tokens()
+
     #Cuando pasa un token, revisa que tipo de token es, de esta manera entra a una funcion
     def _parse_statement(self) -> Optional[Statement]:
             assert self._current_token is not None
@@ -443,6 +632,10 @@ class Parser:
                 return self._parse_let_statement()
             elif self._current_token.token_type == TokenType.RETURN:
                 return self._parse_return_statement()
+            elif self._current_token.token_type == TokenType.WHILE:
+                return self._parse_while_statement()
+            elif self._current_token.token_type == TokenType.FOR:
+                return self._parse_for_statement()
             elif self._current_token.token_type == TokenType.SCMT:
                 while self._current_token.token_type != TokenType.ECMT:
                     self._advance_tokens()
@@ -457,10 +650,25 @@ class Parser:
     def _peek_precedence(self)->Precedence:
         assert self._peek_token is not None
         try:
-            return PRECEDENCES[self._peek_token.token_type]
+            return PRECEDENCES[self._peek_infix_type()]
         except KeyError:
             return Precedence.LOWEST
 
+    #Tipo del peek token despues de una expresion. y/o son operadores solo si les sigue algo que pueda empezar
+    #una expresion y no vienen justo despues de un bloque, asi "si (a) { } y = 2;" sigue asignando a y
+    def _peek_infix_type(self) -> TokenType:
+        assert self._peek_token is not None
+        token = self._peek_token
+        if token.token_type != TokenType.IDENT or token.literal not in LOGICAL_KEYWORDS:
+            return token.token_type
+        if self._current_token is self._closed_block:
+            return TokenType.IDENT
+        if self._following_token is None:
+            self._following_token = self._lexer.next_token()
+        if self._following_token.token_type not in self._prefix_parse_fns:
+            return TokenType.IDENT
+        return LOGICAL_KEYWORDS[token.literal]
+
     #Un diccionario con todos los tipos de infix y su funcion de parseo
     def _register_infix_fns(self) -> InfixParseFns:
         return {
@@ -477,7 +685,10 @@ class Parser:
             TokenType.GEQT: self._parse_infix_expression,
             TokenType.RTP: self._parse_infix_expression,
             TokenType.LPAREN: self._parse_call,
+            TokenType.LBRACKET: self._parse_index,
             TokenType.ASSIGN: self._parse_infix_expression,
+            TokenType.AND: self._parse_infix_expression,
+            TokenType.OR: self._parse_infix_expression,
         }
 
     #Un diccionario con todos los tipos de prefix y su funcion de parseo
@@ -491,8 +702,17 @@ class Parser:
             TokenType.IF: self._parse_if,
             TokenType.INT: self._parse_integer,
             TokenType.LPAREN: self._parse_grouped_expression,
+            TokenType.LBRACKET: self._parse_list_literal,
+            TokenType.LBRACE: self._parse_dictionary_literal,
             TokenType.LESS: self._parse_prefix_expresion,
             TokenType.NEGATION: self._parse_prefix_expresion,
             TokenType.TRUE: self._parse_boolean,
             TokenType.STRING: self._parse_string_literal,
-        }
\ No newline at end of file
+            TokenType.TEMPLATE: self._parse_template_literal,
+        }
+
+#Tipo del token de un operador ya aceptado, y/o son operadores logicos
+def _infix_token_type(token: Token) -> TokenType:
+    if token.token_type == TokenType.IDENT:
+        return LOGICAL_KEYWORDS.get(token.literal, TokenType.IDENT)
+    return token.token_type
@@ -0,0 +1,507 @@
+from typing import (Any,Hashable,Iterator,List,Optional,Tuple)
+
+#Colecciones persistentes: cada cambio devuelve una version nueva que comparte casi todos sus nodos
+#con la anterior, asi que actualizar cuesta O(log32 n) en lugar de copiar toda la coleccion.
+#Las versiones transitorias modifican en su lugar los nodos que ellas mismas crearon, para construir
+#colecciones grandes de una vez, y se congelan con persistent()
+
+BITS = 5
+WIDTH = 1 << BITS
+MASK = WIDTH - 1
+
+#Valor que devuelven las busquedas cuando la clave no existe
+NOT_FOUND: Any = object()
+
+_TRANSIENT_USED = 'el transitorio ya se convirtio en persistente'
+
+#Un nodo pertenece a la version transitoria cuyo edit es el mismo objeto, solo ella lo puede modificar
+class _Node:
+    __slots__ = ('edit', 'array')
+
+    def __init__(self, edit: Optional[object], array: List[Any]) -> None:
+        self.edit = edit
+        self.array = array
+
+_EMPTY_NODE = _Node(None, [])
+
+
+#Vector persistente: un arbol de 32 ramas por nivel mas una cola con los ultimos 32 elementos,
+#agregar al final casi siempre solo copia la cola
+class PersistentVector:
+    __slots__ = ('_count', '_shift', '_root', '_tail')
+
+    def __init__(self,
+                count: int = 0,
+                shift: int = BITS,
+                root: _Node = _EMPTY_NODE,
+                tail: Optional[List[Any]] = None) -> None:
+        self._count = count
+        self._shift = shift
+        self._root = root
+        self._tail = tail if tail is not None else []
+
+    @staticmethod
+    def from_iterable(values: Any) -> 'PersistentVector':
+        transient = TransientVector(EMPTY_VECTOR)
+        for value in values:
+            transient.append(value)
+        return transient.persistent()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[Any]:
+        tail_offset = _tail_offset(self._count)
+        for start in range(0, tail_offset, WIDTH):
+            yield from _leaf_for(self._root, self._shift, start)
+        yield from self._tail
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PersistentVector):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None #type: ignore
+
+    def get(self, index: int) -> Any:
+        if not 0 <= index < self._count:
+            raise IndexError(index, self._count)
+        if index >= _tail_offset(self._count):
+            return self._tail[index & MASK]
+        return _leaf_for(self._root, self._shift, index)[index & MASK]
+
+    def append(self, value: Any) -> 'PersistentVector':
+        if self._count - _tail_offset(self._count) < WIDTH:
+            return PersistentVector(self._count + 1, self._shift, self._root, self._tail + [value])
+
+        tail_node = _Node(None, self._tail)
+        shift = self._shift
+        if (self._count >> BITS) > (1 << self._shift):
+            root = _Node(None, [self._root, _new_path(None, self._shift, tail_node)])
+            shift += BITS
+        else:
+            root = _push_tail(None, self._count, self._shift, self._root, tail_node)
+        return PersistentVector(self._count + 1, shift, root, [value])
+
+    #Reemplaza el elemento en index, o lo agrega al final si index es la longitud
+    def set(self, index: int, value: Any) -> 'PersistentVector':
+        if index == self._count:
+            return self.append(value)
+        if not 0 <= index < self._count:
+            raise IndexError(index, self._count)
+        if index >= _tail_offset(self._count):
+            tail = list(self._tail)
+            tail[index & MASK] = value
+            return PersistentVector(self._count, self._shift, self._root, tail)
+        root = _assoc_in(None, self._shift, self._root, index, value)
+        return PersistentVector(self._count, self._shift, root, self._tail)
+
+    def transient(self) -> 'TransientVector':
+        return TransientVector(self)
+
+EMPTY_VECTOR = PersistentVector()
+
+
+class TransientVector:
+
+    def __init__(self, vector: PersistentVector) -> None:
+        self._edit: Optional[object] = object()
+        self._count = vector._count
+        self._shift = vector._shift
+        self._root = _Node(self._edit, list(vector._root.array))
+        self._tail = list(vector._tail)
+
+    def __len__(self) -> int:
+        self._ensure_editable()
+        return self._count
+
+    def get(self, index: int) -> Any:
+        self._ensure_editable()
+        if not 0 <= index < self._count:
+            raise IndexError(index, self._count)
+        if index >= _tail_offset(self._count):
+            return self._tail[index & MASK]
+        return _leaf_for(self._root, self._shift, index)[index & MASK]
+
+    def append(self, value: Any) -> 'TransientVector':
+        self._ensure_editable()
+        if self._count - _tail_offset(self._count) < WIDTH:
+            self._tail.append(value)
+            self._count += 1
+            return self
+
+        tail_node = _Node(self._edit, self._tail)
+        self._tail = [value]
+        if (self._count >> BITS) > (1 << self._shift):
+            self._root = _Node(self._edit, [self._root, _new_path(self._edit, self._shift, tail_node)])
+            self._shift += BITS
+        else:
+            self._root = _push_tail(self._edit, self._count, self._shift, self._root, tail_node)
+        self._count += 1
+        return self
+
+    def set(self, index: int, value: Any) -> 'TransientVector':
+        self._ensure_editable()
+        if index == self._count:
+            return self.append(value)
+        if not 0 <= index < self._count:
+            raise IndexError(index, self._count)
+        if index >= _tail_offset(self._count):
+            self._tail[index & MASK] = value
+        else:
+            self._root = _assoc_in(self._edit, self._shift, self._root, index, value)
+        return self
+
+    #Un transitorio nuevo con los mismos valores. Los nodos pasan a ser compartidos, asi que este tambien
+    #cambia de marca de edicion y los dos copian un nodo antes de modificarlo
+    def copy(self) -> 'TransientVector':
+        if self._edit is None:
+            return self
+        self._edit = object()
+        return PersistentVector(self._count, self._shift, self._root, list(self._tail)).transient()
+
+    #Congela el transitorio, despues de esto ya no se puede modificar
+    def persistent(self) -> PersistentVector:
+        self._ensure_editable()
+        self._edit = None
+        return PersistentVector(self._count, self._shift, self._root, list(self._tail))
+
+    def _ensure_editable(self) -> None:
+        if self._edit is None:
+            raise RuntimeError(_TRANSIENT_USED)
+
+
+def _tail_offset(count: int) -> int:
+    if count < WIDTH:
+        return 0
+    return ((count - 1) >> BITS) << BITS
+
+#Devuelve la hoja de 32 elementos que contiene index
+def _leaf_for(root: _Node, shift: int, index: int) -> List[Any]:
+    node = root
+    level = shift
+    while level > 0:
+        node = node.array[(index >> level) & MASK]
+        level -= BITS
+    return node.array
+
+def _editable(edit: Optional[object], node: _Node) -> _Node:
+    if edit is not None and node.edit is edit:
+        return node
+    return _Node(edit, list(node.array))
+
+def _new_path(edit: Optional[object], level: int, node: _Node) -> _Node:
+    while level > 0:
+        node = _Node(edit, [node])
+        level -= BITS
+    return node
+
+def _push_tail(edit: Optional[object], count: int, level: int, parent: _Node, tail_node: _Node) -> _Node:
+    result = _editable(edit, parent)
+    sub_index = ((count - 1) >> level) & MASK
+    if level == BITS:
+        inserted = tail_node
+    elif sub_index < len(parent.array):
+        inserted = _push_tail(edit, count, level - BITS, parent.array[sub_index], tail_node)
+    else:
+        inserted = _new_path(edit, level - BITS, tail_node)
+
+    if sub_index < len(result.array):
+        result.array[sub_index] = inserted
+    else:
+        result.array.append(inserted)
+    return result
+
+def _assoc_in(edit: Optional[object], level: int, node: _Node, index: int, value: Any) -> _Node:
+    result = _editable(edit, node)
+    if level == 0:
+        result.array[index & MASK] = value
+    else:
+        sub_index = (index >> level) & MASK
+        result.array[sub_index] = _assoc_in(edit, level - BITS, node.array[sub_index], index, value)
+    return result
+
+
+#Mapa persistente: un trie de hashes (HAMT) donde cada nivel usa 5 bits del hash.
+#Cada nodo guarda un bitmap con las ramas que existen y un arreglo compacto [clave, valor, ...],
+#cuando la clave es None el valor es un nodo hijo
+class PersistentMap:
+    __slots__ = ('_count', '_root')
+
+    def __init__(self, count: int = 0, root: Optional['_BitmapNode'] = None) -> None:
+        self._count = count
+        self._root = root if root is not None else _EMPTY_BITMAP
+
+    @staticmethod
+    def from_pairs(pairs: Any) -> 'PersistentMap':
+        transient = TransientMap(EMPTY_MAP)
+        for key, value in pairs:
+            transient.set(key, value)
+        return transient.persistent()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[Hashable]:
+        for key, _ in self._root.items():
+            yield key
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key) is not NOT_FOUND
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PersistentMap):
+            return NotImplemented
+        if len(self) != len(other):
+            return False
+        for key, value in self.items():
+            if other.get(key) != value:
+                return False
+        return True
+
+    __hash__ = None #type: ignore
+
+    def items(self) -> Iterator[Tuple[Hashable, Any]]:
+        return self._root.items()
+
+    def get(self, key: Hashable, default: Any = NOT_FOUND) -> Any:
+        return self._root.find(0, _hash(key), key, default)
+
+    def set(self, key: Hashable, value: Any) -> 'PersistentMap':
+        added = [False]
+        root = self._root.assoc(None, 0, _hash(key), key, value, added)
+        if root is self._root:
+            return self
+        return PersistentMap(self._count + 1 if added[0] else self._count, root)
+
+    def delete(self, key: Hashable) -> 'PersistentMap':
+        removed = [False]
+        root = self._root.without(None, 0, _hash(key), key, removed)
+        if not removed[0]:
+            return self
+        return PersistentMap(self._count - 1, root)
+
+    def transient(self) -> 'TransientMap':
+        return TransientMap(self)
+
+
+class TransientMap:
+
+    def __init__(self, persistent_map: PersistentMap) -> None:
+        self._edit: Optional[object] = object()
+        self._count = persistent_map._count
+        self._root = persistent_map._root
+
+    def __len__(self) -> int:
+        self._ensure_editable()
+        return self._count
+
+    def get(self, key: Hashable, default: Any = NOT_FOUND) -> Any:
+        self._ensure_editable()
+        return self._root.find(0, _hash(key), key, default)
+
+    def set(self, key: Hashable, value: Any) -> 'TransientMap':
+        self._ensure_editable()
+        added = [False]
+        self._root = self._root.assoc(self._edit, 0, _hash(key), key, value, added)
+        if added[0]:
+            self._count += 1
+        return self
+
+    def delete(self, key: Hashable) -> 'TransientMap':
+        self._ensure_editable()
+        removed = [False]
+        self._root = self._root.without(self._edit, 0, _hash(key), key, removed)
+        if removed[0]:
+            self._count -= 1
+        return self
+
+    def copy(self) -> 'TransientMap':
+        if self._edit is None:
+            return self
+        self._edit = object()
+        return PersistentMap(self._count, self._root).transient()
+
+    def persistent(self) -> PersistentMap:
+        self._ensure_editable()
+        self._edit = None
+        return PersistentMap(self._count, self._root)
+
+    def _ensure_editable(self) -> None:
+        if self._edit is None:
+            raise RuntimeError(_TRANSIENT_USED)
+
+
+#Se usan 32 bits del hash, 7 niveles de 5 bits alcanzan para separar cualquier par de hashes distintos
+def _hash(key: Hashable) -> int:
+    return hash(key) & 0xFFFFFFFF
+
+def _bit_index(bitmap: int, bit: int) -> int:
+    return bin(bitmap & (bit - 1)).count('1')
+
+class _BitmapNode:
+    __slots__ = ('edit', 'bitmap', 'array')
+
+    def __init__(self, edit: Optional[object], bitmap: int, array: List[Any]) -> None:
+        self.edit = edit
+        self.bitmap = bitmap
+        self.array = array
+
+    def items(self) -> Iterator[Tuple[Hashable, Any]]:
+        array = self.array
+        for idx in range(0, len(array), 2):
+            if array[idx] is None:
+                yield from array[idx + 1].items()
+            else:
+                yield array[idx], array[idx + 1]
+
+    def find(self, shift: int, key_hash: int, key: Hashable, default: Any) -> Any:
+        node: Any = self
+        while type(node) == _BitmapNode:
+            bit = 1 << ((key_hash >> shift) & MASK)
+            if not node.bitmap & bit:
+                return default
+            idx = 2 * _bit_index(node.bitmap, bit)
+            current = node.array[idx]
+            if current is None:
+                node = node.array[idx + 1]
+                shift += BITS
+            elif current == key:
+                return node.array[idx + 1]
+            else:
+                return default
+        return node.find(shift, key_hash, key, default)
+
+    def assoc(self, edit: Optional[object], shift: int, key_hash: int,
+              key: Hashable, value: Any, added: List[bool]) -> '_BitmapNode':
+        bit = 1 << ((key_hash >> shift) & MASK)
+        idx = 2 * _bit_index(self.bitmap, bit)
+
+        if not self.bitmap & bit:
+            added[0] = True
+            if self._is_editable(edit):
+                self.array[idx:idx] = [key, value]
+                self.bitmap |= bit
+                return self
+            return _BitmapNode(edit, self.bitmap | bit, self.array[:idx] + [key, value] + self.array[idx:])
+
+        current_key = self.array[idx]
+        current_value = self.array[idx + 1]
+        if current_key is None:
+            child = current_value.assoc(edit, shift + BITS, key_hash, key, value, added)
+            if child is current_value:
+                return self
+            return self._edit_and_set(edit, idx + 1, child)
+        if current_key == key:
+            if current_value is value:
+                return self
+            return self._edit_and_set(edit, idx + 1, value)
+
+        added[0] = True
+        child = _create_node(edit, shift + BITS, current_key, current_value, key_hash, key, value)
+        result = self._edit_and_set(edit, idx, None)
+        result.array[idx + 1] = child
+        return result
+
+    def without(self, edit: Optional[object], shift: int, key_hash: int,
+                key: Hashable, removed: List[bool]) -> '_BitmapNode':
+        bit = 1 << ((key_hash >> shift) & MASK)
+        if not self.bitmap & bit:
+            return self
+        idx = 2 * _bit_index(self.bitmap, bit)
+
+        current_key = self.array[idx]
+        current_value = self.array[idx + 1]
+        if current_key is None:
+            child = current_value.without(edit, shift + BITS, key_hash, key, removed)
+            if child is current_value:
+                return self
+            if len(child.array) > 0:
+                return self._edit_and_set(edit, idx + 1, child)
+        elif current_key == key:
+            removed[0] = True
+        else:
+            return self
+
+        #Se quita el par o el hijo que quedo vacio
+        if self._is_editable(edit):
+            del self.array[idx:idx + 2]
+            self.bitmap ^= bit
+            return self
+        return _BitmapNode(edit, self.bitmap ^ bit, self.array[:idx] + self.array[idx + 2:])
+
+    def _is_editable(self, edit: Optional[object]) -> bool:
+        return edit is not None and self.edit is edit
+
+    def _edit_and_set(self, edit: Optional[object], idx: int, value: Any) -> '_BitmapNode':
+        if self._is_editable(edit):
+            node = self
+        else:
+            node = _BitmapNode(edit, self.bitmap, list(self.array))
+        node.array[idx] = value
+        return node
+
+_EMPTY_BITMAP = _BitmapNode(None, 0, [])
+
+#Nodo para claves distintas con exactamente el mismo hash, se buscan una por una
+class _CollisionNode:
+    __slots__ = ('edit', 'key_hash', 'array')
+
+    def __init__(self, edit: Optional[object], key_hash: int, array: List[Any]) -> None:
+        self.edit = edit
+        self.key_hash = key_hash
+        self.array = array
+
+    def items(self) -> Iterator[Tuple[Hashable, Any]]:
+        for idx in range(0, len(self.array), 2):
+            yield self.array[idx], self.array[idx + 1]
+
+    def find(self, shift: int, key_hash: int, key: Hashable, default: Any) -> Any:
+        idx = self._find_index(key)
+        return self.array[idx + 1] if idx >= 0 else default
+
+    def assoc(self, edit: Optional[object], shift: int, key_hash: int,
+              key: Hashable, value: Any, added: List[bool]) -> Any:
+        if key_hash != self.key_hash:
+            #Una clave con otro hash: este nodo baja un nivel dentro de un nodo normal
+            bit = 1 << ((self.key_hash >> shift) & MASK)
+            parent = _BitmapNode(edit, bit, [None, self])
+            return parent.assoc(edit, shift, key_hash, key, value, added)
+
+        idx = self._find_index(key)
+        if idx >= 0:
+            if self.array[idx + 1] is value:
+                return self
+            array = list(self.array)
+            array[idx + 1] = value
+        else:
+            added[0] = True
+            array = self.array + [key, value]
+        return _CollisionNode(edit, self.key_hash, array)
+
+    def without(self, edit: Optional[object], shift: int, key_hash: int,
+                key: Hashable, removed: List[bool]) -> Any:
+        idx = self._find_index(key)
+        if idx < 0:
+            return self
+        removed[0] = True
+        return _CollisionNode(edit, self.key_hash, self.array[:idx] + self.array[idx + 2:])
+
+    def _find_index(self, key: Hashable) -> int:
+        for idx in range(0, len(self.array), 2):
+            if self.array[idx] == key:
+                return idx
+        return -1
+
+def _create_node(edit: Optional[object], shift: int,
+                 first_key: Hashable, first_value: Any,
+                 second_hash: int, second_key: Hashable, second_value: Any) -> Any:
+    first_hash = _hash(first_key)
+    if first_hash == second_hash:
+        return _CollisionNode(edit, first_hash, [first_key, first_value, second_key, second_value])
+    added = [False]
+    node = _BitmapNode(edit, 0, [])
+    node = node.assoc(edit, shift, first_hash, first_key, first_value, added)
+    return node.assoc(edit, shift, second_hash, second_key, second_value, added)
+
+EMPTY_MAP = PersistentMap()
@@ -0,0 +1,161 @@
+import marshal
+import os
+from contextlib import contextmanager
+from threading import Lock
+from time import perf_counter
+from typing import (cast, Dict, Iterator, List, Optional, Tuple)
+
+import kp.context as context
+import kp.evaluator as evaluator
+from kp.object import (
+    ANONYMOUS_FUNCTION,
+    Builtin,
+    Function,
+    Object,
+    function_name,
+)
+
+#Perfilador determinista: cuenta cada llamada a una funcion de Kinp o a un builtin, con su tiempo
+#inclusivo (con las funciones que llama) y exclusivo (sin ellas) y la profundidad maxima de recursion.
+#Las funciones se nombran por su metodo o por la variable a la que se asignaron.
+#
+#Para no costar nada mientras nadie perfila, el evaluador no revisa nada: installed() cambia
+#evaluator._apply_function por _profiled_apply mientras haya alguna ejecucion perfilando, y esa version
+#busca el Profiler en el kp.context.Context activo, asi las ejecuciones de otros hilos sin perfilador
+#solo pagan esa busqueda mientras dure
+
+#Nombre de archivo en los reportes de pstats y callgrind cuando no se da el del programa
+_PROGRAM_FILE = '<kinp>'
+
+_TABLE_HEADER = '{:>10} {:>12} {:>12} {:>12} {:>11}  {}'
+_TABLE_ROW = '{:>10,} {:>12.6f} {:>12.6f} {:>12.6f} {:>11}  {}'
+
+class FunctionStats:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.calls = 0
+        #Llamadas que no estaban dentro de otra llamada a la misma funcion
+        self.primitive_calls = 0
+        self.inclusive = 0.0
+        self.exclusive = 0.0
+        self.depth = 0
+        self.max_depth = 0
+        #Cuantas veces la llamo cada funcion, y el tiempo inclusivo de esas llamadas
+        self.callers: Dict[str, int] = {}
+        self.callees: Dict[str, List[float]] = {}
+
+class Profiler:
+    def __init__(self) -> None:
+        self.stats: Dict[str, FunctionStats] = {}
+        #Una entrada por llamada en curso: la funcion y el tiempo de las llamadas que hizo
+        self._stack: List[Tuple[FunctionStats, List[float]]] = []
+
+    def call(self, fn: Object, args: List[Object]) -> Object:
+        name = _name(fn)
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = FunctionStats(name)
+        caller = self._stack[-1][0] if self._stack else None
+        if caller is not None:
+            stats.callers[caller.name] = stats.callers.get(caller.name, 0) + 1
+        stats.calls += 1
+        stats.depth += 1
+        if stats.depth == 1:
+            stats.primitive_calls += 1
+        if stats.depth > stats.max_depth:
+            stats.max_depth = stats.depth
+
+        children = [0.0]
+        self._stack.append((stats, children))
+        start = perf_counter()
+        try:
+            return _apply_function(fn, args)
+        finally:
+            elapsed = perf_counter() - start
+            self._stack.pop()
+            stats.depth -= 1
+            stats.exclusive += elapsed - children[0]
+            #Como en cProfile, el tiempo inclusivo de una recursion se cuenta solo en la llamada de afuera
+            if stats.depth == 0:
+                stats.inclusive += elapsed
+            if caller is not None:
+                self._stack[-1][1][0] += elapsed
+                edge = caller.callees.setdefault(name, [0, 0.0])
+                edge[0] += 1
+                edge[1] += elapsed
+
+    #Tabla ordenada por tiempo exclusivo, de la funcion mas costosa a la menos
+    def table(self, limit: Optional[int] = None) -> str:
+        rows = sorted(self.stats.values(), key=lambda stats: stats.exclusive, reverse=True)
+        lines = [_TABLE_HEADER.format('llamadas', 'total (s)', 'propio (s)', 'por llamada', 'profundidad', 'funcion')]
+        for stats in rows[:limit]:
+            lines.append(_TABLE_ROW.format(stats.calls, stats.inclusive, stats.exclusive,
+                                           stats.exclusive / stats.calls, stats.max_depth, stats.name))
+        return '\n'.join(lines)
+
+    #Con un nombre como callgrind.out.kinp escribe el formato de callgrind, si no el de pstats
+    def save(self, path: str, filename: str = _PROGRAM_FILE) -> None:
+        if os.path.basename(path).startswith('callgrind.out'):
+            self.dump_callgrind(path, filename)
+        else:
+            self.dump_stats(path, filename)
+
+    #El formato de marshal que lee pstats.Stats, como el de cProfile
+    def dump_stats(self, path: str, filename: str = _PROGRAM_FILE) -> None:
+        key = lambda name: (filename, 0, name)
+        stats = {
+            key(name): (entry.primitive_calls, entry.calls, entry.exclusive, entry.inclusive,
+                        {key(caller): count for caller, count in entry.callers.items()})
+            for name, entry in self.stats.items()
+        }
+        with open(path, mode='wb') as file:
+            marshal.dump(stats, file)
+
+    #Formato de texto de callgrind para KCachegrind, los tiempos en microsegundos
+    def dump_callgrind(self, path: str, filename: str = _PROGRAM_FILE) -> None:
+        lines = ['# callgrind format', 'version: 1', 'creator: kinp', 'events: Microsegundos', f'fl={filename}']
+        for name, entry in self.stats.items():
+            lines.append(f'fn={name}')
+            lines.append(f'0 {round(entry.exclusive * 1e6)}')
+            for callee, (calls, elapsed) in entry.callees.items():
+                lines.append(f'cfn={callee}')
+                lines.append(f'calls={calls} 0')
+                lines.append(f'0 {round(elapsed * 1e6)}')
+        with open(path, mode='w', encoding='utf-8') as file:
+            file.write('\n'.join(lines) + '\n')
+
+def _name(fn: Object) -> str:
+    if type(fn) == Function:
+        return function_name(cast(Function, fn))
+    elif type(fn) == Builtin:
+        return getattr(cast(Builtin, fn).fn, '__name__', ANONYMOUS_FUNCTION)
+    return fn.type().name
+
+#La version sin instrumentar, la que usa el evaluador mientras nadie perfila
+_apply_function = evaluator._apply_function
+
+def _profiled_apply(fn: Object, args: List[Object]) -> Object:
+    profiler = context.current().profiler
+    if profiler is None:
+        return _apply_function(fn, args)
+    return profiler.call(fn, args)
+
+_lock = Lock()
+_installed = 0
+
+#Mientras dure el bloque with las llamadas pasan por el Profiler del contexto activo, si hay uno
+@contextmanager
+def installed() -> Iterator[None]:
+    global _installed
+    with _lock:
+        _installed += 1
+        #Con kp.trace.installed() activo su version ya pasa por _profiled_apply
+        if evaluator._apply_function is _apply_function:
+            evaluator._apply_function = _profiled_apply
+    try:
+        yield
+    finally:
+        with _lock:
+            _installed -= 1
+            if _installed == 0 and evaluator._apply_function is _profiled_apply:
+                evaluator._apply_function = _apply_function
@@ -1,5 +1,7 @@
+import sys
 from typing import List
 
+import kp.context as context
 from kp.ast import Program
 from kp.lexer import Lexer
 from kp.parser import Parser
@@ -9,10 +11,13 @@ from kp.token import (
 )
 from kp.evaluator import evaluate
 from kp.object import (Environment, Error)
+from kp.optimizer import (DEFAULT_INLINE_SIZE, Optimizer)
+from kp.stack import format_traceback
 
 EOF_TOKEN: Token = Token(TokenType.EOF,'')
 
 _FILENOTFOUND = 'Poseemos un problema, no se encontro el archivo {}'
+_OPTIMIZED = 'Optimizador: se eliminaron {} nodos y se expandieron {} llamadas'
 
 #Imprimir los errores en pantalla
 def _print_parse_errors(errors: List[str]):
@@ -20,7 +25,8 @@ def _print_parse_errors(errors: List[str]):
         print(error)
 
 #Iniciar todos los elementos necesarios apartir del input, y de esta manera correr el programa
-def star_repl(source: str, scanned: List[str]) -> None:
+def star_repl(source: str, scanned: List[str], optimize: bool = False,
+              inline_size: int = DEFAULT_INLINE_SIZE) -> None:
     scanned.append(source)
     lexer: Lexer = Lexer(' '.join(scanned))
     parser: Parser = Parser(lexer)
@@ -30,27 +36,40 @@ def star_repl(source: str, scanned: List[str]) -> None:
         _print_parse_errors(parser.errors)
         return
 
-    evaluated = evaluate(program,env)
+    if optimize:
+        optimizer = Optimizer(inline_size)
+        program = optimizer.optimize(program)
+        print(_OPTIMIZED.format(optimizer.removed, optimizer.inlined), file=sys.stderr)
+
+    #La salida de imprimir se escribe por bloques, se vacia al terminar aunque el programa falle
+    try:
+        evaluated = evaluate(program,env)
+    finally:
+        context.flush()
     #assert evaluated is not None
     if type(evaluated) == Error:
+        #Si el error ocurrio dentro de funciones, primero las llamadas que llevaron a el
+        traceback = format_traceback(evaluated)
+        if traceback != '':
+            print(traceback)
         print(evaluated.inspect())
 
 #Cuando se use la consola poder ejecutar codigo hasta que se utilize salir()
-def loop_evaluator() -> None:
+def loop_evaluator(optimize: bool = False, inline_size: int = DEFAULT_INLINE_SIZE) -> None:
     #Si solo se quiere usar el evaluador sin archivo
     #TODO: si se dectecta un error, no incluir la linea en el scanned
     scanned: List[str] = []
     while (source := input('-> ')) != 'salir()':
-        star_repl(source, scanned)
+        star_repl(source, scanned, optimize, inline_size)
     
 #Con la ruta al archivo, tomar el cotenido del archivo y pasarlo por el lexer o sino, salta un error
-def file_evaluator(path:str) -> None:
+def file_evaluator(path:str, optimize: bool = False, inline_size: int = DEFAULT_INLINE_SIZE) -> None:
     src = None
     scanned: List[str] = []
     try:
         with open(path, mode='r', encoding='utf-8') as file:
             lines = file.read()
         src = lines
-        star_repl(src,scanned)
+        star_repl(src,scanned,optimize,inline_size)
     except FileNotFoundError:
         print(_FILENOTFOUND.format(path)+'\n')
\ No newline at end of file
@@ -0,0 +1,266 @@
+import asyncio
+import json
+import os
+import socket
+import stat
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from hashlib import sha256
+from itertools import count
+from multiprocessing import Manager
+from multiprocessing.managers import SyncManager
+from threading import Thread
+from typing import (Any, AsyncIterator, Dict, List, Optional, Tuple)
+
+import kp.batch as batch
+from kp.interpreter import (CompileError, Interpreter)
+
+#Servidor de evaluacion: un proceso que se queda corriendo y recibe programas por un socket Unix o TCP
+#en localhost, para no pagar el arranque de Python y la importacion de kp en cada peticion.
+#Las peticiones se ejecutan en un ProcessPoolExecutor cuyos procesos se crean al iniciar el servidor.
+#
+#Protocolo: una linea JSON por peticion y una linea JSON por respuesta.
+#  {"fuente": "imprimir(1);", "entrada": ["respuesta de recibir", ...]}
+#  {"programa": "<id>", "entrada": [...]}
+#El servidor contesta con la salida en trozos {"tipo": "salida", "texto": "..."} y termina con
+#{"tipo": "resultado", "estado": "ok", "codigo": 0, "valor": "...", "duracion": 0.001, "programa": "<id>"}.
+#El id es el SHA-256 de la fuente: el servidor guarda la fuente y cada proceso guarda el programa ya
+#compilado, asi una fuente repetida se analiza una vez en el servidor y una vez por proceso.
+#Si ya hay demasiadas peticiones esperando la respuesta es inmediata, con estado "ocupado".
+#Un programa que corre mas de batch.STREAM_INTERVAL manda su salida mientras corre: los procesos la ponen en
+#una cola compartida de un multiprocessing.Manager y un hilo del servidor la reparte a cada peticion
+
+DEFAULT_PORT = 7878
+DEFAULT_QUEUE = 64
+
+BUSY = 'ocupado'
+
+#Las salidas largas se mandan en varias lineas
+_CHUNK_SIZE = 64 * 1024
+
+#Tamaño maximo de una peticion, en bytes
+_LINE_LIMIT = 2 ** 24
+
+_UNKNOWN_PROGRAM = 'Poseemos un problema, no existe el programa {}'
+_BAD_REQUEST = 'Poseemos un problema, la peticion no es valida: {}'
+_QUEUE_FULL = 'Poseemos un problema, el servidor tiene {} peticiones en espera'
+_LINE_TOO_LONG = 'Poseemos un problema, la peticion supera el limite de {} bytes'
+_WORKER_DIED = 'Poseemos un problema, el proceso que corria el programa termino de forma inesperada'
+
+def program_id(source: str) -> str:
+    return sha256(source.encode('utf-8')).hexdigest()
+
+class Server:
+    def __init__(self,
+                workers: Optional[int] = None,
+                max_queue: int = DEFAULT_QUEUE,
+                timeout: float = batch.DEFAULT_TIMEOUT,
+                options: Optional[Dict[str, Any]] = None) -> None:
+        self.workers = workers or os.cpu_count() or 1
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.options = options or {}
+        #Peticiones en ejecucion o esperando un proceso libre
+        self.pending = 0
+        self._interpreter = Interpreter(**self.options)
+        self._sources: 'OrderedDict[str, str]' = OrderedDict()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._manager: Optional[SyncManager] = None
+        self._stream: Optional[Any] = None
+        #Las partes de la salida de cada peticion en curso, por su numero
+        self._outputs: Dict[int, 'asyncio.Queue[str]'] = {}
+        self._requests = count()
+        self._receiver: Optional[Thread] = None
+
+    #Crea todos los procesos antes de aceptar conexiones, cada uno con kp importado y su Interpreter
+    def start_workers(self) -> None:
+        self._manager = Manager()
+        self._stream = self._manager.Queue()
+        self._executor = self._new_executor()
+        for future in [self._executor.submit(os.getpid) for _ in range(self.workers)]:
+            future.result()
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=batch.init_worker,
+                                   initargs=(self.options, self.timeout, self._stream))
+
+    #Si un proceso muere el ProcessPoolExecutor ya no acepta tareas, se cambia por uno nuevo una sola vez
+    #aunque varias peticiones lo noten. Sus procesos arrancan con las siguientes peticiones
+    def _replace_executor(self, broken: ProcessPoolExecutor) -> None:
+        if self._executor is broken:
+            self._executor = self._new_executor()
+            broken.shutdown(wait=False)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        if self._manager is not None:
+            if self._receiver is not None:
+                assert self._stream is not None
+                self._stream.put(None)
+                self._receiver.join()
+                self._receiver = None
+            self._manager.shutdown()
+            self._manager = None
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    #Con una linea mas larga que el limite no se sabe donde empieza la siguiente peticion,
+                    #se contesta y se cierra la conexion
+                    await _send(writer, _result(batch.CRASH, _LINE_TOO_LONG.format(_LINE_LIMIT)))
+                    break
+                if not line:
+                    break
+                async for message in self.process(line):
+                    await _send(writer, message)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def process(self, line: bytes) -> AsyncIterator[Dict[str, Any]]:
+        try:
+            request = json.loads(line)
+            source, identifier = await self._source(request)
+            lines = [str(answer) for answer in request.get('entrada', [])]
+        except CompileError as error:
+            yield _result(batch.SYNTAX, str(error))
+            return
+        except (ValueError, TypeError, AttributeError, KeyError) as error:
+            yield _result(batch.CRASH, _BAD_REQUEST.format(error))
+            return
+        if source is None:
+            yield _result(batch.ERROR, _UNKNOWN_PROGRAM.format(identifier))
+            return
+        if self.pending >= self.max_queue:
+            yield _result(BUSY, _QUEUE_FULL.format(self.pending))
+            return
+
+        executor = self._executor
+        assert executor is not None
+        self._start_receiving()
+        number = next(self._requests)
+        outputs: 'asyncio.Queue[str]' = asyncio.Queue()
+        self._outputs[number] = outputs
+        self.pending += 1
+        received = 0
+        try:
+            try:
+                future = asyncio.wrap_future(executor.submit(batch.run_source, source, lines, identifier, number))
+                while not future.done():
+                    part = asyncio.ensure_future(outputs.get())
+                    await asyncio.wait((part, future), return_when=asyncio.FIRST_COMPLETED)
+                    if not part.done():
+                        part.cancel()
+                        break
+                    received += 1
+                    for message in _output_messages(part.result()):
+                        yield message
+                record, output = future.result()
+            except BrokenProcessPool:
+                self._replace_executor(executor)
+                record, output = _result(batch.CRASH, _WORKER_DIED), ''
+            #Las partes viajan por otra cola que el resultado y pueden llegar despues
+            while received < record.pop('partes', 0):
+                received += 1
+                for message in _output_messages(await outputs.get()):
+                    yield message
+        finally:
+            self.pending -= 1
+            del self._outputs[number]
+
+        for message in _output_messages(output):
+            yield message
+        yield {'tipo': 'resultado', **record, 'programa': identifier}
+
+    #El hilo que reparte la salida de los procesos empieza con la primera peticion, ya con el ciclo de asyncio
+    def _start_receiving(self) -> None:
+        if self._receiver is None:
+            self._receiver = Thread(target=self._receive, args=(self._stream, asyncio.get_running_loop()), daemon=True)
+            self._receiver.start()
+
+    def _receive(self, stream: Any, loop: asyncio.AbstractEventLoop) -> None:
+        while (item := stream.get()) is not None:
+            loop.call_soon_threadsafe(self._deliver, *item)
+
+    def _deliver(self, number: int, text: str) -> None:
+        outputs = self._outputs.get(number)
+        if outputs is not None:
+            outputs.put_nowait(text)
+
+    #Una fuente nueva se compila aqui una vez, asi los errores de sintaxis no ocupan un proceso. Se compila en
+    #un hilo para que una fuente grande no detenga a las demas conexiones
+    async def _source(self, request: Dict[str, Any]) -> Tuple[Optional[str], str]:
+        if 'fuente' in request:
+            source = str(request['fuente'])
+            identifier = program_id(source)
+            if identifier not in self._sources:
+                await asyncio.get_running_loop().run_in_executor(None, self._interpreter.compile, source)
+                self._sources[identifier] = source
+                if len(self._sources) > batch.PROGRAM_CACHE_SIZE:
+                    self._sources.popitem(last=False)
+            return source, identifier
+        identifier = str(request['programa'])
+        return self._sources.get(identifier), identifier
+
+async def _send(writer: asyncio.StreamWriter, message: Dict[str, Any]) -> None:
+    writer.write(json.dumps(message, ensure_ascii=False).encode('utf-8') + b'\n')
+    await writer.drain()
+
+def _output_messages(output: str) -> List[Dict[str, Any]]:
+    return [{'tipo': 'salida', 'texto': output[start:start + _CHUNK_SIZE]} for start in range(0, len(output), _CHUNK_SIZE)]
+
+def _result(state: str, error: str) -> Dict[str, Any]:
+    return {'tipo': 'resultado', 'estado': state, 'codigo': batch.EXIT_CODES.get(state, 5), 'error': error}
+
+#address es una ruta a un socket Unix o un puerto TCP de localhost. ready se llama cuando ya acepta conexiones
+async def serve(server: Server, address: str, ready: Any = None) -> None:
+    if address.isdigit():
+        listener = await asyncio.start_server(server.handle, '127.0.0.1', int(address), limit=_LINE_LIMIT)
+    else:
+        #Un socket que quedo de una ejecucion anterior no deja crear el nuevo
+        if os.path.exists(address) and stat.S_ISSOCK(os.stat(address).st_mode):
+            os.unlink(address)
+        listener = await asyncio.start_unix_server(server.handle, address, limit=_LINE_LIMIT)
+    if ready is not None:
+        ready()
+    async with listener:
+        await listener.serve_forever()
+
+#Cliente bloqueante de una sola conexion, las peticiones se responden en orden
+class Client:
+    def __init__(self, address: str) -> None:
+        if address.isdigit():
+            self._socket = socket.create_connection(('127.0.0.1', int(address)))
+        else:
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._socket.connect(address)
+        self._file = self._socket.makefile('rwb')
+
+    #Devuelve la salida completa y el resultado
+    def run(self, source: Optional[str] = None, program: Optional[str] = None,
+            stdin: Optional[List[str]] = None) -> Tuple[str, Dict[str, Any]]:
+        request: Dict[str, Any] = {'entrada': stdin or []}
+        if source is not None:
+            request['fuente'] = source
+        else:
+            request['programa'] = program
+        self._file.write(json.dumps(request, ensure_ascii=False).encode('utf-8') + b'\n')
+        self._file.flush()
+        parts: List[str] = []
+        while True:
+            message = json.loads(self._file.readline())
+            if message['tipo'] == 'salida':
+                parts.append(message['texto'])
+            else:
+                return ''.join(parts), message
+
+    def close(self) -> None:
+        self._file.close()
+        self._socket.close()
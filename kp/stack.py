@@ -0,0 +1,113 @@
+import signal
+import sys
+import threading
+from collections import Counter
+from itertools import groupby
+from typing import (Any, Dict, List, Optional, Tuple)
+
+import kp.context as context
+from kp.object import (
+    Error,
+    Function,
+    function_name,
+)
+
+#Usos de la pila de funciones que el evaluador lleva en cada kp.context.Context: el rastreo de un
+#error y el perfilador por muestreo.
+#
+#Sampler mira la pila cada cierto tiempo y cuenta cuantas veces vio cada una, sin tocar el evaluador,
+#asi su costo depende de la frecuencia y no de cuantas funciones se llaman. Con una señal (SIGALRM de
+#ITIMER_REAL, solo en el hilo principal de Unix) la muestra se toma entre dos instrucciones del programa;
+#ITIMER_PROF mediria tiempo de CPU, pero en Linux avanza con el tick del kernel y no pasa de 250 por
+#segundo. Es el mismo temporizador que usa kp.batch para su tiempo maximo, no se pueden usar juntos.
+#Con un hilo la muestra espera a que el hilo del programa suelte el GIL, asi que mientras muestrea se
+#baja sys.setswitchinterval al intervalo de las muestras. El resultado son pilas colapsadas, el formato
+#de entrada de flamegraph.pl y speedscope
+
+DEFAULT_RATE = 1000
+
+SIGNAL = 'senal'
+THREAD = 'hilo'
+
+#Raiz de todas las pilas: el codigo que esta fuera de cualquier funcion
+PROGRAM_FRAME = '<programa>'
+
+_TRACEBACK_HEADER = 'Rastreo (la llamada mas reciente al final):'
+_REPEATED_CALL = '  en {} (x{})'
+_CALL = '  en {}'
+
+#El rastreo de un error, con las llamadas recursivas seguidas a la misma funcion en una sola linea.
+#Vacio si el error no ocurrio dentro de una funcion
+def format_traceback(error: Error) -> str:
+    if len(error.stack) == 0:
+        return ''
+    lines = [_TRACEBACK_HEADER]
+    for name, calls in groupby(error.stack):
+        count = len(list(calls))
+        lines.append(_REPEATED_CALL.format(name, count) if count > 1 else _CALL.format(name))
+    return '\n'.join(lines)
+
+class Sampler:
+    #mode es SIGNAL o THREAD, sin darlo se usa la señal si se puede
+    def __init__(self, rate: int = DEFAULT_RATE, mode: Optional[str] = None) -> None:
+        self.rate = rate
+        self.mode = mode
+        self.samples: Dict[Tuple[Function, ...], int] = Counter()
+        self._stack: List[Function] = []
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._previous_handler: Any = None
+        self._switch_interval = sys.getswitchinterval()
+
+    #Empieza a muestrear la pila del contexto activo
+    def start(self) -> None:
+        self._stack = context.current().stack
+        if self.mode is None:
+            can_signal = hasattr(signal, 'setitimer') and threading.current_thread() is threading.main_thread()
+            self.mode = SIGNAL if can_signal else THREAD
+        interval = 1 / self.rate
+        if self.mode == SIGNAL:
+            self._previous_handler = signal.signal(signal.SIGALRM, self._on_signal)
+            signal.setitimer(signal.ITIMER_REAL, interval, interval)
+        else:
+            self._switch_interval = sys.getswitchinterval()
+            sys.setswitchinterval(min(self._switch_interval, interval))
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, args=(interval,), daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        if self.mode == SIGNAL:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, self._previous_handler)
+        elif self._thread is not None:
+            self._stopped.set()
+            self._thread.join()
+            self._thread = None
+            sys.setswitchinterval(self._switch_interval)
+
+    def __enter__(self) -> 'Sampler':
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    def _on_signal(self, signum: int, frame: Any) -> None:
+        self.samples[tuple(self._stack)] += 1
+
+    def _run(self, interval: float) -> None:
+        while not self._stopped.wait(interval):
+            #Copiar la lista es una sola operacion con el GIL tomado, no se ve a medio cambiar
+            self.samples[tuple(self._stack)] += 1
+
+    #Una linea por pila distinta, 'funcion;funcion;funcion muestras', de la mas vista a la menos
+    def collapsed(self) -> str:
+        totals: Dict[str, int] = Counter()
+        for stack, count in self.samples.items():
+            totals[';'.join([PROGRAM_FRAME] + [function_name(function) for function in stack])] += count
+        return ''.join(f'{stack} {count}\n' for stack, count in sorted(totals.items(), key=lambda item: -item[1]))
+
+    def save(self, path: str) -> None:
+        with open(path, mode='w', encoding='utf-8') as file:
+            file.write(self.collapsed())
@@ -4,7 +4,9 @@ from typing import (Dict,NamedTuple)
 #Enum donde se colocan todos los nombres de los token que pueden haber en el lenguaje
 @unique
 class TokenType(Enum):
+    AND = auto(),
     ASSIGN = auto(),
+    COLON = auto(),
     COMMA = auto(),
     DIVISION = auto(),
     ECMT = auto(),
@@ -13,13 +15,16 @@ class TokenType(Enum):
     EQ = auto(),
     FALSE = auto(),
     FLOAT = auto(),
+    FOR = auto(),
     FUNCTION = auto(),
     IDENT = auto(),
     IF = auto(),
     ILLEGAL = auto(),
+    IN = auto(),
     INT = auto(),
     LAMBDA = auto(),
     LBRACE = auto(),
+    LBRACKET = auto(),
     LESS = auto(),
     LET = auto(),
     LPAREN = auto(),
@@ -31,15 +36,19 @@ class TokenType(Enum):
     MOD = auto(),
     NEGATION = auto(),
     NOT_EQ = auto(),
+    OR = auto(),
     PLUS = auto(),
     RBRACE = auto(),
+    RBRACKET = auto(),
     RETURN = auto(),
     RTP = auto(),
     RPAREN = auto(),
     SCMT = auto(),
     SEMICOLON = auto(),
     STRING = auto()
+    TEMPLATE = auto(),
     TRUE = auto(),
+    WHILE = auto(),
 
 #Una clase donde se crean los token, que tiene como parametros el nombre del token(enum) y el valor de ese token
 class Token(NamedTuple):
@@ -54,6 +63,8 @@ def lookup_token_type(literal:str) -> TokenType:
     keywords: Dict[str, TokenType] = {
         'falso': TokenType.FALSE,
         'metodo': TokenType.FUNCTION,
+        'mientras': TokenType.WHILE,
+        'para': TokenType.FOR,
         'procedimiento': TokenType.LAMBDA,
         'regresa': TokenType.RETURN,
         'si' : TokenType.IF,
@@ -62,4 +73,17 @@ def lookup_token_type(literal:str) -> TokenType:
         'verdadero': TokenType.TRUE,
     }
 
-    return keywords.get(literal, TokenType.IDENT)
\ No newline at end of file
+    return keywords.get(literal, TokenType.IDENT)
+
+#Palabras que funcionan como operadores logicos solo entre dos expresiones,
+#en cualquier otro lugar siguen siendo identificadores (por ejemplo un parametro llamado y)
+LOGICAL_KEYWORDS: Dict[str, TokenType] = {
+    'y': TokenType.AND,
+    'o': TokenType.OR,
+}
+
+#Palabras reservadas solo en un lugar de un ciclo, como en dentro de para ... en, afuera siguen siendo
+#identificadores y los programas que ya las usaban como nombres no cambian
+LOOP_KEYWORDS: Dict[str, TokenType] = {
+    'en': TokenType.IN,
+}
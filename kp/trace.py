@@ -0,0 +1,101 @@
+from contextlib import contextmanager
+from typing import (cast, Iterator, List, Optional)
+
+import kp.ast as ast
+import kp.context as context
+import kp.evaluator as evaluator
+import kp.profiler as profiler
+from kp.object import (
+    Builtin,
+    Environment,
+    Error,
+    Function,
+    Object,
+)
+
+#Ganchos para seguir la evaluacion desde Python, como sys.settrace: un Tracer recibe cada nodo que entra y
+#sale del evaluador, cada llamada a una funcion de Kinp y lo que regresa, cada llamada a un builtin y cada
+#error que se crea. Con el se arman depuradores, cobertura o metricas propias sin tocar el evaluador.
+#
+#Como kp.profiler, no cuesta nada mientras nadie sigue una ejecucion: installed() cambia evaluator.evaluate,
+#evaluator._call_function y evaluator._apply_function por versiones que avisan al Tracer del kp.context.Context
+#activo, y al terminar deja las originales. Solo los errores revisan el contexto siempre, al crearse.
+#La raiz del programa se evalua antes de que se pueda cambiar nada, los avisos empiezan en sus sentencias.
+#Si una excepcion corta la ejecucion, como un presupuesto agotado, los nodos y funciones abiertos no avisan su salida
+
+class Tracer:
+    #Todos los avisos no hacen nada, se sobrescriben los que se necesiten
+
+    def enter(self, node: ast.ASTNode, env: Environment) -> None:
+        pass
+
+    #result es None para las sentencias que no producen valor
+    def exit(self, node: ast.ASTNode, result: Optional[Object]) -> None:
+        pass
+
+    #La funcion ya esta en la pila del contexto
+    def call(self, fn: Function, args: List[Object]) -> None:
+        pass
+
+    def returned(self, fn: Function, result: Object) -> None:
+        pass
+
+    def builtin(self, fn: Builtin, args: List[Object]) -> None:
+        pass
+
+    def error(self, error: Error) -> None:
+        pass
+
+#Las versiones sin instrumentar
+_evaluate = evaluator.evaluate
+_call_function = evaluator._call_function
+
+def _traced_evaluate(node: ast.ASTNode, env: Environment) -> Optional[Object]:
+    tracer = context.current().tracer
+    if tracer is None:
+        return _evaluate(node, env)
+    tracer.enter(node, env)
+    result = _evaluate(node, env)
+    tracer.exit(node, result)
+    return result
+
+def _traced_call(fn: Function, args: List[Object]) -> Object:
+    tracer = context.current().tracer
+    if tracer is None:
+        return _call_function(fn, args)
+    tracer.call(fn, args)
+    result = _call_function(fn, args)
+    tracer.returned(fn, result)
+    return result
+
+#Las funciones de Kinp avisan en _traced_call, despues de apilarse. La llamada sigue por el perfilador,
+#que sin Profiler en el contexto usa la version sin instrumentar
+def _traced_apply(fn: Object, args: List[Object]) -> Object:
+    if type(fn) == Builtin:
+        tracer = context.current().tracer
+        if tracer is not None:
+            tracer.builtin(cast(Builtin, fn), args)
+    return profiler._profiled_apply(fn, args)
+
+_installed = 0
+
+#Mientras dure el bloque with la evaluacion avisa al Tracer del contexto activo, si hay uno. Usa el mismo
+#candado que kp.profiler.installed() porque los dos cambian evaluator._apply_function
+@contextmanager
+def installed() -> Iterator[None]:
+    global _installed
+    with profiler._lock:
+        _installed += 1
+        evaluator.evaluate = _traced_evaluate
+        evaluator._call_function = _traced_call
+        evaluator._apply_function = _traced_apply
+    try:
+        yield
+    finally:
+        with profiler._lock:
+            _installed -= 1
+            if _installed == 0:
+                evaluator.evaluate = _evaluate
+                evaluator._call_function = _call_function
+                evaluator._apply_function = (profiler._profiled_apply if profiler._installed > 0
+                                             else profiler._apply_function)
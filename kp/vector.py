@@ -0,0 +1,253 @@
+import operator
+from array import array
+from itertools import repeat
+from typing import (cast,Any,Callable,Dict,Iterable,Iterator,Union)
+
+#Vectores numericos tipados: todos los elementos son enteros de 64 bits, decimales o booleanos
+#y las operaciones se aplican a todo el vector de una vez, en C, sin crear un objeto de Kinp por elemento.
+#Si NumPy esta instalado se usa un ndarray, si no un array del modulo array de Python.
+#Con los dos un entero que no cabe en 64 bits es un OverflowError: NumPy da la vuelta como en C sin avisar,
+#asi que sus resultados enteros se revisan despues de cada operacion
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+INTEGER = 'entero'
+FLOAT = 'decimal'
+BOOLEAN = 'booleano'
+
+_TYPECODES: Dict[str, str] = {INTEGER: 'q', FLOAT: 'd', BOOLEAN: 'b'}
+_DTYPES: Dict[str, str] = {INTEGER: 'int64', FLOAT: 'float64', BOOLEAN: 'bool'}
+
+ARITHMETIC: Dict[str, Callable[[Any, Any], Any]] = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+    '**': operator.pow,
+    '%': operator.mod,
+}
+
+COMPARISONS: Dict[str, Callable[[Any, Any], Any]] = {
+    '<': operator.lt,
+    '>': operator.gt,
+    '<=': operator.le,
+    '>=': operator.ge,
+    '==': operator.eq,
+    '!=': operator.ne,
+}
+
+Scalar = Union[int, float, bool]
+
+_INT64_MIN = -2 ** 63
+_INT64_MAX = 2 ** 63 - 1
+#Debajo de este valor un calculo con decimales de 64 bits no puede haberse pasado de un entero de 64 bits
+_SAFE_ESTIMATE = 2.0 ** 62
+#Y desde este seguro que se paso
+_OVERFLOW_ESTIMATE = 2.0 ** 64
+#Operadores que pueden pasarse de 64 bits con enteros, % nunca crece
+_WRAPPING_OPERATORS = ('+', '-', '*', '**')
+
+class NumericArray:
+    __slots__ = ('data', 'kind')
+
+    def __init__(self, data: Any, kind: str) -> None:
+        self.data = data
+        self.kind = kind
+
+    @staticmethod
+    def from_values(values: Iterable[Scalar], kind: str) -> 'NumericArray':
+        if numpy is not None:
+            if type(values) == range:
+                return NumericArray(numpy.arange(values.start, values.stop, values.step, dtype=_DTYPES[kind]), kind)
+            return NumericArray(numpy.fromiter(values, dtype=_DTYPES[kind]), kind)
+        return NumericArray(array(_TYPECODES[kind], values), kind)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    #Devuelve numeros y booleanos de Python, nunca los tipos de NumPy
+    def __iter__(self) -> Iterator[Scalar]:
+        values = self.data.tolist() if numpy is not None else self.data
+        if self.kind == BOOLEAN:
+            return (bool(value) for value in values)
+        return iter(values)
+
+    def get(self, index: int) -> Scalar:
+        value = self.data[index]
+        if self.kind == BOOLEAN:
+            return bool(value)
+        elif self.kind == INTEGER:
+            return int(value)
+        return float(value)
+
+    #Un entero se puede guardar en un vector de decimales, pero no al reves
+    def set(self, index: int, value: Scalar) -> None:
+        if (self.kind == BOOLEAN) != (type(value) == bool) or (self.kind == INTEGER and type(value) == float):
+            raise TypeError(self.kind, value)
+        self.data[index] = value
+
+    def slice(self, start: Any, end: Any) -> 'NumericArray':
+        #Un corte de un ndarray es una vista, se copia para que el vector nuevo sea independiente
+        data = self.data[start:end]
+        return NumericArray(data.copy() if numpy is not None else data, self.kind)
+
+    #Los elementos donde la mascara de booleanos es verdadera
+    def select(self, mask: 'NumericArray') -> 'NumericArray':
+        if mask.kind != BOOLEAN:
+            raise TypeError(mask.kind)
+        _check_length(self, mask)
+        if numpy is not None:
+            return NumericArray(self.data[mask.data], self.kind)
+        return NumericArray(array(self.data.typecode, (value for value, keep in zip(self.data, mask.data) if keep)), self.kind)
+
+    def equals(self, other: 'NumericArray') -> bool:
+        if len(self) != len(other) or (self.kind == BOOLEAN) != (other.kind == BOOLEAN):
+            return False
+        if numpy is not None:
+            return bool(numpy.array_equal(self.data, other.data))
+        return all(map(operator.eq, self.data, other.data))
+
+    def total(self) -> Scalar:
+        self._check_numeric()
+        if numpy is not None:
+            #La suma de NumPy da la vuelta, si los valores son tan grandes se suma con enteros de Python
+            #como en el modulo array
+            if self.kind == INTEGER and float(numpy.abs(self.data.astype('float64')).sum()) >= _SAFE_ESTIMATE:
+                return sum(self.data.tolist())
+            return self._python_value(self.data.sum())
+        return sum(self.data)
+
+    def mean(self) -> float:
+        self._check_numeric()
+        if len(self) == 0:
+            raise ValueError(len(self))
+        if numpy is not None:
+            return float(self.data.mean())
+        return sum(self.data) / len(self)
+
+    def maximum(self) -> Scalar:
+        self._check_numeric()
+        if len(self) == 0:
+            raise ValueError(len(self))
+        return self._python_value(self.data.max() if numpy is not None else max(self.data))
+
+    def minimum(self) -> Scalar:
+        self._check_numeric()
+        if len(self) == 0:
+            raise ValueError(len(self))
+        return self._python_value(self.data.min() if numpy is not None else min(self.data))
+
+    def _check_numeric(self) -> None:
+        if self.kind == BOOLEAN:
+            raise TypeError(self.kind)
+
+    def _python_value(self, value: Any) -> Scalar:
+        return int(value) if self.kind == INTEGER else float(value)
+
+#Aplica un operador elemento a elemento entre dos vectores del mismo largo, o entre un vector y un numero.
+#Sigue las reglas de Kinp: / siempre da decimales, ** con exponente negativo da decimales y los booleanos
+#solo se pueden comparar con == y !=. Lanza ZeroDivisionError, OverflowError, TypeError o ValueError
+#si los largos no coinciden
+def apply_operator(operator_symbol: str, left: Union[NumericArray, Scalar], right: Union[NumericArray, Scalar]) -> NumericArray:
+    left_kind = _kind_of(left)
+    right_kind = _kind_of(right)
+    if operator_symbol in COMPARISONS:
+        if (left_kind == BOOLEAN or right_kind == BOOLEAN) and (
+                left_kind != right_kind or operator_symbol not in ('==', '!=')):
+            raise TypeError(left_kind, operator_symbol, right_kind)
+        function = COMPARISONS[operator_symbol]
+        kind = BOOLEAN
+    elif operator_symbol in ARITHMETIC:
+        if left_kind == BOOLEAN or right_kind == BOOLEAN:
+            raise TypeError(left_kind, operator_symbol, right_kind)
+        function = ARITHMETIC[operator_symbol]
+        kind = FLOAT if FLOAT in (left_kind, right_kind) or operator_symbol == '/' else INTEGER
+        if operator_symbol == '**' and kind == INTEGER and _has_negative(right):
+            kind = FLOAT
+    else:
+        raise TypeError(left_kind, operator_symbol, right_kind)
+
+    if type(left) == NumericArray and type(right) == NumericArray:
+        _check_length(cast(NumericArray, left), cast(NumericArray, right))
+
+    if numpy is not None:
+        return NumericArray(_apply_numpy(operator_symbol, function, kind, left, right), kind)
+    return NumericArray(_apply_array(function, kind, left, right), kind)
+
+def _apply_numpy(operator_symbol: str, function: Callable[[Any, Any], Any], kind: str,
+                left: Union[NumericArray, Scalar], right: Union[NumericArray, Scalar]) -> Any:
+    left_data = cast(NumericArray, left).data if type(left) == NumericArray else left
+    right_data = cast(NumericArray, right).data if type(right) == NumericArray else right
+    #NumPy devuelve infinito o nan al dividir entre cero, Kinp lo trata como un error
+    if operator_symbol in ('/', '%') and numpy.any(numpy.equal(right_data, 0)):
+        raise ZeroDivisionError(operator_symbol)
+    if kind == FLOAT and operator_symbol == '**':
+        left_data = numpy.asarray(left_data, dtype='float64')
+    elif kind == INTEGER and operator_symbol in _WRAPPING_OPERATORS:
+        return _apply_checked_integers(operator_symbol, function, left_data, right_data)
+    return numpy.asarray(function(left_data, right_data), dtype=_DTYPES[kind])
+
+#Opera enteros de 64 bits con NumPy y lanza OverflowError si algun elemento dio la vuelta
+def _apply_checked_integers(operator_symbol: str, function: Callable[[Any, Any], Any],
+                            left_data: Any, right_data: Any) -> Any:
+    #Un numero que no cabe en 64 bits ya es un OverflowError aqui
+    left_data = numpy.asarray(left_data, dtype='int64')
+    right_data = numpy.asarray(right_data, dtype='int64')
+    with numpy.errstate(all='ignore'):
+        result = numpy.asarray(function(left_data, right_data), dtype='int64')
+        if operator_symbol == '+':
+            #Hubo vuelta si los dos operandos tienen el mismo signo y el resultado el contrario
+            overflow = ((left_data ^ result) & (right_data ^ result)) < 0
+        elif operator_symbol == '-':
+            overflow = ((left_data ^ right_data) & (left_data ^ result)) < 0
+        elif operator_symbol == '*':
+            #Sin vuelta el resultado dividido entre un operando da el otro exacto
+            divisor = numpy.where(left_data == 0, 1, left_data)
+            overflow = ((left_data != 0) & (result // divisor != right_data)) | (
+                (left_data == -1) & (right_data == _INT64_MIN))
+        else:
+            overflow = _power_overflow(left_data, right_data)
+    if numpy.any(overflow):
+        raise OverflowError(operator_symbol)
+    return result
+
+#Con decimales se estima el tamaño de cada potencia, las que quedan cerca del limite se calculan exactas
+def _power_overflow(left_data: Any, right_data: Any) -> Any:
+    estimate = numpy.power(numpy.abs(left_data.astype('float64')), right_data)
+    overflow = estimate >= _OVERFLOW_ESTIMATE
+    bases, exponents = numpy.broadcast_arrays(left_data, right_data)
+    for index in zip(*numpy.nonzero((estimate >= _SAFE_ESTIMATE) & ~overflow)):
+        value = int(bases[index]) ** int(exponents[index])
+        if not _INT64_MIN <= value <= _INT64_MAX:
+            return True
+    return overflow
+
+def _apply_array(function: Callable[[Any, Any], Any], kind: str,
+                left: Union[NumericArray, Scalar], right: Union[NumericArray, Scalar]) -> Any:
+    if type(left) == NumericArray and type(right) == NumericArray:
+        values = map(function, cast(NumericArray, left).data, cast(NumericArray, right).data)
+    elif type(left) == NumericArray:
+        values = map(function, cast(NumericArray, left).data, repeat(right))
+    else:
+        values = map(function, repeat(left), cast(NumericArray, right).data)
+    return array(_TYPECODES[kind], values)
+
+def _kind_of(value: Union[NumericArray, Scalar]) -> str:
+    if type(value) == NumericArray:
+        return cast(NumericArray, value).kind
+    elif type(value) == bool:
+        return BOOLEAN
+    elif type(value) == int:
+        return INTEGER
+    return FLOAT
+
+def _has_negative(value: Union[NumericArray, Scalar]) -> bool:
+    if type(value) == NumericArray:
+        return len(cast(NumericArray, value)) > 0 and cast(NumericArray, value).minimum() < 0
+    return value < 0
+
+def _check_length(left: NumericArray, right: NumericArray) -> None:
+    if len(left) != len(right):
+        raise ValueError(len(left), len(right))
@@ -1,16 +1,186 @@
 import sys
+from contextlib import nullcontext
+from argparse import (ArgumentParser, Namespace)
+from time import perf_counter
+from typing import (Any, Dict, List)
+import asyncio
+import kp.batch as batch
+import kp.bignum as bignum
+from kp.budget import Budget
+from kp.memory import (MemoryMeter, report)
+import kp.server as server
+import kp.context as context
+import kp.inputs as inputs
+import kp.output as output
+from kp.optimizer import DEFAULT_INLINE_SIZE
+from kp.profiler import (Profiler, installed)
+from kp.stack import (DEFAULT_RATE, Sampler)
 from kp.repl import (loop_evaluator, file_evaluator)
 #Para usar los test "mypy . && nosetests"
 
-def main() -> None:
+_INPUT_NOT_FOUND = 'Poseemos un problema, no se encontro el archivo de entrada {}'
+_BATCH_SUMMARY = 'Lote: {} archivos en {:.2f} s, {}'
+_SERVER_READY = 'Servidor: {} procesos escuchando en {}'
+
+def main(optimize: bool = False, inline_size: int = DEFAULT_INLINE_SIZE) -> None:
     print('Bienvenido al lenguaje de Programacion Kinp.')
     print('Escribe un comando para comenzar.')
-    loop_evaluator()
-         
+    loop_evaluator(optimize, inline_size)
 
-if __name__ == '__main__':
-    if (len(sys.argv) > 1):
-        path = sys.argv[1]
-        file_evaluator(path)
+def _parse_arguments() -> Namespace:
+    parser = ArgumentParser(description='Interprete del lenguaje de programacion Kinp.')
+    parser.add_argument('archivo', nargs='?',
+                        help='ruta al archivo .kp, si no se da se abre la consola')
+    parser.add_argument('-O', dest='optimizar', action='store_true',
+                        help='pliega constantes y elimina codigo muerto antes de ejecutar')
+    parser.add_argument('--inline', dest='inline', type=int, default=DEFAULT_INLINE_SIZE, metavar='NODOS',
+                        help='con -O, tamaño maximo de las funciones que se expanden en sus llamadas (0 lo desactiva)')
+    parser.add_argument('--memo', dest='memo', action='store_true',
+                        help='guarda los resultados de todas las funciones puras')
+    parser.add_argument('--memo-tamano', dest='memo_tamano', type=int, default=context.DEFAULT_MEMO_SIZE,
+                        metavar='N', help='cantidad maxima de resultados guardados por funcion')
+    parser.add_argument('--digitos', dest='digitos', type=int, default=bignum.DEFAULT_MAX_DIGITS, metavar='N',
+                        help='cantidad maxima de digitos al imprimir o leer un entero (0 sin limite)')
+    parser.add_argument('--salida', dest='salida', choices=output.SINKS, default='bloque',
+                        help='bloque junta las lineas de imprimir y las escribe juntas, linea escribe cada una, '
+                             'nula las descarta')
+    parser.add_argument('--entrada', dest='entrada', metavar='ARCHIVO',
+                        help='lee las respuestas de recibir de un archivo, una por linea (- para la entrada estandar)')
+    parser.add_argument('--eco', dest='eco', action='store_true',
+                        help='con --entrada, escribe cada pregunta de recibir junto a su respuesta')
+    parser.add_argument('--tiempo', dest='tiempo', type=float, default=0.0, metavar='SEGUNDOS',
+                        help='tiempo maximo del programa (0 sin limite)')
+    _add_budget_arguments(parser)
+    parser.add_argument('--reporte-memoria', dest='reporte_memoria', action='store_true',
+                        help='al terminar escribe en stderr la memoria maxima que uso cada tipo de valor')
+    parser.add_argument('--perfil', dest='perfil', action='store_true',
+                        help='al terminar escribe en stderr las llamadas y el tiempo de cada funcion')
+    parser.add_argument('--perfil-salida', dest='perfil_salida', metavar='ARCHIVO',
+                        help='guarda el perfil para pstats, o para KCachegrind si el nombre empieza con callgrind.out')
+    parser.add_argument('--muestreo', dest='muestreo', metavar='ARCHIVO',
+                        help='muestrea la pila de funciones y guarda las pilas colapsadas para un flame graph')
+    parser.add_argument('--muestreo-frecuencia', dest='muestreo_frecuencia', type=int, default=DEFAULT_RATE,
+                        metavar='HZ', help='muestras por segundo')
+    return parser.parse_args()
+
+#Limites del presupuesto de cada programa, en 0 no hay limite
+def _add_budget_arguments(parser: ArgumentParser) -> None:
+    parser.add_argument('--pasos', dest='pasos', type=int, default=0, metavar='N',
+                        help='cantidad maxima de sentencias que puede ejecutar el programa')
+    parser.add_argument('--profundidad', dest='profundidad', type=int, default=0, metavar='N',
+                        help='cantidad maxima de llamadas a funciones anidadas')
+    parser.add_argument('--memoria', dest='memoria', type=float, default=0.0, metavar='MB',
+                        help='memoria maxima de los textos, enteros y entornos del programa')
+
+#python main.py lote <directorio|patron>: corre todos los archivos en varios procesos
+def _parse_batch_arguments(argv: List[str]) -> Namespace:
+    parser = ArgumentParser(prog='main.py lote',
+                            description='Ejecuta muchos archivos .kp en varios procesos y escribe un reporte JSON.')
+    parser.add_argument('objetivo', help='directorio con archivos .kp o patron como "pruebas/**/*.kp"')
+    parser.add_argument('--reporte', dest='reporte', metavar='ARCHIVO',
+                        help='escribe el reporte en un archivo en lugar de la salida estandar')
+    _add_pool_arguments(parser)
+    return parser.parse_args(argv)
+
+#Opciones comunes del modo lote y del servidor
+def _add_pool_arguments(parser: ArgumentParser) -> None:
+    parser.add_argument('--procesos', dest='procesos', type=int, default=None, metavar='N',
+                        help='cantidad de procesos, por defecto uno por nucleo')
+    parser.add_argument('--tiempo', dest='tiempo', type=float, default=batch.DEFAULT_TIMEOUT, metavar='SEGUNDOS',
+                        help='tiempo maximo de cada programa (0 sin limite)')
+    parser.add_argument('-O', dest='optimizar', action='store_true',
+                        help='pliega constantes y elimina codigo muerto antes de ejecutar')
+    parser.add_argument('--memo', dest='memo', action='store_true',
+                        help='guarda los resultados de todas las funciones puras')
+    parser.add_argument('--digitos', dest='digitos', type=int, default=bignum.DEFAULT_MAX_DIGITS, metavar='N',
+                        help='cantidad maxima de digitos al imprimir o leer un entero (0 sin limite)')
+    _add_budget_arguments(parser)
+
+def _pool_options(arguments: Namespace) -> Dict[str, Any]:
+    return {'optimize': arguments.optimizar, 'memo': arguments.memo, 'max_digits': arguments.digitos,
+            'max_steps': arguments.pasos, 'max_depth': arguments.profundidad,
+            'max_memory': _megabytes(arguments.memoria)}
+
+def _megabytes(size: float) -> int:
+    return int(size * 2 ** 20)
+
+def batch_main(argv: List[str]) -> int:
+    arguments = _parse_batch_arguments(argv)
+    options = _pool_options(arguments)
+    start = perf_counter()
+    if arguments.reporte is not None:
+        with open(arguments.reporte, mode='w', encoding='utf-8') as report:
+            totals = batch.run_batch(arguments.objetivo, report, arguments.procesos, arguments.tiempo, options)
     else:
-        main()
\ No newline at end of file
+        totals = batch.run_batch(arguments.objetivo, sys.stdout, arguments.procesos, arguments.tiempo, options)
+    states = ', '.join(f'{count} {state}' for state, count in totals.items() if count > 0)
+    print(_BATCH_SUMMARY.format(sum(totals.values()), perf_counter() - start, states), file=sys.stderr)
+    return 0 if totals[batch.OK] == sum(totals.values()) else 1
+
+#python main.py servidor: se queda escuchando peticiones hasta Ctrl+C
+def _parse_server_arguments(argv: List[str]) -> Namespace:
+    parser = ArgumentParser(prog='main.py servidor',
+                            description='Ejecuta programas Kinp recibidos por un socket, con procesos ya iniciados.')
+    parser.add_argument('--socket', dest='socket', metavar='RUTA',
+                        help='escucha en un socket Unix en lugar de TCP')
+    parser.add_argument('--puerto', dest='puerto', type=int, default=server.DEFAULT_PORT, metavar='N',
+                        help='puerto TCP de localhost')
+    parser.add_argument('--cola', dest='cola', type=int, default=server.DEFAULT_QUEUE, metavar='N',
+                        help='peticiones que pueden esperar a la vez, las demas se rechazan como ocupado')
+    _add_pool_arguments(parser)
+    return parser.parse_args(argv)
+
+def server_main(argv: List[str]) -> int:
+    arguments = _parse_server_arguments(argv)
+    address = arguments.socket if arguments.socket is not None else str(arguments.puerto)
+    evaluation_server = server.Server(arguments.procesos, arguments.cola, arguments.tiempo, _pool_options(arguments))
+    evaluation_server.start_workers()
+    ready = lambda: print(_SERVER_READY.format(evaluation_server.workers, address), file=sys.stderr)
+    try:
+        asyncio.run(server.serve(evaluation_server, address, ready))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        evaluation_server.shutdown()
+    return 0
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == 'lote':
+        sys.exit(batch_main(sys.argv[2:]))
+    elif len(sys.argv) > 1 and sys.argv[1] == 'servidor':
+        sys.exit(server_main(sys.argv[2:]))
+    arguments = _parse_arguments()
+    context.configure(sink=output.from_name(arguments.salida),
+                      max_digits=arguments.digitos,
+                      memo=arguments.memo,
+                      memo_size=arguments.memo_tamano)
+    if arguments.pasos > 0 or arguments.profundidad > 0 or arguments.tiempo > 0:
+        context.configure(budget=Budget(arguments.pasos, arguments.profundidad, arguments.tiempo))
+    meter = None
+    if arguments.memoria > 0 or arguments.reporte_memoria:
+        meter = MemoryMeter(_megabytes(arguments.memoria))
+        context.configure(memory=meter)
+    if arguments.entrada is not None:
+        try:
+            context.configure(source=inputs.from_path(arguments.entrada, arguments.eco))
+        except FileNotFoundError:
+            sys.exit(_INPUT_NOT_FOUND.format(arguments.entrada))
+    profiler = None
+    if arguments.perfil or arguments.perfil_salida is not None:
+        profiler = Profiler()
+        context.configure(profiler=profiler)
+    sampler = Sampler(arguments.muestreo_frecuencia) if arguments.muestreo is not None else None
+    with installed() if profiler is not None else nullcontext(), sampler if sampler is not None else nullcontext():
+        if arguments.archivo is not None:
+            file_evaluator(arguments.archivo, arguments.optimizar, arguments.inline)
+        else:
+            main(arguments.optimizar, arguments.inline)
+    if meter is not None and arguments.reporte_memoria:
+        print(report(meter), file=sys.stderr)
+    if profiler is not None and arguments.perfil:
+        print(profiler.table(), file=sys.stderr)
+    if profiler is not None and arguments.perfil_salida is not None:
+        profiler.save(arguments.perfil_salida, arguments.archivo or '<consola>')
+    if sampler is not None:
+        sampler.save(arguments.muestreo)
@@ -0,0 +1,56 @@
+import json
+import os
+from hashlib import sha256
+from io import StringIO
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from kp.batch import (
+    find_files,
+    run_batch,
+)
+
+_FILES = {
+    'suma.kp': 'imprimir(2 + 3);',
+    'pregunta.kp': 'imprimir("Hola " + recibir("nombre: "));',
+    'pregunta.entrada': 'Ana\n',
+    'error.kp': 'variable x = desconocido;',
+    'sintaxis.kp': 'variable = ;',
+    'infinito.kp': 'mientras (verdadero) { }',
+    os.path.join('sub', 'otro.kp'): 'imprimir(1); imprimir(2);',
+}
+
+class BatchTest(TestCase):
+
+    def test_find_files(self) -> None:
+        with TemporaryDirectory() as directory:
+            self._write_files(directory)
+            names = [os.path.relpath(path, directory) for path in find_files(directory)]
+            self.assertEqual(sorted(names), sorted(name for name in _FILES if name.endswith('.kp')))
+            self.assertEqual(len(find_files(os.path.join(directory, 's*.kp'))), 2)
+
+    def test_run_batch(self) -> None:
+        with TemporaryDirectory() as directory:
+            self._write_files(directory)
+            report = StringIO()
+            totals = run_batch(directory, report, workers=2, timeout=0.5)
+
+        records = {os.path.relpath(record['archivo'], directory): record
+                   for record in map(json.loads, report.getvalue().splitlines())}
+        self.assertEqual(totals, {'ok': 3, 'error': 1, 'sintaxis': 1, 'tiempo': 1, 'fallo': 0})
+        self.assertEqual(records['suma.kp']['estado'], 'ok')
+        self.assertEqual(records['suma.kp']['codigo'], 0)
+        self.assertEqual(records['suma.kp']['sha256'], sha256(b'5\n').hexdigest())
+        self.assertEqual(records['pregunta.kp']['sha256'], sha256(b'Hola Ana\n').hexdigest())
+        self.assertEqual(records[os.path.join('sub', 'otro.kp')]['lineas'], 2)
+        self.assertEqual(records['error.kp']['error'], 'Poseemos un problema, que es "desconocido"?')
+        self.assertEqual(records['sintaxis.kp']['codigo'], 2)
+        self.assertEqual(records['infinito.kp']['estado'], 'tiempo')
+        self.assertGreaterEqual(records['infinito.kp']['duracion'], 0.5)
+
+    def _write_files(self, directory: str) -> None:
+        for name, source in _FILES.items():
+            path = os.path.join(directory, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, mode='w', encoding='utf-8') as file:
+                file.write(source)
@@ -0,0 +1,78 @@
+import sys
+from math import factorial
+from random import Random
+from unittest import TestCase
+from typing import List
+
+import kp.context as context
+from kp.bignum import (
+    DEFAULT_MAX_DIGITS,
+    DigitLimitError,
+    from_decimal,
+    to_decimal,
+)
+from kp.evaluator import evaluate
+from kp.lexer import Lexer
+from kp.object import (Environment, Error, Object)
+from kp.parser import Parser
+
+class BignumTest(TestCase):
+
+    def tearDown(self) -> None:
+        context.configure(max_digits=DEFAULT_MAX_DIGITS)
+
+    def test_round_trip(self) -> None:
+        random = Random(11)
+        for digits in [1, 9, 2048, 2049, 4301, 10_000, 30_001]:
+            value = random.randrange(10 ** (digits - 1), 10 ** digits)
+            for number in (value, -value):
+                text = to_decimal(number)
+                self.assertEqual(len(text.lstrip('-')), digits)
+                self.assertEqual(from_decimal(text), number)
+                self.assertEqual(text, _python_str(number))
+        self.assertEqual(from_decimal(' +1_000 '), 1000)
+        self.assertRaises(ValueError, from_decimal, '12a' * 1000)
+
+    def test_digit_limit(self) -> None:
+        self.assertEqual(len(to_decimal(10 ** 99, 100)), 100)
+        self.assertRaises(DigitLimitError, to_decimal, 10 ** 100, 100)
+        self.assertRaises(DigitLimitError, to_decimal, factorial(3000), 100)
+        self.assertRaises(DigitLimitError, from_decimal, '1' * 101, 100)
+        self.assertEqual(from_decimal(to_decimal(factorial(3000), 0), 0), factorial(3000))
+
+    def test_kinp_errors(self) -> None:
+        context.configure(max_digits=5000)
+        source = 'variable f = 1; para i en rango(1, 3001) { f = f * i; } '
+        test: List[str] = [
+            source + 'imprimir(f);',
+            source + '$"{f}";',
+            source + 'parsearAtexto(f);',
+            'parsearAentero("' + '7' * 5001 + '");',
+        ]
+        for program in test:
+            evaluated = self._evaluate_test(program)
+            self.assertIsInstance(evaluated, Error)
+            self.assertEqual(evaluated.inspect(),
+                'Error: Poseemos un problema, el numero tiene mas de 5000 digitos, usa --digitos para cambiar el limite')
+
+        parser = Parser(Lexer('7' * 5001 + ';'))
+        parser.parse_program()
+        self.assertEqual(len(parser.errors), 1)
+
+        context.configure(max_digits=0)
+        evaluated = self._evaluate_test(source + 'longitud(parsearAtexto(f));')
+        self.assertEqual(evaluated.inspect(), '9131')
+
+    def _evaluate_test(self, source: str) -> Object:
+        program = Parser(Lexer(source)).parse_program()
+        evaluated = evaluate(program, Environment())
+        assert evaluated is not None
+        return evaluated
+
+def _python_str(value: int) -> str:
+    limit = sys.get_int_max_str_digits()
+    sys.set_int_max_str_digits(0)
+    try:
+        return str(value)
+    finally:
+        sys.set_int_max_str_digits(limit)
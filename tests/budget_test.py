@@ -0,0 +1,103 @@
+from threading import (Event, Thread)
+from typing import List
+from unittest import TestCase
+
+from kp import (Budget, Interpreter, Result)
+from kp.budget import (CANCELLED, BudgetExceeded)
+
+_RECURSION = '''
+    variable f = procedimiento(n) {
+        si (n == 0) { regresa 0; }
+        regresa 1 + f(n - 1);
+    };
+    f(profundidad);
+'''
+
+_FOREVER = 'mientras (verdadero) {}'
+
+class BudgetTest(TestCase):
+
+    def test_step_limit(self) -> None:
+        result = Interpreter(max_steps=10_000).execute(_FOREVER)
+
+        self.assertEqual(result.error, 'Poseemos un problema, el programa supero el limite de 10000 pasos')
+
+    def test_steps_inside_builtin_callbacks(self) -> None:
+        interpreter = Interpreter(max_steps=1_000)
+
+        source = 'variable numeros = []; para i en rango({}) {{ anexar(numeros, i); }} ' \
+                 'suma(mapa(numeros, procedimiento(x) {{ x * 2; }}));'
+        stopped = interpreter.execute(source.format(400))
+        finished = interpreter.execute(source.format(100))
+
+        self.assertEqual(stopped.error, 'Poseemos un problema, el programa supero el limite de 1000 pasos')
+        self.assertEqual(finished.to_python(), 9900)
+
+    def test_depth_limit(self) -> None:
+        interpreter = Interpreter(max_depth=50)
+        program = interpreter.compile(_RECURSION)
+
+        self.assertEqual(interpreter.run(program, bindings={'profundidad': 49}).to_python(), 49)
+        self.assertEqual(interpreter.run(program, bindings={'profundidad': 50}).error,
+                         'Poseemos un problema, el programa supero la profundidad maxima de 50 llamadas')
+
+    def test_python_recursion_limit_is_an_error(self) -> None:
+        result = Interpreter().execute(_RECURSION, bindings={'profundidad': 100_000})
+
+        self.assertEqual(result.error, 'Poseemos un problema, el programa supero la profundidad maxima de llamadas '
+                                       'de Python, usa --profundidad para limitarla')
+
+    #Sin presupuesto una llamada de Kinp no puede costar mas marcos de Python que antes de existir los limites
+    def test_depth_without_budget(self) -> None:
+        source = 'metodo f(n){ si (n == 0) { regresa 0; } regresa 1 + f(n - 1); } f(150);'
+
+        self.assertEqual(Interpreter().execute(source).to_python(), 150)
+
+    def test_timeout(self) -> None:
+        result = Interpreter(timeout=0.2).execute(_FOREVER)
+
+        self.assertEqual(result.error, 'Poseemos un problema, el programa supero el limite de 0.2 segundos')
+        self.assertLess(result.duration, 2)
+
+    def test_timeout_after_a_single_long_statement(self) -> None:
+        result = Interpreter(timeout=0.01, max_digits=0).execute('variable x = 3 ** 2000000; 1;')
+
+        self.assertEqual(result.error, 'Poseemos un problema, el programa supero el limite de 0.01 segundos')
+
+    def test_cancel_from_another_thread(self) -> None:
+        interpreter = Interpreter()
+        program = interpreter.compile('imprimir("inicio"); ' + _FOREVER)
+        budget = Budget()
+        results: List[Result] = []
+        thread = Thread(target=lambda: results.append(interpreter.run(program, budget=budget)))
+        thread.start()
+        thread.join(0.1)
+        self.assertTrue(thread.is_alive())
+
+        budget.cancel()
+        thread.join(5)
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(results[0].error, 'Poseemos un problema, la ejecucion fue cancelada')
+        self.assertEqual(results[0].output, 'inicio\n')
+
+    def test_each_run_has_its_own_budget(self) -> None:
+        interpreter = Interpreter(max_steps=5_000)
+        program = interpreter.compile('variable total = 0; para i en rango(1000) { total = total + i; } total;')
+
+        for _ in range(20):
+            self.assertEqual(interpreter.run(program).to_python(), 499500)
+
+    def test_budget_counts(self) -> None:
+        budget = Budget(max_depth=3)
+        budget.enter()
+        budget.enter()
+        budget.enter()
+        with self.assertRaises(BudgetExceeded):
+            budget.enter()
+        self.assertEqual(budget.depth, 3)
+
+        budget.cancel()
+        with self.assertRaises(BudgetExceeded) as raised:
+            budget.step()
+        self.assertEqual(raised.exception.resource, CANCELLED)
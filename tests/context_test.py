@@ -0,0 +1,103 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Thread
+from typing import (List, Optional, Tuple)
+from unittest import TestCase
+
+import kp.context as context
+from kp import Interpreter
+from kp.builtins import BUILTINS
+from kp.context import Context
+from kp.evaluator import evaluate
+from kp.inputs import LineSource
+from kp.lexer import Lexer
+from kp.object import (
+    Environment,
+    Error,
+    Object,
+)
+from kp.output import CaptureSink
+from kp.parser import Parser
+
+_PROGRAM = '''
+    metodo fib(n) {
+        si (n < 2) { regresa n; }
+        regresa fib(n - 1) + fib(n - 2);
+    }
+    variable nombre = recibir("nombre: ");
+    variable total = 0;
+    para i en rango(id % 50) { total = total + i; }
+    imprimir($"{nombre} {id} {total}");
+    fib(id % 12);
+'''
+
+class ContextTest(TestCase):
+
+    def test_concurrent_runs_do_not_interfere(self) -> None:
+        interpreter = Interpreter(memo=True)
+        program = interpreter.compile(_PROGRAM)
+
+        def run(id: int) -> Tuple[int, str, object]:
+            result = interpreter.run(program, bindings={'id': id}, stdin=[f'usuario{id}'])
+            return id, cast_output(result.output), result.to_python()
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            results = list(executor.map(run, range(10_000)))
+
+        fibonacci = [0, 1]
+        while len(fibonacci) < 12:
+            fibonacci.append(fibonacci[-1] + fibonacci[-2])
+        for id, output, value in results:
+            self.assertEqual(output, f'usuario{id} {id} {id % 50 * (id % 50 - 1) // 2}\n')
+            self.assertEqual(value, fibonacci[id % 12])
+
+    def test_context_is_per_thread(self) -> None:
+        sinks: List[CaptureSink] = []
+
+        def run(number: int) -> None:
+            sink = CaptureSink()
+            sinks.append(sink)
+            with context.using(Context(sink=sink, source=LineSource([str(number)]))):
+                for _ in range(200):
+                    self._evaluate(f'imprimir({number});')
+                self._evaluate('imprimir(recibir(""));')
+
+        threads = [Thread(target=run, args=(number,)) for number in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for sink in sinks:
+            lines = sink.lines()
+            self.assertEqual(len(lines), 201)
+            self.assertEqual(len(set(lines)), 1)
+        self.assertIs(context.current(), context.DEFAULT)
+
+    def test_context_settings(self) -> None:
+        env = Environment()
+        with context.using(Context(memo=True, memo_size=4, max_digits=10)):
+            self._evaluate('metodo doble(x) { regresa x * 2; }', env)
+            evaluated = self._evaluate('imprimir(10 ** 20);', env)
+        self.assertIsNotNone(env['doble'].memo)
+        self.assertEqual(env['doble'].memo.maxsize, 4)
+        self.assertEqual(type(evaluated), Error)
+
+        self._evaluate('metodo triple(x) { regresa x * 3; }', env)
+        self.assertIsNone(env['triple'].memo)
+
+    def test_restricted_builtins(self) -> None:
+        allowed = {name: builtin for name, builtin in BUILTINS.items() if name != 'recibir'}
+        interpreter = Interpreter(builtins=allowed)
+        result = interpreter.execute('recibir("clave: ");')
+        self.assertEqual(result.error, 'Poseemos un problema, que es "recibir"?')
+        self.assertTrue(interpreter.execute('longitud("hola");').ok)
+        self.assertTrue(Interpreter().execute('recibir("clave: ");', stdin=['x']).ok)
+
+    def _evaluate(self, source: str, env: Optional[Environment] = None) -> Object:
+        evaluated = evaluate(Parser(Lexer(source)).parse_program(), env if env is not None else Environment())
+        assert evaluated is not None
+        return evaluated
+
+def cast_output(output: object) -> str:
+    assert type(output) == str
+    return output
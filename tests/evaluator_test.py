@@ -6,6 +6,7 @@ from kp.evaluator import (evaluate, NULL)
 from kp.lexer import Lexer
 from kp.parser import Parser
 from kp.object import(
+    Array,
     Error,
     Float,
     Object,
@@ -428,6 +429,401 @@ class EvaluatorTest(TestCase):
             expected = cast(str, expected)
             self._test_error_object(evaluated, expected)
 
+    def test_logical_operators(self) -> None:
+        test: List[Tuple[str, bool]] = [
+            ('verdadero y verdadero', True),
+            ('verdadero y falso', False),
+            ('falso o verdadero', True),
+            ('falso o falso', False),
+            ('1 < 2 && 2 < 3', True),
+            ('1 > 2 || 2 > 3', False),
+            ('verdadero y 1', False),
+            ('!(falso o falso) y verdadero', True),
+            ('variable y = verdadero; variable o = falso; y o o;', True),
+            ('falso y noexiste', False),
+            ('verdadero o noexiste', True),
+            ('''
+                metodo costoso(n){
+                    si (n == 0) { regresa verdadero; }
+                    regresa costoso(n - 1);
+                }
+                falso && costoso(100000);
+            ''', False),
+        ]
+        for source, expected in test:
+            evaluated = self._evaluate_test(source)
+            self._test_boolean_object(evaluated, expected)
+
+        evaluated = self._evaluate_test('verdadero y noexiste')
+        self._test_error_object(evaluated, 'Poseemos un problema, que es "noexiste"?')
+
+    def test_loops(self) -> None:
+        test: List[Tuple[str, Any]] = [
+            ('variable total = 0; para i en rango(1, 101) { total = total + i; } total;', 5050),
+            ('variable total = 0; para i en rango(10, 0, -3) { total = total + i; } total;', 22),
+            ('variable n = 0; mientras (n < 5) { n = n + 1; } n;', 5),
+            ('variable n = 0; mientras (falso) { n = n + 1; } n;', 0),
+            ('variable t = ""; para letra en "abc" { t = letra + t; } t;', 'cba'),
+            ('para i en rango(3) { i; }', None),
+            ('para i en rango(3) { } i;', 2),
+            ('''
+                metodo primer_cuadrado_mayor(x){
+                    para i en rango(x) {
+                        si (i * i > x) { regresa i; }
+                    }
+                    regresa -1;
+                }
+                primer_cuadrado_mayor(50);
+            ''', 8),
+            ('''
+                metodo cuenta(n){
+                    variable i = 0;
+                    mientras (verdadero) {
+                        si (i == n) { regresa i; }
+                        i = i + 1;
+                    }
+                }
+                cuenta(100000);
+            ''', 100000),
+        ]
+        for source, expected in test:
+            evaluated = self._evaluate_test(source)
+            if type(expected) == int:
+                self._test_integer_object(evaluated, expected)
+            elif type(expected) == str:
+                self._test_string_object(evaluated, expected)
+            else:
+                self._test_null_object(evaluated)
+
+    def test_loop_errors(self) -> None:
+        test: List[Tuple[str, str]] = [
+            ('para i en 5 { i; }', 'Poseemos un problema, no se puede recorrer INTEGER'),
+            ('mientras (x) { 1; }', 'Poseemos un problema, que es "x"?'),
+            ('para i en rango(3) { i + verdadero; }',
+             'Poseemos un problema, no puedo ejecutar INTEGER + BOOLEAN'),
+            ('rango(1, 5, 0);', 'Poseemos un problema, el paso del rango no puede ser cero'),
+            ('rango("a");', 'Poseemos un problema, no tengo soporte para STRING'),
+            ('rango();', 'Poseemos un problema, numero incorrecto de argumentos, se requeria 1, 2 o 3, pero se recibio 0'),
+        ]
+        for source, expected in test:
+            evaluated = self._evaluate_test(source)
+            self._test_error_object(evaluated, expected)
+
+    def test_ranges_are_lazy(self) -> None:
+        evaluated = self._evaluate_test('rango(0, 10 ** 15, 5);')
+        self.assertEqual(evaluated.inspect(), 'rango(0, 1000000000000000, 5)')
+        self._test_integer_object(self._evaluate_test('longitud(rango(0, 10 ** 15, 5));'), 2 * 10 ** 14)
+
+    def test_list_literal(self) -> None:
+        evaluated = self._evaluate_test('[1, 2 * 2, 3 + 3]')
+        self.assertIsInstance(evaluated, Array)
+        elements = cast(Array, evaluated).elements
+        self.assertEqual(len(elements), 3)
+        for element, expected in zip(elements, [1, 4, 6]):
+            self._test_integer_object(element, expected)
+
+    def test_list_index_and_slice(self) -> None:
+        test: List[Tuple[str, Any]] = [
+            ('[1, 2, 3][0]', 1),
+            ('[1, 2, 3][1 + 1]', 3),
+            ('variable i = 0; [1][i]', 1),
+            ('variable lista = [1, 2, 3]; lista[2];', 3),
+            ('variable lista = [1, 2, 3]; lista[0] + lista[1] + lista[2];', 6),
+            ('[1, 2, 3][-1]', 3),
+            ('"hola"[1]', 'o'),
+            ('longitud([1, 2, 3][1:])', 2),
+            ('longitud([1, 2, 3][:-1])', 2),
+            ('longitud([1, 2, 3][5:])', 0),
+            ('"hola mundo"[:4]', 'hola'),
+        ]
+        for source, expected in test:
+            evaluated = self._evaluate_test(source)
+            if type(expected) == int:
+                self._test_integer_object(evaluated, expected)
+            else:
+                self._test_string_object(evaluated, expected)
+
+        test_errors: List[Tuple[str, str]] = [
+            ('[1, 2, 3][3]', 'Poseemos un problema, el indice 3 esta fuera de la lista de 3 elementos'),
+            ('[1, 2, 3][-4]', 'Poseemos un problema, el indice -4 esta fuera de la lista de 3 elementos'),
+            ('[1]["a"]', 'Poseemos un problema, no se puede usar LIST[STRING]'),
+            ('5[0]', 'Poseemos un problema, no se puede usar INTEGER[INTEGER]'),
+            ('[1, x]', 'Poseemos un problema, que es "x"?'),
+        ]
+        for source, expected in test_errors:
+            self._test_error_object(self._evaluate_test(source), expected)
+
+    def test_list_builtins(self) -> None:
+        test: List[Tuple[str, str]] = [
+            ('variable l = [1]; anexar(l, 2); anexar(l, 3); l;', '[1, 2, 3]'),
+            ('longitud([1, 2, 3, 4]);', '4'),
+            ('mapa([1, 2, 3], procedimiento(x){ x * x });', '[1, 4, 9]'),
+            ('mapa([1, 2], parsearAtexto);', '[1, 2]'),
+            ('filtro([1, 2, 3, 4], procedimiento(x){ x % 2 == 0 });', '[2, 4]'),
+            ('reducir([1, 2, 3, 4], procedimiento(a, b){ a * b });', '24'),
+            ('reducir([], procedimiento(a, b){ a + b }, 10);', '10'),
+            ('suma([1, 2, 3]);', '6'),
+            ('suma([1, 2.5]);', '3.5'),
+            ('suma([]);', '0'),
+            ('ordenar([3, 1.5, 2]);', '[1.5, 2, 3]'),
+            ('ordenar(["pera", "manzana"]);', '[manzana, pera]'),
+            ('variable l = [3, 1]; ordenar(l); l;', '[3, 1]'),
+        ]
+        for source, expected in test:
+            self.assertEqual(self._evaluate_test(source).inspect(), expected, source)
+
+        test_errors: List[Tuple[str, str]] = [
+            ('mapa([1], 1);', 'Poseemos un problema, no tengo soporte para INTEGER'),
+            ('mapa([1, 0], procedimiento(x){ 1 / x + verdadero });',
+             'Poseemos un problema, no puedo ejecutar FLOAT + BOOLEAN'),
+            ('reducir([], procedimiento(a, b){ a + b });',
+             'Poseemos un problema, no se puede reducir una lista vacia sin valor inicial'),
+            ('suma([1, "a"]);', 'Poseemos un problema, no tengo soporte para STRING'),
+            ('ordenar([1, "a"]);', 'Poseemos un problema, la lista tiene valores que no se pueden comparar'),
+            ('anexar(1, 2);', 'Poseemos un problema, no tengo soporte para INTEGER'),
+        ]
+        for source, expected in test_errors:
+            self._test_error_object(self._evaluate_test(source), expected)
+
+    def test_dictionaries(self) -> None:
+        test: List[Tuple[str, str]] = [
+            ('{"uno": 1, "dos": 2}["dos"];', '2'),
+            ('variable d = {1: "a"}; d[1.0];', 'a'),
+            ('variable d = {}; d["x"] = 1; d["x"] = d["x"] + 1; d;', '{x: 2}'),
+            ('variable d = {verdadero: 1, 1: 2}; longitud(d);', '2'),
+            ('variable clave = "k"; {clave: 1 + 1}["k"];', '2'),
+            ('claves({"a": 1, "b": 2});', '[a, b]'),
+            ('valores({"a": 1, "b": 2});', '[1, 2]'),
+            ('contiene({"a": 1}, "a");', 'verdadero'),
+            ('contiene({"a": 1}, "b");', 'falso'),
+            ('contiene([1, 2], 2.0);', 'verdadero'),
+            ('contiene("hola mundo", "mun");', 'verdadero'),
+            ('variable d = {"a": 1, "b": 2}; borrar(d, "a") + longitud(d);', '2'),
+            ('variable d = {"a": 1, "b": 2}; para k en d { borrar(d, k); } longitud(d);', '0'),
+            ('variable l = [1, 2, 3]; l[-1] = 0; l;', '[1, 2, 0]'),
+        ]
+        for source, expected in test:
+            self.assertEqual(self._evaluate_test(source).inspect(), expected, source)
+
+        test_errors: List[Tuple[str, str]] = [
+            ('{"a": 1}["b"];', 'Poseemos un problema, la clave b no existe en el diccionario'),
+            ('{[1]: 1};', 'Poseemos un problema, no se puede usar LIST como clave de un diccionario'),
+            ('variable d = {}; d[{}] = 1;', 'Poseemos un problema, no se puede usar DICTIONARY como clave de un diccionario'),
+            ('borrar({}, 1);', 'Poseemos un problema, la clave 1 no existe en el diccionario'),
+            ('variable l = [1]; l[1] = 2;', 'Poseemos un problema, el indice 1 esta fuera de la lista de 1 elementos'),
+            ('variable x = 1; x[0] = 2;', 'Poseemos un problema, no se puede usar INTEGER[INTEGER]'),
+        ]
+        for source, expected in test_errors:
+            self._test_error_object(self._evaluate_test(source), expected)
+
+    def test_structural_equality(self) -> None:
+        test: List[Tuple[str, bool]] = [
+            ('[1, 2] == [1, 2]', True),
+            ('[1, [2, "a"]] == [1, [2, "a"]]', True),
+            ('[1, 2] == [2, 1]', False),
+            ('[1, 2] != [1, 2, 3]', True),
+            ('{"a": 1} == {"a": 1.0}', True),
+            ('{"a": 1} == {"a": 2}', False),
+            ('[verdadero] == [1]', False),
+            ('procedimiento(x){ x } == procedimiento(x){ x }', False),
+            ('variable f = procedimiento(x){ x }; f == f', True),
+        ]
+        for source, expected in test:
+            self._test_boolean_object(self._evaluate_test(source), expected)
+
+    def test_immutable_collections(self) -> None:
+        test: List[Tuple[str, str]] = [
+            ('inmutable([1, 2, 3]);', 'inmutable([1, 2, 3])'),
+            ('variable v = inmutable([1, 2]); variable w = agregar(v, 3); [longitud(v), longitud(w)];', '[2, 3]'),
+            ('variable v = inmutable([1, 2]); asociar(v, 0, 9)[0] + v[0];', '10'),
+            ('asociar(inmutable([1]), 1, 2);', 'inmutable([1, 2])'),
+            ('inmutable([1, 2, 3])[-1];', '3'),
+            ('inmutable([1, 2, 3])[1:];', 'inmutable([2, 3])'),
+            ('variable d = inmutable({"a": 1}); variable e = asociar(d, "b", 2); [longitud(d), e["b"]];', '[1, 2]'),
+            ('quitar(inmutable({"a": 1, "b": 2}), "a");', 'inmutable({b: 2})'),
+            ('claves(inmutable({"a": 1}));', '[a]'),
+            ('contiene(inmutable({1: "a"}), 1.0);', 'verdadero'),
+            ('inmutable([1, 2]) == agregar(inmutable([1]), 2);', 'verdadero'),
+            ('variable t = transitorio(inmutable([])); para i en rango(100) { agregar(t, i); } variable v = persistente(t); longitud(v) + v[99];', '199'),
+            ('variable t = transitorio(inmutable({})); asociar(t, "x", 1); quitar(t, "x"); persistente(t);', 'inmutable({})'),
+            ('variable s = 0; para x en inmutable([1, 2, 3]) { s = s + x; } s;', '6'),
+        ]
+        for source, expected in test:
+            self.assertEqual(self._evaluate_test(source).inspect(), expected, source)
+
+        test_errors: List[Tuple[str, str]] = [
+            ('variable v = inmutable([1]); v[0] = 2;', 'Poseemos un problema, IMMUTABLE_LIST no se puede modificar, usa asociar para crear una version nueva'),
+            ('asociar(inmutable([1]), 5, 2);', 'Poseemos un problema, el indice 5 esta fuera de la lista de 1 elementos'),
+            ('inmutable({"a": 1})["b"];', 'Poseemos un problema, la clave b no existe en el diccionario'),
+            ('variable t = transitorio(inmutable([])); persistente(t); agregar(t, 1);', 'Poseemos un problema, el transitorio ya se convirtio en persistente'),
+            ('agregar([1], 2);', 'Poseemos un problema, no tengo soporte para LIST'),
+        ]
+        for source, expected in test_errors:
+            self._test_error_object(self._evaluate_test(source), expected)
+
+    def test_vectors(self) -> None:
+        test: List[Tuple[str, str]] = [
+            ('vector([1, 2, 3]) * 2;', 'vector([2, 4, 6])'),
+            ('vector([1, 2]) + vector([10, 20]);', 'vector([11, 22])'),
+            ('10 - vector([1, 2.5]);', 'vector([9.0, 7.5])'),
+            ('vector([1, 2]) / 2;', 'vector([0.5, 1.0])'),
+            ('vector([5, 6, 7]) % 5;', 'vector([0, 1, 2])'),
+            ('vector([2, 3]) ** 2;', 'vector([4, 9])'),
+            ('-vector([1, -2]);', 'vector([-1, 2])'),
+            ('vector([1, 5, 3]) > 2;', 'vector([falso, verdadero, verdadero])'),
+            ('variable v = vector([1, 5, 3]); v[v > 2];', 'vector([5, 3])'),
+            ('vector(rango(5))[-1];', '4'),
+            ('vector([1.5, 2.5, 3.5])[1:];', 'vector([2.5, 3.5])'),
+            ('variable v = vector([1.5, 2.5]); v[0] = 1; v;', 'vector([1.0, 2.5])'),
+            ('vector([1, 2]) == vector([1, 2]);', 'vector([verdadero, verdadero])'),
+            ('variable t = 0; para x en vector([1, 2, 3]) { t = t + x; } t;', '6'),
+            ('longitud(vector(rango(1000)));', '1000'),
+            ('suma(vector(rango(101)));', '5050'),
+            ('promedio(vector([1, 2]));', '1.5'),
+            ('maximo(vector([1.5, 3.5]));', '3.5'),
+            ('minimo(vector([4, 2, 8]));', '2'),
+            ('promedio([1, 2, 3]);', '2.0'),
+            ('maximo([1, 7, 3]);', '7'),
+            ('minimo([1, 0.5]);', '0.5'),
+        ]
+        for source, expected in test:
+            self.assertEqual(self._evaluate_test(source).inspect(), expected, source)
+
+        test_errors: List[Tuple[str, str]] = [
+            ('vector([1, 2]) / 0;', 'Poseemos un problema, no se puede dividir entre cero'),
+            ('vector([1, 2]) + vector([1]);', 'Poseemos un problema, no se pueden operar vectores de 2 y 1 elementos'),
+            ('vector([verdadero]) + 1;', 'Poseemos un problema, no puedo operar VECTOR + INTEGER'),
+            ('vector([1]) + [1];', 'Poseemos un problema, no puedo ejecutar VECTOR + LIST'),
+            ('vector([1, "a"]);', 'Poseemos un problema, no tengo soporte para STRING'),
+            ('variable v = vector([1]); v[0] = 1.5;', 'Poseemos un problema, no puedo ejecutar VECTOR = FLOAT'),
+            ('vector([1])[3];', 'Poseemos un problema, el indice 3 esta fuera de la lista de 1 elementos'),
+            ('maximo([]);', 'Poseemos un problema, no se puede calcular maximo de una lista vacia'),
+            ('promedio(vector([]));', 'Poseemos un problema, no se puede calcular promedio de una lista vacia'),
+        ]
+        for source, expected in test_errors:
+            self._test_error_object(self._evaluate_test(source), expected)
+
+    def test_long_string_concatenation(self) -> None:
+        test: List[Tuple[str, str]] = [
+            ('variable s = ""; para i en rango(3000) { s = s + "ab"; } longitud(s);', '6000'),
+            ('variable s = ""; para i en rango(3000) { s = s + i % 10; } s[-3:];', '789'),
+            ('variable s = ""; para i en rango(3000) { s = s + "a"; } variable t = s + "b"; variable u = s + "c"; t[-1] + u[-1] + longitud(s);', 'bc3000'),
+            ('variable s = ""; para i en rango(3000) { s = s + "a"; } s + "b" == s + "b";', 'verdadero'),
+            ('variable s = ""; para i en rango(3000) { s = s + "a"; } {s: 1}[s];', '1'),
+            ('variable s = ""; para i en rango(3000) { s = s + "a"; } longitud(1 + s);', '3001'),
+        ]
+        for source, expected in test:
+            self.assertEqual(self._evaluate_test(source).inspect(), expected, source)
+
+        #Sumar al texto mas reciente no copia, sumar a una version anterior no cambia a la mas reciente
+        base = String('x' * 2000)
+        first = String.concatenate(base, String('a'))
+        second = String.concatenate(first, String('b'))
+        branch = String.concatenate(first, String('c'))
+        self.assertEqual(first.length(), 2001)
+        self.assertEqual(second.value[-2:], 'ab')
+        self.assertEqual(branch.value[-2:], 'ac')
+        self.assertEqual(first.value, 'x' * 2000 + 'a')
+
+    def test_template_literal(self) -> None:
+        test: List[Tuple[str, str]] = [
+            ('variable numero = "123"; variable i = 3; $"El numero {numero} tiene {i} cifras";', 'El numero 123 tiene 3 cifras'),
+            ('$"{1 + 2}{2.5}{verdadero}{[1, 2]}";', '32.5verdadero[1, 2]'),
+            ('metodo f(x){ regresa $"<{x * 2}>"; } f(4);', '<8>'),
+            ('$"{{literal}} }}";', '{literal} }'),
+            ('variable d = {"k": 5}; $"{d["k"]} y { {"a": 1}["a"] }";', '5 y 1'),
+            ('"{" + "{{x}}" + "}";', '{{{x}}}'),
+        ]
+        for source, expected in test:
+            self._test_string_object(self._evaluate_test(source), expected)
+
+        self._test_error_object(self._evaluate_test('$"{x}";'), 'Poseemos un problema, que es "x"?')
+
+    def test_string_builtins(self) -> None:
+        test: List[Tuple[str, str]] = [
+            ('buscar("hola mundo", "mundo");', '5'),
+            ('buscar("hola mundo", "x");', '-1'),
+            ('buscar("a-a-a", "a", 1);', '2'),
+            ('reemplazar("1.000.000", ".", ",");', '1,000,000'),
+            ('dividir("uno dos  tres");', '[uno, dos, tres]'),
+            ('dividir("a,b,,c", ",");', '[a, b, , c]'),
+            ('unir(["a", "b", "c"]);', 'abc'),
+            ('unir([1, 2.5, verdadero], ", ");', '1, 2.5, verdadero'),
+            ('unir(dividir("a b c"), "-");', 'a-b-c'),
+            ('mayusculas("Hola Ñandú");', 'HOLA ÑANDÚ'),
+            ('minusculas("HOLA");', 'hola'),
+            ('recortar("  hola  ");', 'hola'),
+            ('recortar("xxholaxx", "x");', 'hola'),
+            ('comienza_con("kinp.kp", "kinp");', 'verdadero'),
+            ('termina_con("kinp.kp", ".py");', 'falso'),
+            ('longitud(parsearAtexto(12345));', '5'),
+            ('parsearAtexto(12345)[0];', '1'),
+        ]
+        for source, expected in test:
+            self.assertEqual(self._evaluate_test(source).inspect(), expected, source)
+
+        test_errors: List[Tuple[str, str]] = [
+            ('buscar("a");', 'Poseemos un problema, numero incorrecto de argumentos, se requeria 2 o 3, pero se recibio 1'),
+            ('buscar("a", "b", "c");', 'Poseemos un problema, no tengo soporte para STRING'),
+            ('reemplazar("a", 1, "b");', 'Poseemos un problema, no tengo soporte para INTEGER'),
+            ('dividir("a", "");', 'Poseemos un problema, el separador no puede estar vacio'),
+            ('unir("abc");', 'Poseemos un problema, no tengo soporte para STRING'),
+            ('mayusculas(1);', 'Poseemos un problema, no tengo soporte para INTEGER'),
+        ]
+        for source, expected in test_errors:
+            self._test_error_object(self._evaluate_test(source), expected)
+
+    def test_identifier_cache(self) -> None:
+        test: List[Tuple[str, int]] = [
+            ('''
+                variable a = 1;
+                metodo leer(){ regresa a; }
+                leer();
+                a = 5;
+                leer();
+            ''', 5),
+            ('''
+                variable a = 1;
+                metodo leer(tapar){
+                    si (tapar) { variable a = 7; }
+                    regresa a;
+                }
+                leer(falso) + leer(verdadero);
+            ''', 8),
+            ('''
+                metodo medir(tapar){
+                    si (tapar) { variable longitud = procedimiento(x){ regresa 0; }; }
+                    regresa longitud("abc");
+                }
+                medir(falso) + medir(verdadero);
+            ''', 3),
+            ('''
+                variable cuenta = procedimiento(n){
+                    si (n == 0) { regresa 0; }
+                    regresa 1 + cuenta(n - 1);
+                };
+                cuenta(20);
+            ''', 20),
+        ]
+        for source, expected in test:
+            evaluated = self._evaluate_test(source)
+            self._test_integer_object(evaluated, expected)
+
+    def test_identifier_cache_survives_calls(self) -> None:
+        lexer: Lexer = Lexer('''
+            metodo suma(x, y){ variable total = x + y; regresa total; }
+            suma(1, 2);
+        ''')
+        program: Program = Parser(lexer).parse_program()
+        env: Environment = Environment()
+        evaluate(program, env)
+
+        version = Environment.version
+        evaluated = evaluate(program.statements[1], env)
+        assert evaluated is not None
+        self._test_integer_object(evaluated, 3)
+        self.assertEqual(Environment.version, version)
+
 ###############################################AUXILIAR FUNCTIONS###############################################
 
     def _evaluate_test(self, source: str) -> Object:
@@ -0,0 +1,82 @@
+from io import StringIO
+from unittest import TestCase
+from unittest.mock import patch
+
+import kp.context as context
+from kp.evaluator import evaluate
+from kp.inputs import (
+    ConsoleSource,
+    LineSource,
+    from_stream,
+)
+from kp.lexer import Lexer
+from kp.object import (
+    Environment,
+    Error,
+    Object,
+)
+from kp.output import (
+    CaptureSink,
+    StreamSink,
+)
+from kp.parser import Parser
+
+class InputsTest(TestCase):
+
+    def setUp(self) -> None:
+        self.sink = CaptureSink()
+        context.configure(sink=self.sink)
+
+    def tearDown(self) -> None:
+        context.configure(sink=StreamSink(), source=ConsoleSource())
+
+    def test_line_source(self) -> None:
+        context.configure(source=LineSource(['7', '*', '6']))
+        self._evaluate('''
+            variable a = parsearAentero(recibir("a: "));
+            variable operacion = recibir("operacion: ");
+            variable b = parsearAentero(recibir("b: "));
+            imprimir(operacion);
+            imprimir(a * b);
+        ''')
+        self.assertEqual(self.sink.lines(), ['*', '42'])
+
+    def test_echo_writes_prompt_and_answer(self) -> None:
+        context.configure(source=from_stream(StringIO('Ana\r\n'), echo=True))
+        self._evaluate('imprimir("Hola " + recibir("nombre: "));')
+        self.assertEqual(self.sink.lines(), ['nombre: Ana', 'Hola Ana'])
+
+    def test_iterable_is_read_lazily(self) -> None:
+        read = []
+        def answers():
+            for answer in ['1', '2', '3']:
+                read.append(answer)
+                yield answer + '\n'
+
+        context.configure(source=LineSource(answers()))
+        self._evaluate('imprimir(recibir(""));')
+        self.assertEqual(read, ['1'])
+        self.assertEqual(self.sink.lines(), ['1'])
+
+    def test_no_more_input(self) -> None:
+        context.configure(source=LineSource([]))
+        evaluated = self._evaluate('recibir("numero: ");')
+        self.assertEqual(type(evaluated), Error)
+        self.assertEqual(evaluated.inspect(),
+                         'Error: Poseemos un problema, no quedan respuestas para recibir("numero: ")')
+
+    def test_no_more_input_inside_a_call(self) -> None:
+        context.configure(source=LineSource(['5']))
+        evaluated = self._evaluate('parsearAentero(recibir("a: ")) + parsearAentero(recibir("b: "));')
+        self.assertEqual(evaluated.inspect(),
+                         'Error: Poseemos un problema, no quedan respuestas para recibir("b: ")')
+
+    def test_console_end_of_file(self) -> None:
+        def end_of_file(prompt: str) -> str:
+            raise EOFError
+        with patch('builtins.input', end_of_file):
+            evaluated = self._evaluate('recibir("numero: ");')
+        self.assertEqual(type(evaluated), Error)
+
+    def _evaluate(self, source: str) -> Object:
+        return evaluate(Parser(Lexer(source)).parse_program(), Environment())
@@ -0,0 +1,121 @@
+from io import StringIO
+from unittest import TestCase
+
+import kp.context as context
+from kp import (
+    CompileError,
+    Interpreter,
+)
+from kp.interpreter import (
+    to_kinp,
+    to_python,
+)
+from kp.object import (
+    Builtin,
+    Dictionary,
+    Integer,
+)
+from kp.output import (
+    CaptureSink,
+    StreamSink,
+)
+
+class InterpreterTest(TestCase):
+
+    def test_compile_once_run_many(self) -> None:
+        interpreter = Interpreter()
+        program = interpreter.compile('imprimir(x * 2); x + 1;')
+        for x in range(3):
+            result = interpreter.run(program, bindings={'x': x})
+            self.assertTrue(result.ok)
+            self.assertEqual(result.output, f'{x * 2}\n')
+            self.assertEqual(result.to_python(), x + 1)
+
+    def test_runs_do_not_share_globals(self) -> None:
+        interpreter = Interpreter(bindings={'inicial': 10})
+        first = interpreter.execute('variable contador = inicial; contador = contador + 1; contador;')
+        second = interpreter.execute('contador;')
+        self.assertEqual(first.to_python(), 11)
+        self.assertFalse(second.ok)
+        self.assertEqual(second.error, 'Poseemos un problema, que es "contador"?')
+
+    def test_runs_do_not_share_mutable_values(self) -> None:
+        interpreter = Interpreter(bindings={'lista': [1, 2], 'precios': {'pan': 1}},
+                                  prelude='''
+                                      variable cache = {};
+                                      variable otra = lista;
+                                      variable t = transitorio(inmutable([1]));
+                                      metodo guardar(x) { cache[x] = verdadero; regresa longitud(cache); }
+                                  ''')
+        source = '''
+            anexar(lista, 3); precios["leche"] = 2; agregar(t, 2);
+            [longitud(lista), longitud(otra), longitud(precios), guardar("a"), longitud(persistente(t))];
+        '''
+        self.assertEqual(interpreter.execute(source).to_python(), [3, 3, 2, 1, 2])
+        self.assertEqual(interpreter.execute(source).to_python(), [3, 3, 2, 1, 2])
+        self.assertEqual(interpreter.execute('[lista, precios, cache];').to_python(), [[1, 2], {'pan': 1}, {}])
+
+    def test_prelude(self) -> None:
+        interpreter = Interpreter(bindings={'impuesto': 0.5},
+                                  prelude='metodo total(precio) { regresa precio + precio * impuesto; }')
+        self.assertEqual(interpreter.execute('total(10);').to_python(), 15.0)
+        with self.assertRaises(CompileError):
+            Interpreter(prelude='variable x = desconocido;')
+
+    def test_stdin_and_stdout(self) -> None:
+        interpreter = Interpreter()
+        program = interpreter.compile('imprimir(parsearAentero(recibir("a: ")) + parsearAentero(recibir("b: ")));')
+        self.assertEqual(interpreter.run(program, stdin='2\n3\n').output, '5\n')
+        self.assertEqual(interpreter.run(program, stdin=['4', '5']).output, '9\n')
+
+        stdout = StringIO()
+        result = interpreter.run(program, stdin=StringIO('1\n1\n'), stdout=stdout)
+        self.assertIsNone(result.output)
+        self.assertEqual(stdout.getvalue(), '2\n')
+
+    def test_run_restores_global_output(self) -> None:
+        sink = CaptureSink()
+        context.configure(sink=sink)
+        try:
+            Interpreter().execute('imprimir("adentro");')
+            context.write_line('afuera')
+        finally:
+            context.configure(sink=StreamSink())
+        self.assertEqual(sink.lines(), ['afuera'])
+
+    def test_compile_error(self) -> None:
+        with self.assertRaises(CompileError) as context:
+            Interpreter().compile('variable = 5;')
+        self.assertTrue(len(context.exception.errors) > 0)
+
+    def test_optimize(self) -> None:
+        interpreter = Interpreter(optimize=True)
+        program = interpreter.compile('2 * 3 + 1;')
+        self.assertEqual(str(program.program), '7')
+        self.assertEqual(interpreter.run(program).to_python(), 7)
+
+    def test_result_uses_the_digit_limit_of_the_run(self) -> None:
+        self.assertEqual(len(Interpreter(max_digits=0).execute('10 ** 1000001;').inspect()), 1000002)
+        self.assertEqual(Interpreter(max_digits=50).execute('[10 ** 40];').inspect(), '[1' + '0' * 40 + ']')
+
+    def test_value_conversion(self) -> None:
+        converted = to_kinp({'a': [1, 2.5, 'x', True, None], 3: (4,)})
+        self.assertEqual(type(converted), Dictionary)
+        self.assertEqual(to_python(converted), {'a': [1, 2.5, 'x', True, None], 3: [4]})
+        self.assertEqual(to_kinp(Integer(7)), Integer(7))
+        with self.assertRaises(TypeError):
+            to_kinp({(1, 2): 3})
+        with self.assertRaises(TypeError):
+            to_kinp(object())
+
+    def test_host_function(self) -> None:
+        def dividir_entre(a: int, b: int) -> float:
+            return a / b
+
+        host = to_kinp(dividir_entre)
+        self.assertEqual(type(host), Builtin)
+        interpreter = Interpreter(bindings={'dividir_entre': dividir_entre, 'invertir': lambda texto: texto[::-1]})
+        self.assertEqual(interpreter.execute('invertir("hola");').to_python(), 'aloh')
+        self.assertEqual(interpreter.execute('dividir_entre(6, 3);').to_python(), 2.0)
+        result = interpreter.execute('dividir_entre(1, 0);')
+        self.assertEqual(result.error, 'Poseemos un problema, la funcion dividir_entre fallo: division by zero')
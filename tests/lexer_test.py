@@ -380,3 +380,70 @@ class LexerTest(TestCase):
             Token(TokenType.SEMICOLON, ';'),
         ]
         self.assertEquals(self._get_tokens(source,22), expected_tokens)
+
+    def test_logical_operators(self) -> None:
+        source: str = 'a && b || c y d o e & |'
+        expected_tokens: List[Token] = [
+            Token(TokenType.IDENT, 'a'),
+            Token(TokenType.AND, '&&'),
+            Token(TokenType.IDENT, 'b'),
+            Token(TokenType.OR, '||'),
+            Token(TokenType.IDENT, 'c'),
+            Token(TokenType.IDENT, 'y'),
+            Token(TokenType.IDENT, 'd'),
+            Token(TokenType.IDENT, 'o'),
+            Token(TokenType.IDENT, 'e'),
+            Token(TokenType.ILLEGAL, '&'),
+            Token(TokenType.ILLEGAL, '|'),
+        ]
+        self.assertEqual(self._get_tokens(source,11), expected_tokens)
+
+    def test_loop_statements(self) -> None:
+        source: str = 'mientras (x) {} para i en rango(3) {}'
+        expected_tokens: List[Token] = [
+            Token(TokenType.WHILE, 'mientras'),
+            Token(TokenType.LPAREN, '('),
+            Token(TokenType.IDENT, 'x'),
+            Token(TokenType.RPAREN, ')'),
+            Token(TokenType.LBRACE, '{'),
+            Token(TokenType.RBRACE, '}'),
+            Token(TokenType.FOR, 'para'),
+            Token(TokenType.IDENT, 'i'),
+            Token(TokenType.IDENT, 'en'),
+            Token(TokenType.IDENT, 'rango'),
+            Token(TokenType.LPAREN, '('),
+            Token(TokenType.INT, '3'),
+            Token(TokenType.RPAREN, ')'),
+            Token(TokenType.LBRACE, '{'),
+            Token(TokenType.RBRACE, '}'),
+        ]
+        self.assertEqual(self._get_tokens(source,15), expected_tokens)
+
+    def test_list_delimiters(self) -> None:
+        source: str = '[1, 2][0:1]'
+        expected_tokens: List[Token] = [
+            Token(TokenType.LBRACKET, '['),
+            Token(TokenType.INT, '1'),
+            Token(TokenType.COMMA, ','),
+            Token(TokenType.INT, '2'),
+            Token(TokenType.RBRACKET, ']'),
+            Token(TokenType.LBRACKET, '['),
+            Token(TokenType.INT, '0'),
+            Token(TokenType.COLON, ':'),
+            Token(TokenType.INT, '1'),
+            Token(TokenType.RBRACKET, ']'),
+        ]
+        self.assertEqual(self._get_tokens(source,10), expected_tokens)
+
+    def test_template_string(self) -> None:
+        source: str = '$"Hola {nombre}" "sin {llaves}" "{" $"{{}}" $"{d["k"]}" "}" $"{abierta"'
+        expected_tokens: List[Token] = [
+            Token(TokenType.TEMPLATE, 'Hola {nombre}'),
+            Token(TokenType.STRING, 'sin {llaves}'),
+            Token(TokenType.STRING, '{'),
+            Token(TokenType.TEMPLATE, '{{}}'),
+            Token(TokenType.TEMPLATE, '{d["k"]}'),
+            Token(TokenType.STRING, '}'),
+            Token(TokenType.TEMPLATE, '{abierta'),
+        ]
+        self.assertEqual(self._get_tokens(source,7), expected_tokens)
@@ -0,0 +1,167 @@
+from unittest import TestCase
+from typing import (List,cast,Tuple)
+
+import kp.context as context
+import kp.memo as memo
+from kp.ast import Program
+from kp.evaluator import evaluate
+from kp.lexer import Lexer
+from kp.memo import MemoCache
+from kp.object import(
+    Error,
+    Object,
+    String,
+    Integer,
+    Function,
+    Environment,
+)
+from kp.parser import Parser
+
+_NOT_PURE = 'Poseemos un problema, la funcion imprime, recibe, cambia variables de afuera o lee listas y diccionarios de afuera y no se puede memorizar'
+
+_FIBONACCI = '''
+    metodo fib(n){
+        si (n < 2) { regresa n; }
+        regresa fib(n - 1) + fib(n - 2);
+    }
+'''
+
+class MemoTest(TestCase):
+
+    def tearDown(self) -> None:
+        context.configure(memo=False, memo_size=context.DEFAULT_MEMO_SIZE)
+
+    def test_memoized_fibonacci_is_linear(self) -> None:
+        env: Environment = Environment()
+        evaluated = self._evaluate(_FIBONACCI + 'memorizar(fib); fib(30);', env)
+        self._test_integer_object(evaluated, 832040)
+
+        cache = cast(Function, env['fib']).memo
+        assert cache is not None
+        self.assertEqual(cache.misses, 31)
+        self.assertEqual(cache.hits, 28)
+
+    def test_global_flag(self) -> None:
+        context.configure(memo=True, memo_size=8)
+        env: Environment = Environment()
+        evaluated = self._evaluate(_FIBONACCI + '''
+            metodo saludar(nombre){ imprimir(nombre); regresa nombre; }
+            fib(25);
+        ''', env)
+        self._test_integer_object(evaluated, 75025)
+
+        cache = cast(Function, env['fib']).memo
+        assert cache is not None
+        self.assertLessEqual(len(cache), 8)
+        self.assertIsNone(cast(Function, env['saludar']).memo)
+
+    def test_impure_functions(self) -> None:
+        test: List[Tuple[str, str]] = [
+            ('metodo f(x){ imprimir(x); regresa x; } memorizar(f);', _NOT_PURE),
+            ('variable total = 0; metodo f(x){ total = x; regresa x; } memorizar(f);', _NOT_PURE),
+            ('metodo f(x){ regresa procedimiento(y){ x + y }; } memorizar(f);', _NOT_PURE),
+            ('metodo avisar(x){ imprimir(x); regresa x; } metodo f(x){ regresa avisar(x); } memorizar(f);', _NOT_PURE),
+            ('memorizar(5);', 'Poseemos un problema, no tengo soporte para INTEGER'),
+            ('metodo f(x){ regresa x; } memorizar(f, 0);',
+             'Poseemos un problema, el tamaño del cache debe ser mayor que cero, se recibio 0'),
+        ]
+        for source, expected in test:
+            evaluated = self._evaluate(source, Environment())
+            self.assertIsInstance(evaluated, Error)
+            self.assertEqual(cast(Error, evaluated).message, expected)
+
+    def test_calls_to_impure_functions_are_not_cached(self) -> None:
+        env: Environment = Environment()
+        self._evaluate('''
+            metodo f(x){ regresa avisar(x); }
+            memorizar(f);
+            metodo avisar(x){ imprimir(x); regresa x; }
+            f(1);
+            f(1);
+        ''', env)
+        cache = cast(Function, env['f']).memo
+        assert cache is not None
+        self.assertFalse(cache.pure)
+        self.assertEqual(len(cache), 0)
+
+    def test_cache_is_invalidated_when_globals_change(self) -> None:
+        evaluated = self._evaluate('''
+            variable tasa = 2;
+            metodo convertir(x){ regresa x * tasa; }
+            memorizar(convertir);
+            variable antes = convertir(10);
+            tasa = 3;
+            antes + convertir(10);
+        ''', Environment())
+        self._test_integer_object(evaluated, 50)
+
+    def test_functions_reading_mutable_globals_are_not_memoized(self) -> None:
+        for source in (
+            'variable g = [1, 2, 3]; metodo f(i){ regresa g[i]; } memorizar(f);',
+            'variable g = {"a": 1}; metodo f(k){ regresa g[k]; } memorizar(f);',
+        ):
+            evaluated = self._evaluate(source, Environment())
+            self.assertIsInstance(evaluated, Error)
+            self.assertEqual(cast(Error, evaluated).message, _NOT_PURE)
+
+    def test_global_flag_sees_mutated_globals(self) -> None:
+        context.configure(memo=True)
+        for source in (
+            'variable g = [1, 2, 3]; metodo f(i){ regresa g[i]; } variable antes = f(0); g[0] = 10; antes + f(0);',
+            'variable g = {"a": 1}; metodo f(k){ regresa g[k]; } variable antes = f("a"); g["a"] = 10; antes + f("a");',
+        ):
+            env: Environment = Environment()
+            self._test_integer_object(self._evaluate(source, env), 11)
+            cache = cast(Function, env['f']).memo
+            assert cache is not None
+            self.assertFalse(cache.pure)
+            self.assertEqual(len(cache), 0)
+
+    def test_lru_eviction(self) -> None:
+        cache = MemoCache(2)
+        cache.put(1, Integer(1))
+        cache.put(2, Integer(2))
+        self.assertIsNotNone(cache.get(1))
+        cache.put(3, Integer(3))
+
+        self.assertIsNone(cache.get(2))
+        self.assertIsNotNone(cache.get(1))
+        self.assertIsNotNone(cache.get(3))
+        self.assertEqual(cache.hits, 3)
+        self.assertEqual(cache.misses, 1)
+
+    def test_mutable_results_are_not_cached(self) -> None:
+        for source, expected in (
+            ('metodo f(n){ regresa [n]; } memorizar(f); variable a = f(1); anexar(a, 2); f(1);', '[1]'),
+            ('metodo f(n){ regresa {"k": n}; } memorizar(f); variable a = f(1); a["z"] = 9; f(1);', '{k: 1}'),
+        ):
+            env: Environment = Environment()
+            self.assertEqual(self._evaluate(source, env).inspect(), expected)
+            cache = cast(Function, env['f']).memo
+            assert cache is not None
+            self.assertEqual(len(cache), 0)
+
+    def test_immutable_results_are_cached(self) -> None:
+        env: Environment = Environment()
+        evaluated = self._evaluate('metodo f(n){ regresa inmutable([n, "a"]); } memorizar(f); f(1); f(1);', env)
+
+        self.assertEqual(evaluated.inspect(), 'inmutable([1, a])')
+        cache = cast(Function, env['f']).memo
+        assert cache is not None
+        self.assertEqual(cache.hits, 1)
+
+    def test_memo_key(self) -> None:
+        self.assertEqual(memo.memo_key([Integer(1), String('a')]), memo.memo_key([Integer(1), String('a')]))
+        self.assertNotEqual(memo.memo_key([Integer(1)]), memo.memo_key([String('1')]))
+        function = self._evaluate('procedimiento(x){ x };', Environment())
+        self.assertIsNone(memo.memo_key([function]))
+
+    def _evaluate(self, source: str, env: Environment) -> Object:
+        program: Program = Parser(Lexer(source)).parse_program()
+        evaluated = evaluate(program, env)
+        assert evaluated is not None
+        return evaluated
+
+    def _test_integer_object(self, evaluated: Object, expected: int) -> None:
+        self.assertIsInstance(evaluated, Integer)
+        self.assertEqual(cast(Integer, evaluated).value, expected)
@@ -0,0 +1,105 @@
+from unittest import TestCase
+
+from kp import Interpreter
+from kp.memory import (
+    ENVIRONMENT,
+    INTEGER,
+    STRING,
+    MemoryMeter,
+    report,
+)
+
+_CONCATENATION = '''
+    variable texto = "";
+    para i en rango(veces) { texto = texto + $"linea numero {i}\\n"; }
+    longitud(texto);
+'''
+
+#Cada llamada a envolver deja su entorno vivo dentro de la funcion que devuelve
+_CLOSURES = '''
+    metodo envolver(anterior) {
+        regresa procedimiento() { anterior; };
+    }
+    variable cadena = procedimiento() { 0; };
+    para i en rango(veces) { cadena = envolver(cadena); }
+'''
+
+class MemoryTest(TestCase):
+
+    def test_string_peak_counts_a_growing_text_once(self) -> None:
+        result = Interpreter(max_memory=2 ** 30).execute(_CONCATENATION, bindings={'veces': 20_000})
+
+        assert result.memory is not None
+        length = result.to_python()
+        self.assertGreaterEqual(result.memory.peaks[STRING], length)
+        self.assertLess(result.memory.peaks[STRING], length * 1.1)
+        self.assertGreaterEqual(result.memory.peak, result.memory.peaks[STRING])
+
+    def test_memory_limit(self) -> None:
+        interpreter = Interpreter(max_memory=100_000)
+        program = interpreter.compile(_CONCATENATION)
+
+        self.assertEqual(interpreter.run(program, bindings={'veces': 1_000}).to_python(), 17890)
+        self.assertEqual(interpreter.run(program, bindings={'veces': 10_000}).error,
+                         'Poseemos un problema, el programa supero el limite de 100000 bytes de memoria')
+
+    def test_released_values_are_not_counted(self) -> None:
+        source = '''
+            metodo informe(n) {
+                variable texto = "";
+                para i en rango(n) { texto = texto + $"fila {i}\\n"; }
+                longitud(texto);
+            }
+            variable total = 0;
+            para i en rango(50) { total = total + informe(2000); }
+            total;
+        '''
+        result = Interpreter(max_memory=50_000).execute(source)
+
+        assert result.memory is not None
+        self.assertEqual(result.to_python(), 50 * 20890)
+        self.assertLess(result.memory.peak, 30_000)
+        self.assertEqual(result.memory.used, 0)
+
+    def test_older_versions_of_a_text_stay_counted(self) -> None:
+        source = '''
+            variable textos = [];
+            para i en rango(200) {
+                variable s = parsearAtexto(i) + grande;
+                variable t = s + "y";
+                anexar(textos, s);
+            }
+            longitud(textos);
+        '''
+        result = Interpreter(max_memory=1_000_000).execute(source, bindings={'grande': 'x' * 100_000})
+
+        assert result.memory is not None
+        self.assertEqual(result.error, 'Poseemos un problema, el programa supero el limite de 1000000 bytes de memoria')
+        self.assertGreater(result.memory.peaks[STRING], 1_000_000)
+
+    def test_environment_frames(self) -> None:
+        interpreter = Interpreter(max_memory=200_000)
+        program = interpreter.compile(_CLOSURES)
+
+        kept = interpreter.run(program, bindings={'veces': 100}, memory=MemoryMeter())
+        stopped = interpreter.run(program, bindings={'veces': 100_000})
+
+        assert kept.memory is not None
+        self.assertTrue(kept.ok)
+        self.assertEqual(kept.memory.peaks[STRING], 0)
+        self.assertGreater(kept.memory.peaks[ENVIRONMENT], 0)
+        self.assertEqual(stopped.error, 'Poseemos un problema, el programa supero el limite de 200000 bytes de memoria')
+
+    def test_big_integers(self) -> None:
+        meter = MemoryMeter()
+        result = Interpreter().run(Interpreter().compile('variable grande = 7 ** 20000; grande % 10;'), memory=meter)
+
+        self.assertEqual(result.to_python(), pow(7, 20000, 10))
+        self.assertGreater(meter.peaks[INTEGER], 7000)
+        self.assertIn('INTEGER', report(meter))
+
+    def test_without_meter(self) -> None:
+        result = Interpreter().execute(_CONCATENATION, bindings={'veces': 100})
+
+        self.assertIsNone(result.memory)
+        self.assertEqual(result.to_python(), 1690)
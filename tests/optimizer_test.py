@@ -0,0 +1,186 @@
+from unittest import TestCase
+from typing import (List,cast,Tuple)
+
+from kp.ast import (
+    If,
+    Block,
+    Infix,
+    Integer,
+    Program,
+    StringLiteral,
+    ExpressionStatement,
+)
+from kp.evaluator import evaluate
+from kp.lexer import Lexer
+from kp.object import (
+    Object,
+    Environment,
+)
+from kp.optimizer import Optimizer
+from kp.parser import Parser
+
+class OptimizerTest(TestCase):
+
+    def test_constant_folding(self) -> None:
+        test: List[Tuple[str, str]] = [
+            ('60 * 60 * 24;', '86400'),
+            ('-7 ** 5;', '-16807'),
+            ('5 / 2;', '2.5'),
+            ('2.5 * 2;', '5.0'),
+            ('1 < 2;', 'verdadero'),
+            ('!verdadero;', 'falso'),
+            ('"Hola " + "mundo";', 'Hola mundo'),
+            ('"numero " + 2 * 3;', 'numero 6'),
+            ('falso y x;', 'falso'),
+            ('verdadero o x;', 'verdadero'),
+            ('1 < 2 && 2 > 3;', 'falso'),
+            ('$"{2 * 3} y {verdadero}";', '6 y verdadero'),
+        ]
+        for source, expected in test:
+            program = self._optimize(source)
+            self.assertEqual(len(program.statements), 1)
+            statement = cast(ExpressionStatement, program.statements[0])
+            self.assertEqual(cast(StringLiteral, statement.expression).token_literal(), expected)
+
+    def test_runtime_errors_are_not_folded(self) -> None:
+        for source in ['1 / 0;', '5 + verdadero;', '"a" - "b";']:
+            program = self._optimize(source)
+            statement = cast(ExpressionStatement, program.statements[0])
+            self.assertIsInstance(statement.expression, Infix)
+
+    def test_branch_pruning(self) -> None:
+        program = self._optimize('si (verdadero) { 10; } si_no { 20; }')
+        statement = cast(ExpressionStatement, program.statements[0])
+        self.assertEqual(cast(Integer, statement.expression).value, 10)
+
+        program = self._optimize('variable x = si (1 > 2) { 10; } si_no { 20; };')
+        self.assertEqual(str(program), 'variable x = 20;')
+
+        program = self._optimize('variable x = 1; si (falso) { x = 2; } x;')
+        self.assertEqual(len(program.statements), 2)
+
+        program = self._optimize('si (x > 2) { 10; }')
+        statement = cast(ExpressionStatement, program.statements[0])
+        self.assertIsInstance(statement.expression, If)
+
+    def test_dead_code_elimination(self) -> None:
+        program = self._optimize('regresa 10; 9; 8;')
+        self.assertEqual(len(program.statements), 1)
+
+        program = self._optimize('''
+            metodo f(x){
+                si (verdadero) { regresa x; }
+                imprimir("nunca");
+            }
+        ''')
+        function = cast(ExpressionStatement, program.statements[0]).expression
+        body = cast(Block, getattr(function, 'body'))
+        self.assertEqual(len(body.statements), 1)
+
+    def test_removed_nodes(self) -> None:
+        optimizer = Optimizer()
+        lexer: Lexer = Lexer('60 * 60 * 24; regresa 1; 2;')
+        program: Program = Parser(lexer).parse_program()
+        optimizer.optimize(program)
+        self.assertEqual(optimizer.removed, 6)
+
+    def test_same_result_as_unoptimized(self) -> None:
+        test: List[str] = [
+            'variable a = 2 ** 10; a - 24;',
+            '''
+                metodo factorial(n){
+                    si (n == 1) { regresa 1; }
+                    regresa n * factorial(n - 1);
+                    regresa 0;
+                }
+                factorial(3 + 2);
+            ''',
+            'variable x = 5; si (2 > 1) { x = x * 3; } x;',
+            'si (verdadero) { regresa "a" + 1; } regresa "b";',
+            'variable t = 0; para i en rango(2 * 5) { si (1 > 2) { t = 0; } t = t + i * 2; } t;',
+            'variable n = 0; mientras (n < 3 * 3) { n = n + 1; regresa n; n = 100; }',
+            'variable x = 4; $"{1 + 1} por {x} = {2 * x}";',
+        ]
+        for source in test:
+            expected = self._evaluate(Parser(Lexer(source)).parse_program())
+            optimized = self._evaluate(self._optimize(source))
+            self.assertEqual(optimized.inspect(), expected.inspect())
+
+    def test_inlining(self) -> None:
+        test: List[Tuple[str, int]] = [
+            ('metodo doble(x){ regresa 2 * x; } variable a = 4; doble(a);', 1),
+            ('variable doble = procedimiento(x){ x * 2 }; doble(3) + doble(4);', 2),
+            ('procedimiento(x){ x + 1 }(4);', 1),
+            ('''
+                metodo cifras(i){
+                    si (i == 1){ regresa "cifra"; }
+                    si_no { regresa "cifras"; }
+                }
+                cifras(longitud("abc"));
+            ''', 1),
+            ('''
+                metodo suma(x, y){ variable s = x + y; regresa s; }
+                suma(1, suma(2, 3));
+            ''', 2),
+            ('metodo f(n){ si (n == 0) { regresa 0; } regresa f(n - 1); } f(3);', 0),
+            ('metodo f(x){ regresa x; } f = 5; f(1);', 0),
+            ('metodo f(x){ x = x + 1; regresa x; } f(1);', 0),
+            ('f(1); metodo f(x){ regresa x; }', 0),
+            ('''
+                variable base = 10;
+                metodo sumar(x){ regresa x + base; }
+                metodo g(base){ regresa sumar(base); }
+            ''', 0),
+            ('metodo f(x){ regresa x * x * x * x * x * x * x * x * x * x; } f(2);', 0),
+            ('metodo f(x){ para i en rango(x) { imprimir(i); } regresa x; } f(2);', 0),
+        ]
+        for source, expected in test:
+            optimizer = Optimizer(inline_size=20)
+            program = optimizer.optimize(Parser(Lexer(source)).parse_program())
+            self.assertEqual(optimizer.inlined, expected, source)
+
+    def test_inlining_keeps_semantics(self) -> None:
+        test: List[str] = [
+            '''
+                variable numero = "123";
+                metodo cifras(i){
+                    si (i == 1){ regresa "El numero " + numero + " tiene " + i + " cifra"; }
+                    si_no { regresa "El numero " + numero + " tiene " + i + " cifras"; }
+                }
+                cifras(longitud(numero));
+            ''',
+            '''
+                variable s = 100;
+                metodo suma(x, y){ variable s = x + y; regresa s; }
+                suma(1, 2) + s;
+            ''',
+            '''
+                variable x = 7;
+                metodo doble(x){ regresa x * 2; }
+                metodo g(y){ regresa doble(y + x); }
+                g(1);
+            ''',
+            '''
+                metodo signo(n){
+                    si (n > 0){ regresa 1; }
+                    si_no si (n < 0){ regresa -1; }
+                }
+                signo(-5) + signo(5);
+            ''',
+        ]
+        for source in test:
+            expected = self._evaluate(Parser(Lexer(source)).parse_program())
+            program = Optimizer(inline_size=40).optimize(Parser(Lexer(source)).parse_program())
+            self.assertEqual(self._evaluate(program).inspect(), expected.inspect())
+
+    def _optimize(self, source: str) -> Program:
+        lexer: Lexer = Lexer(source)
+        parser: Parser = Parser(lexer)
+        program: Program = parser.parse_program()
+        self.assertEqual(parser.errors, [])
+        return Optimizer().optimize(program)
+
+    def _evaluate(self, program: Program) -> Object:
+        evaluated = evaluate(program, Environment())
+        assert evaluated is not None
+        return evaluated
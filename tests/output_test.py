@@ -0,0 +1,58 @@
+from io import StringIO
+from unittest import TestCase
+from unittest.mock import patch
+
+import kp.context as context
+from kp.evaluator import evaluate
+from kp.lexer import Lexer
+from kp.object import Environment
+from kp.output import (
+    CaptureSink,
+    NullSink,
+    StreamSink,
+)
+from kp.parser import Parser
+
+class OutputTest(TestCase):
+
+    def tearDown(self) -> None:
+        context.configure(sink=StreamSink())
+
+    def test_capture_sink(self) -> None:
+        sink = CaptureSink()
+        context.configure(sink=sink)
+        self._evaluate('para i en rango(3) { imprimir(i); } imprimir([1, "a"]);')
+        self.assertEqual(sink.lines(), ['0', '1', '2', '[1, a]'])
+
+    def test_stream_sink_writes_by_blocks(self) -> None:
+        stream = StringIO()
+        context.configure(sink=StreamSink(stream, buffer_size=10))
+        self._evaluate('imprimir("abc"); imprimir("def");')
+        self.assertEqual(stream.getvalue(), '')
+        self._evaluate('imprimir("ghij");')
+        self.assertEqual(stream.getvalue(), 'abc\ndef\nghij\n')
+        self._evaluate('imprimir("k");')
+        context.flush()
+        self.assertEqual(stream.getvalue(), 'abc\ndef\nghij\nk\n')
+
+    def test_line_sink(self) -> None:
+        stream = StringIO()
+        context.configure(sink=StreamSink(stream, buffer_size=0))
+        self._evaluate('imprimir(1);')
+        self.assertEqual(stream.getvalue(), '1\n')
+
+    def test_recibir_flushes_before_asking(self) -> None:
+        stream = StringIO()
+        context.configure(sink=StreamSink(stream))
+        written = []
+        with patch('builtins.input', lambda prompt: written.append(stream.getvalue()) or '5'):
+            self._evaluate('imprimir("antes"); recibir("numero: ");')
+        self.assertEqual(written, ['antes\n'])
+
+    def test_null_sink(self) -> None:
+        context.configure(sink=NullSink())
+        self._evaluate('imprimir("nada");')
+        context.flush()
+
+    def _evaluate(self, source: str) -> None:
+        evaluate(Parser(Lexer(source)).parse_program(), Environment())
@@ -10,7 +10,9 @@ from kp.ast import (
     Call,
     Float,
     Block,
+    Index,
     Infix,
+    Slice,
     Prefix,
     Lambda,
     Boolean,
@@ -19,8 +21,13 @@ from kp.ast import (
     Function,
     Identifier,
     Expression,
+    ListLiteral,
+    DictionaryLiteral,
+    ForStatement,
     LetStatement,
     StringLiteral,
+    TemplateLiteral,
+    WhileStatement,
     ReturnStatement,
     ExpressionStatement,
 )
@@ -318,6 +325,13 @@ class ParserTest(TestCase):
             ('a+ suma(b*c)+d;', '((a + suma((b * c))) + d)',1),
             ('suma(a, b, 1, 2 * 3, 4+5, suma(6,7*8));', 'suma(a, b, 1, (2 * 3), (4 + 5), suma(6, (7 * 8)))',1),
             ('suma(a + b + c * d / f + g);', 'suma((((a + b) + ((c * d) / f)) + g))',1),
+            ('a < b y b < c o d;', '(((a < b) y (b < c)) o d)',1),
+            ('a || b && c == d;', '(a || (b && (c == d)))',1),
+            ('x = a y !b;', '(x = (a y (!b)))',1),
+            ('suma(x, y) o y;', '(suma(x, y) o y)',1),
+            ('a * [1, 2, 3, 4][b * c] * d', '((a * ([1, 2, 3, 4][(b * c)])) * d)',1),
+            ('suma(a * b[2], b[1], 2 * [1, 2][1])', 'suma((a * (b[2])), (b[1]), (2 * ([1, 2][1])))',1),
+            ('-a[1:n - 1]', '(-(a[1:(n - 1)]))',1),
         ]
         for source, expected_result, expected_statements_count in test_sources:
             lexer: Lexer = Lexer(source)
@@ -326,6 +340,19 @@ class ParserTest(TestCase):
             self._test_program_statements(parser,program,expected_statements_count)
             self.assertEquals(str(program),expected_result)
 
+    def test_logical_keywords_as_names(self) -> None:
+        test_sources: List[Tuple[str, str, int]] = [
+            ('si (verdadero) { imprimir(1); } y = 2;', 'si verdadero imprimir(1)(y = 2)', 2),
+            ('si (a) { b } si_no { c } o(1);', 'si a bsi_no co(1)', 2),
+            ('x\ny = 2', 'x(y = 2)', 2),
+            ('x y y', '(x y y)', 1),
+        ]
+        for source, expected_result, expected_statements_count in test_sources:
+            parser: Parser = Parser(Lexer(source))
+            program: Program = parser.parse_program()
+            self._test_program_statements(parser, program, expected_statements_count)
+            self.assertEqual(str(program), expected_result)
+
     def test_if_expression(self) -> None:
             source: str = 'si (x < y) { z }'
             lexer: Lexer = Lexer(source) 
@@ -561,6 +588,158 @@ class ParserTest(TestCase):
         self.assertIsInstance(string_literal, StringLiteral)
         self.assertEquals(string_literal.value, 'hello world!')
 
+    def test_while_statement(self) -> None:
+        source: str = 'mientras (x < 10) { x = x + 1; };'
+        lexer: Lexer = Lexer(source)
+        parser: Parser = Parser(lexer)
+        program: Program = parser.parse_program()
+
+        self.assertEqual(parser.errors, [])
+        self.assertEqual(len(program.statements), 1)
+        while_statement = cast(WhileStatement, program.statements[0])
+        self.assertIsInstance(while_statement, WhileStatement)
+
+        assert while_statement.condition is not None and while_statement.body is not None
+        self._test_infix_expression(while_statement.condition, 'x', '<', 10)
+        self.assertEqual(len(while_statement.body.statements), 1)
+        self.assertEqual(str(while_statement), 'mientras (x < 10) (x = (x + 1))')
+
+    def test_for_statement(self) -> None:
+        source: str = 'para i en rango(0, 10, 2) { imprimir(i); } i;'
+        lexer: Lexer = Lexer(source)
+        parser: Parser = Parser(lexer)
+        program: Program = parser.parse_program()
+
+        self.assertEqual(parser.errors, [])
+        self.assertEqual(len(program.statements), 2)
+        for_statement = cast(ForStatement, program.statements[0])
+        self.assertIsInstance(for_statement, ForStatement)
+
+        assert for_statement.variable is not None and for_statement.iterable is not None
+        self._test_identifier(for_statement.variable, 'i')
+        self.assertIsInstance(for_statement.iterable, Call)
+        self.assertEqual(str(for_statement.iterable), 'rango(0, 10, 2)')
+        assert for_statement.body is not None
+        self.assertEqual(len(for_statement.body.statements), 1)
+
+    def test_en_is_a_name_outside_loops(self) -> None:
+        source: str = 'variable en = 1; para en en [en] { imprimir(en); }'
+        parser: Parser = Parser(Lexer(source))
+        program: Program = parser.parse_program()
+
+        self.assertEqual(parser.errors, [])
+        self.assertEqual(len(program.statements), 2)
+        self.assertEqual(str(program.statements[0]), 'variable en = 1;')
+        for_statement = cast(ForStatement, program.statements[1])
+        assert for_statement.variable is not None and for_statement.iterable is not None
+        self._test_identifier(for_statement.variable, 'en')
+        self.assertEqual(str(for_statement.iterable), '[en]')
+
+    def test_loop_parse_errors(self) -> None:
+        for source in ['mientras x < 10 { x; }', 'para i rango(3) { i; }', 'para 1 en rango(3) { 1; }',
+                       'para i o rango(3) { i; }']:
+            parser: Parser = Parser(Lexer(source))
+            parser.parse_program()
+            self.assertNotEqual(parser.errors, [], source)
+
+    def test_list_literal(self) -> None:
+        source: str = '[1, 2 * 2, 3 + 3]'
+        lexer: Lexer = Lexer(source)
+        parser: Parser = Parser(lexer)
+        program: Program = parser.parse_program()
+        self._test_program_statements(parser, program)
+
+        list_literal = cast(ListLiteral, cast(ExpressionStatement, program.statements[0]).expression)
+        self.assertIsInstance(list_literal, ListLiteral)
+        assert list_literal.elements is not None
+        self.assertEqual(len(list_literal.elements), 3)
+        self._test_integer(list_literal.elements[0], 1)
+        self._test_infix_expression(list_literal.elements[1], 2, '*', 2)
+        self._test_infix_expression(list_literal.elements[2], 3, '+', 3)
+
+    def test_index_and_slice_expressions(self) -> None:
+        source: str = 'lista[1 + 1]; lista[1:]; lista[:];'
+        lexer: Lexer = Lexer(source)
+        parser: Parser = Parser(lexer)
+        program: Program = parser.parse_program()
+        self._test_program_statements(parser, program, 3)
+
+        index = cast(Index, cast(ExpressionStatement, program.statements[0]).expression)
+        self.assertIsInstance(index, Index)
+        self._test_identifier(index.left, 'lista')
+        assert index.index is not None
+        self._test_infix_expression(index.index, 1, '+', 1)
+
+        piece = cast(Slice, cast(ExpressionStatement, program.statements[1]).expression)
+        self.assertIsInstance(piece, Slice)
+        assert piece.start is not None
+        self._test_integer(piece.start, 1)
+        self.assertIsNone(piece.end)
+
+        piece = cast(Slice, cast(ExpressionStatement, program.statements[2]).expression)
+        self.assertIsNone(piece.start)
+        self.assertIsNone(piece.end)
+
+    def test_dictionary_literal(self) -> None:
+        source: str = '{"uno": 1, "dos": 2 * 3, 3: verdadero}'
+        lexer: Lexer = Lexer(source)
+        parser: Parser = Parser(lexer)
+        program: Program = parser.parse_program()
+        self._test_program_statements(parser, program)
+
+        dictionary = cast(DictionaryLiteral, cast(ExpressionStatement, program.statements[0]).expression)
+        self.assertIsInstance(dictionary, DictionaryLiteral)
+        self.assertEqual(len(dictionary.keys), 3)
+        self.assertEqual([str(key) for key in dictionary.keys], ['"uno"', '"dos"', '3'])
+        self._test_integer(dictionary.values[0], 1)
+        self._test_infix_expression(dictionary.values[1], 2, '*', 3)
+        self._test_boolean(dictionary.values[2], True)
+
+        for source in ['{}', '{1: 2,}']:
+            parser = Parser(Lexer(source))
+            program = parser.parse_program()
+            self._test_program_statements(parser, program)
+
+        for source in ['{1 2}', '{1: 2', '{1: 2 3: 4}']:
+            parser = Parser(Lexer(source))
+            parser.parse_program()
+            self.assertNotEqual(parser.errors, [], source)
+
+    def test_template_literal(self) -> None:
+        source: str = '$"El numero {numero} tiene {i + 1} cifras";'
+        lexer: Lexer = Lexer(source)
+        parser: Parser = Parser(lexer)
+        program: Program = parser.parse_program()
+        self._test_program_statements(parser, program)
+
+        template = cast(TemplateLiteral, cast(ExpressionStatement, program.statements[0]).expression)
+        self.assertIsInstance(template, TemplateLiteral)
+        self.assertEqual(template.strings, ['El numero ', ' tiene ', ' cifras'])
+        self._test_identifier(template.expressions[0], 'numero')
+        self._test_infix_expression(template.expressions[1], 'i', '+', 1)
+        self.assertEqual(str(program), '$"El numero {numero} tiene {(i + 1)} cifras"')
+
+        parser = Parser(Lexer('$"{{llaves}}";'))
+        program = parser.parse_program()
+        self._test_program_statements(parser, program)
+        string_literal = cast(StringLiteral, cast(ExpressionStatement, program.statements[0]).expression)
+        self.assertIsInstance(string_literal, StringLiteral)
+        self.assertEqual(string_literal.value, '{llaves}')
+
+        for source in ['$"{}"', '$"{1 +}"', '$"{abierta"', '$"{variable x = 1;}"']:
+            parser = Parser(Lexer(source))
+            parser.parse_program()
+            self.assertNotEqual(parser.errors, [], source)
+
+    def test_strings_with_braces_are_not_templates(self) -> None:
+        for source, expected in [('"{";', '{'), ('"}";', '}'), ('"a {b} c";', 'a {b} c'), ('"{{}}";', '{{}}')]:
+            parser = Parser(Lexer(source))
+            program = parser.parse_program()
+            self._test_program_statements(parser, program)
+            string_literal = cast(StringLiteral, cast(ExpressionStatement, program.statements[0]).expression)
+            self.assertIsInstance(string_literal, StringLiteral)
+            self.assertEqual(string_literal.value, expected)
+
 #######################AUXILIAR FUNCTIONS###########################################
     def _test_infix_expression(self, expression: Expression,
                                 expected_left: Any,
@@ -0,0 +1,111 @@
+from random import Random
+from unittest import TestCase
+from typing import (Any,Dict,List)
+
+from kp.persistent import (
+    EMPTY_MAP,
+    EMPTY_VECTOR,
+    PersistentMap,
+    PersistentVector,
+)
+
+#Clave con un hash elegido, para forzar colisiones en el mapa
+class _CollidingKey:
+
+    def __init__(self, value: int, key_hash: int) -> None:
+        self.value = value
+        self.key_hash = key_hash
+
+    def __hash__(self) -> int:
+        return self.key_hash
+
+    def __eq__(self, other: object) -> bool:
+        return type(other) == _CollidingKey and self.value == getattr(other, 'value')
+
+class PersistentTest(TestCase):
+
+    def test_vector_append_and_get(self) -> None:
+        vector = EMPTY_VECTOR
+        for i in range(2000):
+            vector = vector.append(i)
+        self.assertEqual(len(vector), 2000)
+        self.assertEqual(list(vector), list(range(2000)))
+        self.assertEqual([vector.get(i) for i in (0, 31, 32, 1023, 1024, 1999)], [0, 31, 32, 1023, 1024, 1999])
+        self.assertRaises(IndexError, vector.get, 2000)
+
+    def test_vector_versions_share_structure(self) -> None:
+        old = PersistentVector.from_iterable(range(1500))
+        new = old.set(10, 'x').set(1499, 'y').append('z')
+
+        self.assertEqual(old.get(10), 10)
+        self.assertEqual(old.get(1499), 1499)
+        self.assertEqual(len(old), 1500)
+        self.assertEqual((new.get(10), new.get(1499), new.get(1500)), ('x', 'y', 'z'))
+        #Solo se copian los nodos del camino hacia el elemento cambiado
+        self.assertIs(_leaf(old, 500), _leaf(new, 500))
+        self.assertIsNot(_leaf(old, 10), _leaf(new, 10))
+
+    def test_transient_vector(self) -> None:
+        base = PersistentVector.from_iterable(range(100))
+        transient = base.transient()
+        for i in range(100, 5000):
+            transient.append(i)
+        transient.set(5, 'cinco')
+        vector = transient.persistent()
+
+        self.assertEqual(len(vector), 5000)
+        self.assertEqual(vector.get(5), 'cinco')
+        self.assertEqual(vector.get(4999), 4999)
+        self.assertEqual(base.get(5), 5)
+        self.assertEqual(len(base), 100)
+        self.assertRaises(RuntimeError, transient.append, 1)
+
+    def test_map_against_dict(self) -> None:
+        random = Random(7)
+        persistent_map = EMPTY_MAP
+        expected: Dict[Any, int] = {}
+        versions: List[Any] = []
+        for i in range(5000):
+            key: Any = random.choice([
+                random.randrange(1000),
+                f'k{random.randrange(1000)}',
+                _CollidingKey(random.randrange(50), random.randrange(3)),
+            ])
+            if random.random() < 0.7:
+                persistent_map = persistent_map.set(key, i)
+                expected[key] = i
+            else:
+                persistent_map = persistent_map.delete(key)
+                expected.pop(key, None)
+            if i % 1000 == 0:
+                versions.append((persistent_map, dict(expected)))
+
+        self.assertEqual(len(persistent_map), len(expected))
+        self.assertEqual(dict(persistent_map.items()), expected)
+        for version, contents in versions:
+            self.assertEqual(dict(version.items()), contents)
+
+    def test_transient_map(self) -> None:
+        base = PersistentMap.from_pairs((i, i) for i in range(100))
+        transient = base.transient()
+        for i in range(50, 3000):
+            transient.set(i, -i)
+        transient.delete(0)
+        result = transient.persistent()
+
+        self.assertEqual(len(result), 2999)
+        self.assertEqual(result.get(60), -60)
+        self.assertNotIn(0, result)
+        self.assertEqual(base.get(60), 60)
+        self.assertIn(0, base)
+        self.assertRaises(RuntimeError, transient.set, 1, 1)
+
+    def test_equality(self) -> None:
+        self.assertEqual(PersistentVector.from_iterable([1, 2]), EMPTY_VECTOR.append(1).append(2))
+        self.assertNotEqual(PersistentVector.from_iterable([1, 2]), PersistentVector.from_iterable([2, 1]))
+        self.assertEqual(PersistentMap.from_pairs([(1, 'a'), (2, 'b')]), EMPTY_MAP.set(2, 'b').set(1, 'a'))
+        self.assertNotEqual(EMPTY_MAP.set(1, 'a'), EMPTY_MAP.set(1, 'b'))
+
+def _leaf(vector: PersistentVector, index: int) -> List[Any]:
+    from kp.persistent import _leaf_for
+    return _leaf_for(getattr(vector, '_root'), getattr(vector, '_shift'), index)
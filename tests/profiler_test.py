@@ -0,0 +1,89 @@
+import os
+import pstats
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+import kp.evaluator as evaluator
+import kp.profiler as profiler
+from kp import Interpreter
+from kp.profiler import Profiler
+
+_PROGRAM = '''
+    metodo fib(n) {
+        si (n < 2) { regresa n; }
+        regresa fib(n - 1) + fib(n - 2);
+    }
+    variable doble = procedimiento(x) { x * 2; };
+    variable numeros = [1, 2, 3, 4];
+    mapa(numeros, doble);
+    mapa(numeros, procedimiento(x) { x + 1; });
+    escalar(fib(10));
+'''
+
+def escalar(x: int) -> int:
+    return x * 10
+
+class ProfilerTest(TestCase):
+
+    def setUp(self) -> None:
+        self.interpreter = Interpreter(bindings={'escalar': escalar})
+        self.profiler = Profiler()
+        self.result = self.interpreter.execute(_PROGRAM, profiler=self.profiler)
+
+    def test_counts_calls_by_name(self) -> None:
+        stats = self.profiler.stats
+
+        self.assertEqual(self.result.to_python(), 550)
+        self.assertEqual(stats['fib'].calls, 177)
+        self.assertEqual(stats['fib'].primitive_calls, 1)
+        self.assertEqual(stats['fib'].max_depth, 10)
+        self.assertEqual(stats['doble'].calls, 4)
+        self.assertEqual(stats['<procedimiento>'].calls, 4)
+        self.assertEqual(stats['mapa'].calls, 2)
+        self.assertEqual(stats['escalar'].calls, 1)
+        self.assertEqual(stats['doble'].callers, {'mapa': 4})
+
+    def test_inclusive_and_exclusive_time(self) -> None:
+        mapa = self.profiler.stats['mapa']
+        children = self.profiler.stats['doble'].inclusive + self.profiler.stats['<procedimiento>'].inclusive
+
+        self.assertGreater(mapa.inclusive, children)
+        self.assertAlmostEqual(mapa.exclusive, mapa.inclusive - children, places=6)
+        for stats in self.profiler.stats.values():
+            self.assertLessEqual(stats.exclusive, stats.inclusive + 1e-9)
+
+    def test_table_is_sorted_by_exclusive_time(self) -> None:
+        lines = self.profiler.table().splitlines()
+
+        self.assertIn('llamadas', lines[0])
+        self.assertEqual(len(lines), len(self.profiler.stats) + 1)
+        names = [line.split()[-1] for line in lines[1:]]
+        times = [self.profiler.stats[name].exclusive for name in names]
+        self.assertEqual(times, sorted(times, reverse=True))
+
+    def test_pstats_and_callgrind_output(self) -> None:
+        with TemporaryDirectory() as directory:
+            stats_path = os.path.join(directory, 'kinp.prof')
+            callgrind_path = os.path.join(directory, 'callgrind.out.kinp')
+            self.profiler.save(stats_path, 'programa.kp')
+            self.profiler.save(callgrind_path, 'programa.kp')
+
+            stats = pstats.Stats(stats_path).stats  # type: ignore
+            with open(callgrind_path, encoding='utf-8') as file:
+                callgrind = file.read()
+
+        self.assertEqual(stats[('programa.kp', 0, 'fib')][:2], (1, 177))
+        self.assertIn('fn=mapa\n', callgrind)
+        self.assertIn('cfn=doble\ncalls=4 0\n', callgrind)
+
+    def test_evaluator_is_restored_after_the_run(self) -> None:
+        self.assertIs(evaluator._apply_function, profiler._apply_function)
+
+        result = self.interpreter.execute(_PROGRAM)
+        self.assertEqual(result.to_python(), 550)
+        self.assertEqual(self.profiler.stats['fib'].calls, 177)
+
+    def test_profiler_accumulates_runs(self) -> None:
+        self.interpreter.execute(_PROGRAM, profiler=self.profiler)
+
+        self.assertEqual(self.profiler.stats['fib'].calls, 354)
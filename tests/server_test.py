@@ -0,0 +1,150 @@
+import asyncio
+import json
+import os
+import signal
+from tempfile import TemporaryDirectory
+from threading import (Event, Thread, current_thread)
+from time import (perf_counter, sleep)
+from typing import cast
+from unittest import TestCase
+
+from kp.interpreter import Program
+from kp.server import (
+    Client,
+    Server,
+    program_id,
+    serve,
+)
+
+class ServerTest(TestCase):
+
+    def setUp(self) -> None:
+        self.directory = TemporaryDirectory()
+        self.address = os.path.join(self.directory.name, 'kinp.sock')
+        self.server = Server(workers=2, max_queue=1, timeout=2)
+        self.server.start_workers()
+        ready = Event()
+        self.thread = Thread(target=self._serve, args=(ready,))
+        self.thread.start()
+        ready.wait(10)
+
+    def tearDown(self) -> None:
+        self.loop.call_soon_threadsafe(self.task.cancel)
+        self.thread.join()
+        self.server.shutdown()
+        self.directory.cleanup()
+
+    def _serve(self, ready: Event) -> None:
+        async def main() -> None:
+            self.loop = asyncio.get_running_loop()
+            self.task = cast(asyncio.Task, asyncio.current_task())
+            await serve(self.server, self.address, ready.set)
+
+        try:
+            asyncio.run(main())
+        except asyncio.CancelledError:
+            pass
+
+    def test_source_and_cached_program(self) -> None:
+        client = Client(self.address)
+        source = 'imprimir("hola " + recibir("nombre: ")); 40 + 2;'
+        output, result = client.run(source, stdin=['Ana'])
+        self.assertEqual(output, 'hola Ana\n')
+        self.assertEqual(result['estado'], 'ok')
+        self.assertEqual(result['valor'], '42')
+        self.assertEqual(result['programa'], program_id(source))
+
+        output, result = client.run(program=result['programa'], stdin=['Beto'])
+        self.assertEqual(output, 'hola Beto\n')
+        client.close()
+
+    def test_errors(self) -> None:
+        client = Client(self.address)
+        self.assertEqual(client.run(program='desconocido')[1]['estado'], 'error')
+        self.assertEqual(client.run('variable = ;')[1]['estado'], 'sintaxis')
+        self.assertEqual(client.run('variable x = y;')[1]['error'], 'Poseemos un problema, que es "y"?')
+        self.assertEqual(client.run('mientras (verdadero) { }')[1]['estado'], 'tiempo')
+        client.close()
+
+    def test_sources_compile_outside_the_event_loop(self) -> None:
+        threads = []
+        compile = self.server._interpreter.compile
+        def record(source: str) -> Program:
+            threads.append(current_thread())
+            return compile(source)
+        self.server._interpreter.compile = record  # type: ignore
+
+        client = Client(self.address)
+        self.assertEqual(client.run('1;')[1]['estado'], 'ok')
+        self.assertEqual(client.run('variable = ;')[1]['estado'], 'sintaxis')
+        client.close()
+        self.assertEqual(len(threads), 2)
+        self.assertNotIn(self.thread, threads)
+
+    def test_long_output_is_sent_in_chunks(self) -> None:
+        client = Client(self.address)
+        output, result = client.run('para i en rango(20000) { imprimir($"linea {i}"); }')
+        self.assertEqual(result['estado'], 'ok')
+        self.assertEqual(output.count('\n'), 20000)
+        client.close()
+
+    def test_output_is_streamed_while_the_program_runs(self) -> None:
+        client = Client(self.address)
+        start = perf_counter()
+        client._file.write(json.dumps({'fuente': 'imprimir("inicio"); mientras (verdadero) { }'}).encode('utf-8') + b'\n')
+        client._file.flush()
+        first = json.loads(client._file.readline())
+        arrived = perf_counter() - start
+        result = json.loads(client._file.readline())
+
+        self.assertEqual(first, {'tipo': 'salida', 'texto': 'inicio\n'})
+        self.assertLess(arrived, 1)
+        self.assertEqual(result['estado'], 'tiempo')
+        client.close()
+
+    def test_worker_crash_is_reported_and_the_pool_restarts(self) -> None:
+        client = Client(self.address)
+        self.assertEqual(client.run('1;')[1]['estado'], 'ok')
+        executor = self.server._executor
+        assert executor is not None
+        for pid in list(executor._processes):
+            os.kill(pid, signal.SIGKILL)
+        while not executor._broken:
+            sleep(0.01)
+
+        output, result = client.run('imprimir(1);')
+        self.assertEqual(result['estado'], 'fallo')
+        self.assertEqual(result['error'], 'Poseemos un problema, el proceso que corria el programa termino de forma inesperada')
+
+        output, result = client.run('imprimir(2); 3;')
+        self.assertEqual(output, '2\n')
+        self.assertEqual(result['valor'], '3')
+        client.close()
+
+    def test_request_longer_than_the_limit(self) -> None:
+        client = Client(self.address)
+        output, result = client.run('"' + 'x' * 2 ** 24 + '";')
+        self.assertEqual(output, '')
+        self.assertEqual(result['estado'], 'fallo')
+        self.assertEqual(result['error'], 'Poseemos un problema, la peticion supera el limite de 16777216 bytes')
+        client.close()
+
+        client = Client(self.address)
+        self.assertEqual(client.run('1;')[1]['estado'], 'ok')
+        client.close()
+
+    def test_queue_limit(self) -> None:
+        slow = Client(self.address)
+        fast = Client(self.address)
+        results = []
+        thread = Thread(target=lambda: results.append(slow.run('mientras (verdadero) { }')[1]))
+        thread.start()
+        while self.server.pending == 0:
+            pass
+        busy = fast.run('1;')[1]
+        thread.join()
+        self.assertEqual(busy['estado'], 'ocupado')
+        self.assertEqual(results[0]['estado'], 'tiempo')
+        self.assertEqual(fast.run('1;')[1]['estado'], 'ok')
+        slow.close()
+        fast.close()
@@ -0,0 +1,73 @@
+import threading
+from unittest import TestCase
+
+import kp.context as context
+from kp import Interpreter
+from kp.stack import (SIGNAL, THREAD, Sampler)
+
+_NESTED_ERROR = '''
+    metodo interna() { variable x = desconocido; }
+    metodo externa() { interna(); }
+    externa();
+'''
+
+_FIB = '''
+    metodo fib(n) {
+        si (n < 2) { regresa n; }
+        regresa fib(n - 1) + fib(n - 2);
+    }
+    fib(20);
+'''
+
+class StackTest(TestCase):
+
+    def setUp(self) -> None:
+        self.interpreter = Interpreter()
+
+    def test_traceback_of_nested_functions(self) -> None:
+        result = self.interpreter.execute(_NESTED_ERROR)
+
+        self.assertFalse(result.ok)
+        self.assertEqual(result.traceback.splitlines(),
+                         ['Rastreo (la llamada mas reciente al final):', '  en externa', '  en interna'])
+
+    def test_traceback_groups_recursive_calls(self) -> None:
+        interpreter = Interpreter(max_depth=30)
+        result = interpreter.execute('metodo f(n) { f(n + 1); } f(0);')
+
+        self.assertFalse(result.ok)
+        self.assertEqual(result.traceback.splitlines()[1:], ['  en f (x30)'])
+
+    def test_no_traceback_outside_functions(self) -> None:
+        self.assertEqual(self.interpreter.execute('variable x = desconocido;').traceback, '')
+        self.assertEqual(self.interpreter.execute('1 + 1;').traceback, '')
+
+    def test_stack_is_empty_after_runs(self) -> None:
+        for source in (_NESTED_ERROR, 'metodo f(n) { f(n + 1); } f(0);', _FIB):
+            self.interpreter.execute(source)
+            self.assertEqual(context.current().stack, [])
+
+    def test_thread_sampler_collapses_stacks(self) -> None:
+        sampler = Sampler(mode=THREAD)
+        result = self.interpreter.execute(_FIB, sampler=sampler)
+
+        self.assertEqual(result.to_python(), 6765)
+        self._assert_fib_samples(sampler)
+
+    def test_signal_sampler_collapses_stacks(self) -> None:
+        if threading.current_thread() is not threading.main_thread():
+            self.skipTest('las señales solo se reciben en el hilo principal')
+        sampler = Sampler(mode=SIGNAL)
+        result = self.interpreter.execute(_FIB, sampler=sampler)
+
+        self.assertEqual(result.to_python(), 6765)
+        self._assert_fib_samples(sampler)
+
+    def _assert_fib_samples(self, sampler: Sampler) -> None:
+        lines = sampler.collapsed().splitlines()
+        self.assertGreater(len(lines), 0)
+        for line in lines:
+            stack, count = line.rsplit(' ', 1)
+            self.assertTrue(stack.startswith('<programa>'))
+            self.assertTrue(all(name == 'fib' for name in stack.split(';')[1:]))
+            self.assertGreater(int(count), 0)
@@ -0,0 +1,106 @@
+from typing import (List, Optional, Tuple)
+from unittest import TestCase
+
+import kp.ast as ast
+import kp.evaluator as evaluator
+import kp.profiler as profiler
+import kp.trace as trace
+from kp import Interpreter
+from kp.object import (
+    Builtin,
+    Environment,
+    Error,
+    Function,
+    Object,
+)
+from kp.profiler import Profiler
+from kp.trace import Tracer
+
+_PROGRAM = '''
+    metodo doble(x) { x * 2; }
+    variable numeros = mapa([1, 2, 3], doble);
+    suma(numeros);
+'''
+
+class Recorder(Tracer):
+    def __init__(self) -> None:
+        self.events: List[Tuple[str, str]] = []
+        self.depth = 0
+
+    def enter(self, node: ast.ASTNode, env: Environment) -> None:
+        self.depth += 1
+
+    def exit(self, node: ast.ASTNode, result: Optional[Object]) -> None:
+        self.depth -= 1
+
+    def call(self, fn: Function, args: List[Object]) -> None:
+        self.events.append(('llamada', f'{fn.name}({", ".join(arg.inspect() for arg in args)})'))
+
+    def returned(self, fn: Function, result: Object) -> None:
+        self.events.append(('retorno', f'{fn.name} {result.inspect()}'))
+
+    def builtin(self, fn: Builtin, args: List[Object]) -> None:
+        self.events.append(('builtin', fn.fn.__name__))
+
+    def error(self, error: Error) -> None:
+        self.events.append(('error', error.message))
+
+class TraceTest(TestCase):
+
+    def setUp(self) -> None:
+        self.interpreter = Interpreter()
+        self.tracer = Recorder()
+
+    def test_calls_returns_and_builtins(self) -> None:
+        result = self.interpreter.execute(_PROGRAM, tracer=self.tracer)
+
+        self.assertEqual(result.to_python(), 12)
+        self.assertEqual(self.tracer.events, [
+            ('builtin', 'mapa'),
+            ('llamada', 'doble(1)'), ('retorno', 'doble 2'),
+            ('llamada', 'doble(2)'), ('retorno', 'doble 4'),
+            ('llamada', 'doble(3)'), ('retorno', 'doble 6'),
+            ('builtin', 'suma'),
+        ])
+
+    def test_nodes_enter_and_exit_in_pairs(self) -> None:
+        nodes: List[str] = []
+
+        class Nodes(Recorder):
+            def enter(self, node: ast.ASTNode, env: Environment) -> None:
+                super().enter(node, env)
+                nodes.append(type(node).__name__)
+
+        tracer = Nodes()
+        self.interpreter.execute(_PROGRAM, tracer=tracer)
+
+        self.assertEqual(tracer.depth, 0)
+        self.assertEqual(nodes.count('Call'), 2)
+        self.assertEqual(nodes.count('Infix'), 3)
+        self.assertEqual(nodes[:2], ['ExpressionStatement', 'Function'])
+
+    def test_error_creation(self) -> None:
+        result = self.interpreter.execute('metodo f() { desconocido; } f();', tracer=self.tracer)
+
+        self.assertFalse(result.ok)
+        self.assertEqual(self.tracer.events, [
+            ('llamada', 'f()'), ('error', result.error), ('retorno', f'f Error: {result.error}'),
+        ])
+
+    def test_evaluator_is_restored_after_the_run(self) -> None:
+        self.interpreter.execute(_PROGRAM, tracer=self.tracer)
+
+        self.assertIs(evaluator.evaluate, trace._evaluate)
+        self.assertIs(evaluator._call_function, trace._call_function)
+        self.assertIs(evaluator._apply_function, profiler._apply_function)
+
+    def test_tracing_and_profiling_together(self) -> None:
+        stats = Profiler()
+        with profiler.installed():
+            result = self.interpreter.execute(_PROGRAM, tracer=self.tracer, profiler=stats)
+            self.assertIs(evaluator._apply_function, profiler._profiled_apply)
+
+        self.assertEqual(result.to_python(), 12)
+        self.assertEqual(len(self.tracer.events), 8)
+        self.assertEqual(stats.stats['doble'].calls, 3)
+        self.assertIs(evaluator._apply_function, profiler._apply_function)
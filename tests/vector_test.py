@@ -0,0 +1,86 @@
+from unittest import TestCase
+from unittest.mock import patch
+from typing import (Any,List)
+
+import kp.vector as vector
+from kp import Interpreter
+from kp.vector import (
+    FLOAT,
+    BOOLEAN,
+    INTEGER,
+    NumericArray,
+    apply_operator,
+)
+
+_VECTOR_OVERFLOW = 'Poseemos un problema, el resultado no cabe en un vector de enteros de 64 bits'
+
+#Las pruebas corren con el modulo array y, si esta instalado, tambien con NumPy
+BACKENDS: List[Any] = [None] + ([vector.numpy] if vector.numpy is not None else [])
+
+class VectorTest(TestCase):
+
+    def test_element_wise_operations(self) -> None:
+        for backend in BACKENDS:
+            with patch.object(vector, 'numpy', backend):
+                left = NumericArray.from_values([1, 2, 3], INTEGER)
+                right = NumericArray.from_values([4, 5, 6], INTEGER)
+                self.assertEqual(list(apply_operator('+', left, right)), [5, 7, 9])
+                self.assertEqual(list(apply_operator('*', left, 2)), [2, 4, 6])
+                self.assertEqual(list(apply_operator('-', 10, left)), [9, 8, 7])
+                self.assertEqual(list(apply_operator('%', right, 4)), [0, 1, 2])
+                self.assertEqual(apply_operator('/', left, 2).kind, FLOAT)
+                self.assertEqual(list(apply_operator('**', left, -1)), [1.0, 0.5, 1 / 3])
+                self.assertEqual(list(apply_operator('+', left, 0.5)), [1.5, 2.5, 3.5])
+
+                mask = apply_operator('>=', left, 2)
+                self.assertEqual(mask.kind, BOOLEAN)
+                self.assertEqual(list(mask), [False, True, True])
+                self.assertEqual(list(right.select(mask)), [5, 6])
+
+    def test_errors(self) -> None:
+        for backend in BACKENDS:
+            with patch.object(vector, 'numpy', backend):
+                left = NumericArray.from_values([1, 2], INTEGER)
+                mask = NumericArray.from_values([True, False], BOOLEAN)
+                self.assertRaises(ZeroDivisionError, apply_operator, '/', left, 0)
+                self.assertRaises(ValueError, apply_operator, '+', left, NumericArray.from_values([1], INTEGER))
+                self.assertRaises(TypeError, apply_operator, '+', mask, 1)
+                self.assertRaises(TypeError, apply_operator, '<', mask, mask)
+                self.assertRaises(TypeError, left.set, 0, 1.5)
+                self.assertRaises(ValueError, NumericArray.from_values([], FLOAT).mean)
+
+    def test_integer_overflow_is_an_error(self) -> None:
+        big = 2 ** 62
+        for backend in BACKENDS:
+            with patch.object(vector, 'numpy', backend):
+                values = NumericArray.from_values([1, big], INTEGER)
+                self.assertRaises(OverflowError, apply_operator, '+', values, big)
+                self.assertRaises(OverflowError, apply_operator, '-', -big - 1, values)
+                self.assertRaises(OverflowError, apply_operator, '*', values, 2)
+                self.assertRaises(OverflowError, apply_operator, '*', NumericArray.from_values([-1], INTEGER), -2 ** 63)
+                self.assertRaises(OverflowError, apply_operator, '**', NumericArray.from_values([3], INTEGER), 40)
+                self.assertRaises(OverflowError, apply_operator, '**', NumericArray.from_values([2], INTEGER), 63)
+                self.assertEqual(list(apply_operator('**', NumericArray.from_values([-2], INTEGER), 63)), [-2 ** 63])
+                self.assertEqual(list(apply_operator('*', values, -1)), [-1, -big])
+                self.assertEqual(list(apply_operator('+', values, big - 1)), [big, 2 ** 63 - 1])
+                self.assertEqual(NumericArray.from_values([2 ** 63 - 1] * 4, INTEGER).total(), 4 * (2 ** 63 - 1))
+                self.assertEqual(Interpreter().execute(f'vector([1, {big}]) * 2;').error, _VECTOR_OVERFLOW)
+
+    def test_reductions(self) -> None:
+        for backend in BACKENDS:
+            with patch.object(vector, 'numpy', backend):
+                values = NumericArray.from_values(range(1, 101), INTEGER)
+                self.assertEqual(values.total(), 5050)
+                self.assertEqual(values.mean(), 50.5)
+                self.assertEqual(values.maximum(), 100)
+                self.assertEqual(values.minimum(), 1)
+                self.assertIs(type(values.total()), int)
+
+    def test_slices_are_copies(self) -> None:
+        for backend in BACKENDS:
+            with patch.object(vector, 'numpy', backend):
+                values = NumericArray.from_values([1, 2, 3], INTEGER)
+                part = values.slice(0, 2)
+                part.set(0, 9)
+                self.assertEqual(values.get(0), 1)
+                self.assertTrue(part.equals(NumericArray.from_values([9, 2], INTEGER)))